@@ -45,6 +45,8 @@ import inspect
 import os
 import re
 
+from generator_cache import GeneratedFile
+
 
 class lookup:
     def __init__(self, formatter, frame, *args, **kwargs):
@@ -171,8 +173,10 @@ class code_formatter(metaclass=code_formatter_meta):
         self._data = []
 
     def write(self, *args):
-        f = open(os.path.join(*args), "w")
-        name, extension = os.path.splitext(f.name)
+        # Only touch the file if its contents change, so the files which
+        # depend on it aren't needlessly rebuilt.
+        f = GeneratedFile(os.path.join(*args))
+        name, extension = os.path.splitext(f.path)
 
         # Add a comment to inform which file generated the generated file
         # to make it easier to backtrack and modify generated code
@@ -0,0 +1,163 @@
+# Copyright (c) 2026 The Regents of The University of California
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met: redistributions of source code must retain the above copyright
+# notice, this list of conditions and the following disclaimer;
+# redistributions in binary form must reproduce the above copyright
+# notice, this list of conditions and the following disclaimer in the
+# documentation and/or other materials provided with the distribution;
+# neither the name of the copyright holders nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+# A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+# THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""
+Support for skipping redundant work in the code generators (SLICC and the
+ISA parser).
+
+write_if_changed() and GeneratedFile only touch an output file when its
+contents change, so SCons doesn't rebuild the objects which depend on
+generated files that turned out to be identical.
+
+A GeneratorCache records, for one generator run, the digest of every file
+the run read and the list of files it generated. As long as none of the
+inputs change and all the outputs still exist, the run doesn't need to be
+repeated. File digests are only recomputed when a file's size or
+modification time differ from the recorded ones.
+"""
+
+import hashlib
+import io
+import json
+import os
+import threading
+
+
+def write_if_changed(path, data):
+    """
+    Write data (a str) to the file at path, unless the file already holds
+    exactly that data. Returns whether the file was written.
+    """
+    try:
+        with open(path) as f:
+            if f.read() == data:
+                return False
+    except (OSError, UnicodeDecodeError):
+        pass
+    with open(path, "w") as f:
+        f.write(data)
+    return True
+
+
+class GeneratedFile(io.StringIO):
+    """
+    A text file which is buffered in memory and written with
+    write_if_changed() when it is closed.
+    """
+
+    def __init__(self, path):
+        super().__init__()
+        self.path = path
+
+    def close(self):
+        if not self.closed:
+            write_if_changed(self.path, self.getvalue())
+        super().close()
+
+
+def file_digest(path):
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            h.update(block)
+    return h.hexdigest()
+
+
+class GeneratorCache:
+    """
+    The record of a generator run.
+
+    :param directory: Where the records are kept.
+    :param name: Identifies the run, e.g., the path of its main input.
+    :param config: Any other JSON-serializable setting the outputs depend
+        on. A record made with a different config is never used.
+    """
+
+    def __init__(self, directory, name, config=None):
+        self.directory = directory
+        key = hashlib.sha256(os.path.abspath(name).encode()).hexdigest()
+        self.path = os.path.join(directory, f"{key[:16]}.json")
+        self.config = config
+
+    def _stamp(self, path):
+        st = os.stat(path)
+        return [st.st_size, st.st_mtime_ns]
+
+    def lookup(self):
+        """
+        Return the outputs of the recorded run if it is still up to date,
+        or None if the generator has to run again.
+        """
+        try:
+            with open(self.path) as f:
+                record = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if record.get("config") != self.config:
+            return None
+
+        changed = False
+        try:
+            for path, entry in record["inputs"].items():
+                stamp = self._stamp(path)
+                if stamp == entry[:2]:
+                    continue
+                if file_digest(path) != entry[2]:
+                    return None
+                entry[:2] = stamp
+                changed = True
+            if not all(map(os.path.exists, record["outputs"])):
+                return None
+        except (OSError, KeyError, TypeError, ValueError):
+            return None
+
+        if changed:
+            # The inputs were touched, but not modified. Remember their new
+            # stamps so they aren't hashed again next time.
+            self._save(record)
+        return record["outputs"]
+
+    def store(self, inputs, outputs):
+        """
+        Record a run which read the given input files and generated the
+        given output files.
+        """
+        record = {
+            "config": self.config,
+            "inputs": {
+                path: self._stamp(path) + [file_digest(path)]
+                for path in sorted(set(inputs))
+            },
+            "outputs": list(outputs),
+        }
+        self._save(record)
+
+    def _save(self, record):
+        os.makedirs(self.directory, exist_ok=True)
+        tmp = f"{self.path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp, "w") as f:
+            json.dump(record, f)
+        os.replace(tmp, self.path)
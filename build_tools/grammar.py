@@ -24,7 +24,9 @@
 # (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
+import hashlib
 import os
+import threading
 
 import ply.lex
 import ply.yacc
@@ -37,6 +39,10 @@ class ParseError(Exception):
 
 
 class Grammar:
+    # Where to keep the parse tables of grammars, so they aren't rebuilt
+    # every time a parser is created. If None, PLY's defaults are used.
+    tables_dir = None
+
     def setupLexerFactory(self, **kwargs):
         if "module" in kwargs:
             raise AttributeError("module is an illegal attribute")
@@ -47,7 +53,7 @@ class Grammar:
             raise AttributeError("module is an illegal attribute")
 
         if "output" in kwargs:
-            dir, tab = os.path.split(output)
+            dir, tab = os.path.split(kwargs.pop("output"))
             if not tab.endswith(".py"):
                 raise AttributeError("The output file must end with .py")
             kwargs["outputdir"] = dir
@@ -60,6 +66,10 @@ class Grammar:
             self.lexers = []
             return self.lexers
 
+        if attr == "input_files":
+            self.input_files = []
+            return self.input_files
+
         if attr == "lex_kwargs":
             self.setupLexerFactory()
             return self.lex_kwargs
@@ -73,7 +83,7 @@ class Grammar:
             return self.lex
 
         if attr == "yacc":
-            self.yacc = ply.yacc.yacc(module=self, **self.yacc_kwargs)
+            self.yacc = self.makeParser()
             return self.yacc
 
         if attr == "current_lexer":
@@ -95,6 +105,43 @@ class Grammar:
             f"'{type(self)}' object has no attribute '{attr}'"
         )
 
+    def grammarDigest(self):
+        """A digest of everything PLY builds the parse tables from."""
+        h = hashlib.sha256()
+        for name in sorted(dir(type(self))):
+            if name.startswith("p_") and name != "p_error":
+                h.update(f"{name}:{getattr(self, name).__doc__}\n".encode())
+        for name in ("start", "tokens", "precedence"):
+            h.update(f"{name}:{getattr(self, name, None)!r}\n".encode())
+        return h.hexdigest()
+
+    def makeParser(self):
+        kwargs = self.yacc_kwargs
+        if self.tables_dir is None or any(
+            key in kwargs
+            for key in ("outputdir", "tabmodule", "write_tables", "picklefile")
+        ):
+            return ply.yacc.yacc(module=self, **kwargs)
+
+        # The tables are pickled into a file named after the grammar's
+        # digest, so a changed grammar never finds stale tables. They are
+        # written to a temporary file first, so that parsers created
+        # concurrently never see a partial file.
+        kwargs = {"debug": False, **kwargs}
+        tables = os.path.join(
+            self.tables_dir,
+            f"{type(self).__name__}-{self.grammarDigest()[:16]}.pickle",
+        )
+        if os.path.exists(tables):
+            return ply.yacc.yacc(module=self, picklefile=tables, **kwargs)
+
+        os.makedirs(self.tables_dir, exist_ok=True)
+        tmp = f"{tables}.{os.getpid()}.{threading.get_ident()}.tmp"
+        parser = ply.yacc.yacc(module=self, picklefile=tmp, **kwargs)
+        if os.path.exists(tmp):
+            os.replace(tmp, tables)
+        return parser
+
     def parse_string(self, data, source="<string>", debug=None, tracking=0):
         if not isinstance(data, str):
             raise AttributeError(
@@ -118,6 +165,7 @@ class Grammar:
     def parse_file(self, f, **kwargs):
         if isinstance(f, str):
             source = f
+            self.input_files.append(source)
             f = open(f)
         elif isinstance(f, file):
             source = f.name
@@ -0,0 +1,100 @@
+# Copyright (c) 2026 The Regents of The University of California
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met: redistributions of source code must retain the above copyright
+# notice, this list of conditions and the following disclaimer;
+# redistributions in binary form must reproduce the above copyright
+# notice, this list of conditions and the following disclaimer in the
+# documentation and/or other materials provided with the distribution;
+# neither the name of the copyright holders nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+# A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+# THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""
+Generate the name index of the m5.objects package.
+
+For every name defined at the top level of a SimObject module (classes,
+functions and assignments), the index records the module which defines
+it, so that m5.objects can import only that module when the name is first
+used. Modules are given in build order, and when several modules define a
+name the last one wins, as it does when all modules are star-imported in
+that order.
+"""
+
+import argparse
+import ast
+import os.path
+
+from code_formatter import code_formatter
+
+parser = argparse.ArgumentParser()
+parser.add_argument("index_py", help="index file path")
+parser.add_argument("modules", help="SimObject module files", nargs="*")
+
+args = parser.parse_args()
+
+
+def bound_names(target):
+    if isinstance(target, ast.Name):
+        yield target.id
+    elif isinstance(target, (ast.Tuple, ast.List)):
+        for element in target.elts:
+            yield from bound_names(element)
+
+
+def defined_names(body):
+    for node in body:
+        if isinstance(
+            node, (ast.ClassDef, ast.FunctionDef, ast.AsyncFunctionDef)
+        ):
+            yield node.name
+        elif isinstance(node, ast.Assign):
+            for target in node.targets:
+                yield from bound_names(target)
+        elif isinstance(node, (ast.AnnAssign, ast.AugAssign)):
+            yield from bound_names(node.target)
+        elif isinstance(node, ast.If):
+            yield from defined_names(node.body)
+            yield from defined_names(node.orelse)
+        elif isinstance(node, ast.Try):
+            yield from defined_names(node.body)
+            for handler in node.handlers:
+                yield from defined_names(handler.body)
+            yield from defined_names(node.orelse)
+            yield from defined_names(node.finalbody)
+        elif isinstance(node, ast.With):
+            yield from defined_names(node.body)
+
+
+index = {}
+for source in args.modules:
+    modname = os.path.splitext(os.path.basename(source))[0]
+    with open(source) as f:
+        tree = ast.parse(f.read(), source)
+    for name in defined_names(tree.body):
+        if not name.startswith("_"):
+            index[name] = modname
+
+code = code_formatter()
+code("# Maps names to the m5.objects module defining them.")
+code("index = {")
+code.indent()
+for name in sorted(index):
+    code(f"{name!r}: {index[name]!r},")
+code.dedent()
+code("}")
+code.write(args.index_py)
@@ -46,6 +46,8 @@ import m5.util
 from m5.objects import *
 from m5.objects import Cache
 
+from gem5.utils import checkpoint_store
+
 m5.util.addToPath("../../")
 
 import devices
@@ -418,6 +420,13 @@ def addOptions(parser):
         default=-1,
         help="从指令slice的checkpoint恢复"
     )
+    parser.add_argument(
+        "--dedup-slices",
+        action="store_true",
+        default=False,
+        help="Pack the memory images of slice checkpoints into a "
+        "content-addressed store (<ckpt-dir>/store) shared by all slices"
+    )
     parser.add_argument(
         "--ckpt-dir",
         type=str,
@@ -741,6 +750,15 @@ def _resolve_slice_dir(options):
             f" parent:  {parent}\n"
             f" entries: {listing}\n"
         )
+
+    # Slices saved with --dedup-slices only hold the chunk lists of their
+    # memory images, write a restorable copy of the checkpoint instead.
+    if checkpoint_store.is_packed(cdir):
+        restore_dir = os.path.join(
+            m5.options.outdir, f"restore_slice_{options.restore_slice:04d}"
+        )
+        print(f"[restore] materializing packed slice --> {restore_dir}")
+        cdir = str(checkpoint_store.materialize(cdir, restore_dir))
     return cdir
 def instantiate(options, checkpoint_dir=None):
     # 按slice保存恢复
@@ -786,6 +804,10 @@ def run(options):
 
     if options.slice_run:
         options.slice_ticks = int(_to_ticks(options.slice_ticks))
+        if options.dedup_slices:
+            store = checkpoint_store.CheckpointStore(
+                os.path.join(options.ckpt_dir, "store")
+            )
         for s in range(start_slice, options.slices):
             slice_end_tick = (s + 1) * options.slice_ticks
             now = m5.curTick()
@@ -799,6 +821,9 @@ def run(options):
                 cpt_dir = os.path.join(options.ckpt_dir, f"slice_{s:04d}")
                 print(f"[slice {s} save checkpoint --> {cpt_dir}]")
                 m5.checkpoint(cpt_dir)
+                if options.dedup_slices:
+                    total, stored = store.pack(cpt_dir)
+                    print(f"[slice {s} packed {total} chunks, {stored} new]")
 
     # start simulation (and drop checkpoints when requested)
     else:
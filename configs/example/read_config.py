@@ -55,6 +55,8 @@ import sys
 import m5
 import m5.ticks as ticks
 
+# m5.objects is lazy, load every SimObject class before listing them
+m5.objects.load_all()
 sim_object_classes_by_name = {
     cls.__name__: cls
     for cls in list(m5.objects.__dict__.values())
@@ -77,6 +77,7 @@ found an AttributeError will be raised.
     :code:`_defaults.build_dir = None` Once this module has been imported
     constants should not be modified and their base attributes are frozen.
 """
+
 import abc
 import argparse
 import copy
@@ -335,6 +336,7 @@ def define_constants(constants):
     constants.gem5_binary_fixture_name = "gem5"
     constants.xml_filename = "results.xml"
     constants.pickle_filename = "results.pickle"
+    constants.timing_history_filename = "timing-history.json"
     constants.pickle_protocol = highest_pickle_protocol
 
     # The root directory which all test names will be based off of.
@@ -377,6 +379,10 @@ def define_post_processors(config):
         if test_threads is not None:
             return (int(test_threads[0]),)
 
+    def test_processes_as_int(test_processes):
+        if test_processes is not None:
+            return (int(test_processes[0]),)
+
     def default_isa(isa):
         if not isa[0]:
             return [constants.supported_tags[constants.isa_tag_type]]
@@ -437,6 +443,7 @@ def define_post_processors(config):
     config._add_post_processor("host", default_host)
     config._add_post_processor("threads", threads_as_int)
     config._add_post_processor("test_threads", test_threads_as_int)
+    config._add_post_processor("test_processes", test_processes_as_int)
     config._add_post_processor(
         StorePositionalTagsAction.position_kword, compile_tag_regex
     )
@@ -611,6 +618,22 @@ def define_common_args(config):
             default=1,
             help="Number of threads to spawn to run concurrent tests with.",
         ),
+        Argument(
+            "-p",
+            "--test-processes",
+            action="store",
+            default=1,
+            help="Number of processes to run test suites in. Suites are "
+            "scheduled longest first, using the timing history.",
+        ),
+        Argument(
+            "--timing-history",
+            action="store",
+            default=None,
+            help="File recording how long each suite and test took, used to "
+            "schedule --test-processes runs (default: "
+            "<result-path>/%s)" % constants.timing_history_filename,
+        ),
         Argument(
             "-v",
             action="count",
@@ -709,6 +732,8 @@ class RunParser(ArgParser):
         common_args.bin_path.add_to(parser)
         common_args.threads.add_to(parser)
         common_args.test_threads.add_to(parser)
+        common_args.test_processes.add_to(parser)
+        common_args.timing_history.add_to(parser)
         common_args.isa.add_to(parser)
         common_args.variant.add_to(parser)
         common_args.length.add_to(parser)
@@ -794,6 +819,8 @@ class RerunParser(ArgParser):
         common_args.bin_path.add_to(parser)
         common_args.threads.add_to(parser)
         common_args.test_threads.add_to(parser)
+        common_args.test_processes.add_to(parser)
+        common_args.timing_history.add_to(parser)
         common_args.isa.add_to(parser)
         common_args.variant.add_to(parser)
         common_args.length.add_to(parser)
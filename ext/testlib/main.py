@@ -316,7 +316,17 @@ def run_schedule(test_schedule, log_handler):
     log.test_log.message(terminal.separator())
 
     # Build global fixtures and exectute scheduled test suites.
-    if configuration.config.test_threads > 1:
+    if configuration.config.test_processes > 1:
+        library_runner = runner.LibraryProcessRunner(test_schedule)
+        library_runner.set_processes(configuration.config.test_processes)
+        library_runner.set_history(
+            configuration.config.timing_history
+            or os.path.join(
+                configuration.config.result_path,
+                configuration.constants.timing_history_filename,
+            )
+        )
+    elif configuration.config.test_threads > 1:
         library_runner = runner.LibraryParallelRunner(test_schedule)
         library_runner.set_threads(configuration.config.test_threads)
     else:
@@ -38,8 +38,17 @@
 #
 # Authors: Sean Wilson
 
+import json
+import multiprocessing
 import multiprocessing.dummy
+import os
+import time
 import traceback
+from concurrent.futures import (
+    ProcessPoolExecutor,
+    as_completed,
+)
+from concurrent.futures.process import BrokenProcessPool
 
 import testlib.helper as helper
 import testlib.log as log
@@ -120,6 +129,7 @@ class RunnerPattern:
 
     def run(self):
         avoided = False
+        start = time.time()
         try:
             self.testable.status = Status.Building
             self.builder.setup(self.testable)
@@ -141,6 +151,7 @@ class RunnerPattern:
             self.testable.status = Status.Avoided
         else:
             self.testable.status = Status.Complete
+        self.testable.duration = time.time() - start
 
 
 class TestRunner(RunnerPattern):
@@ -181,6 +192,230 @@ class LibraryParallelRunner(RunnerPattern):
         self.testable.result = compute_aggregate_result(iter(self.testable))
 
 
+class TimingHistory:
+    """
+    Durations of previous runs of suites and tests, keyed by their UID and
+    kept in a JSON file between runs.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.durations = {}
+        if path and os.path.exists(path):
+            try:
+                with open(path) as f:
+                    self.durations = json.load(f)
+            except (OSError, ValueError):
+                log.test_log.warn(
+                    "Ignoring unreadable timing history %s" % path
+                )
+
+    def estimate(self, suite):
+        """
+        Estimate how long a suite will take. Suites and tests which have
+        never run are assumed to take as long as the longest known suite,
+        so they are started early.
+        """
+        known = self.durations.get(str(suite.uid))
+        if known is not None:
+            return known
+        default = max(self.durations.values(), default=0.0)
+        return sum(
+            self.durations.get(str(test.uid), default) for test in suite
+        )
+
+    def record(self, uid, duration):
+        if duration is not None:
+            self.durations[str(uid)] = duration
+
+    def save(self):
+        if not self.path:
+            return
+        helper.mkdir_p(os.path.dirname(os.path.abspath(self.path)))
+        tmp = self.path + ".tmp"
+        with open(tmp, "w") as f:
+            json.dump(self.durations, f, indent=2, sort_keys=True)
+        os.replace(tmp, self.path)
+
+
+def group_suites(suites):
+    """
+    Group suites which share fixtures, other than global fixtures, so that
+    they run in the same process and their fixtures are only built once.
+
+    :returns: A list of groups, each a list of indices into suites in their
+        original order.
+    """
+    parent = list(range(len(suites)))
+
+    def find(i):
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    owners = {}
+    for index, suite in enumerate(suites):
+        fixtures = list(suite.fixtures)
+        for test in suite:
+            fixtures.extend(test.fixtures)
+        for fixture in fixtures:
+            if fixture.is_global():
+                continue
+            owner = owners.setdefault(id(fixture), index)
+            parent[find(index)] = find(owner)
+
+    groups = {}
+    for index in range(len(suites)):
+        groups.setdefault(find(index), []).append(index)
+    return list(groups.values())
+
+
+def schedule_suites(suites, history):
+    """
+    Group suites with :func:`group_suites` and order the groups longest
+    first, using the durations estimated by history, so the longest groups
+    don't end up being started last.
+
+    :returns: The groups, in the order they should be started.
+    """
+    groups = group_suites(suites)
+    estimates = [
+        sum(history.estimate(suites[index]) for index in group)
+        for group in groups
+    ]
+    order = sorted(
+        range(len(groups)), key=lambda g: estimates[g], reverse=True
+    )
+    return [groups[g] for g in order]
+
+
+# Suites of the library being run by a LibraryProcessRunner. Worker processes
+# are forked, so they find the loaded suites here rather than having them
+# pickled.
+_process_suites = None
+
+
+def _run_suite_group(indices):
+    start = time.time()
+    results = []
+    for index in indices:
+        suite = _process_suites[index]
+        suite.runner(suite).run()
+        results.append(
+            (
+                index,
+                suite.metadata,
+                suite.duration,
+                [(test.metadata, test.duration) for test in suite],
+            )
+        )
+    return time.time() - start, results
+
+
+class LibraryProcessRunner(RunnerPattern):
+    """
+    Runs suites in a pool of forked processes. Suites sharing fixtures are
+    run together, in loader order, and groups of suites are started longest
+    first, based on the durations recorded in the timing history.
+    """
+
+    def set_processes(self, processes):
+        self.processes = processes
+
+    def set_history(self, path):
+        self.history_path = path
+
+    def test(self):
+        global _process_suites
+
+        suites = list(self.testable)
+        history = TimingHistory(getattr(self, "history_path", None))
+        groups = schedule_suites(suites, history)
+
+        _process_suites = suites
+        start = time.time()
+        group_times = {}
+        try:
+            with ProcessPoolExecutor(
+                max_workers=self.processes,
+                mp_context=multiprocessing.get_context("fork"),
+            ) as pool:
+                futures = {
+                    pool.submit(_run_suite_group, group): g
+                    for g, group in enumerate(groups)
+                }
+                for future in as_completed(futures):
+                    group = futures[future]
+                    try:
+                        group_time, results = future.result()
+                    except BrokenProcessPool:
+                        self._avoid_group(
+                            suites, groups[group], traceback.format_exc()
+                        )
+                        continue
+                    group_times[group] = group_time
+                    for index, metadata, duration, tests in results:
+                        self._apply(suites[index], metadata, duration)
+                        for test, (metadata, duration) in zip(
+                            suites[index], tests
+                        ):
+                            self._apply(test, metadata, duration)
+        finally:
+            _process_suites = None
+        elapsed = time.time() - start
+
+        for suite in suites:
+            history.record(suite.uid, suite.duration)
+            for test in suite:
+                history.record(test.uid, test.duration)
+        history.save()
+
+        self._report(suites, groups, group_times, elapsed)
+        self.testable.result = compute_aggregate_result(iter(self.testable))
+
+    @staticmethod
+    def _apply(testable, metadata, duration):
+        # The worker has already logged the status and result updates, so
+        # update the metadata directly rather than logging them again. The
+        # metadata object itself is kept, as the result handler refers to it.
+        testable.metadata.__dict__.update(metadata.__dict__)
+        testable.duration = duration
+
+    @staticmethod
+    def _avoid_group(suites, group, reason):
+        for index in group:
+            suite = suites[index]
+            if suite.metadata.status in (Status.Complete, Status.Avoided):
+                continue
+            for test in suite:
+                test.result = Result(Result.Errored, reason)
+                test.status = Status.Avoided
+            suite.result = Result(Result.Errored, reason)
+            suite.status = Status.Avoided
+
+    def _report(self, suites, groups, group_times, elapsed):
+        total = sum(group_times.values())
+        log.test_log.message(
+            "Ran %d suites in %d groups on %d processes in %.1f seconds"
+            % (len(suites), len(groups), self.processes, elapsed)
+        )
+        if not group_times:
+            return
+        critical = max(group_times, key=group_times.get)
+        log.test_log.message(
+            "Total test time %.1f seconds, %.1f seconds per process"
+            % (total, total / self.processes)
+        )
+        log.test_log.message(
+            "Critical path %.1f seconds: %s"
+            % (
+                group_times[critical],
+                ", ".join(suites[index].name for index in groups[critical]),
+            )
+        )
+
+
 class BrokenFixtureException(Exception):
     def __init__(self, fixture, testitem, trace):
         self.trace = trace
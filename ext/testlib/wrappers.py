@@ -42,6 +42,7 @@
 Module contains wrappers for test items that have been
 loaded by the testlib :class:`testlib.loader.Loader`.
 """
+
 import itertools
 
 import testlib.uid as uid
@@ -90,6 +91,8 @@ class LoadedTestable:
     def __init__(self, obj):
         self.obj = obj
         self.metadata = self._generate_metadata()
+        # Wall time taken by the last run, in seconds.
+        self.duration = None
 
     @property
     def status(self):
@@ -45,6 +45,7 @@ import traceback
 # get type names
 from types import *
 
+from generator_cache import GeneratedFile
 from grammar import Grammar
 
 from .operand_list import *
@@ -1622,12 +1623,12 @@ StaticInstPtr
             return s
 
     def open(self, name, bare=False):
-        """Open the output file for writing and include scary warning."""
-        filename = os.path.join(self.output_dir, name)
-        f = open(filename, "w")
-        if f:
-            if not bare:
-                f.write(ISAParser.scaremonger_template % self)
+        """Open the output file for writing and include scary warning.
+        The file is only written when it is closed, and only if its
+        contents changed, so that unchanged outputs aren't recompiled."""
+        f = GeneratedFile(os.path.join(self.output_dir, name))
+        if not bare:
+            f.write(ISAParser.scaremonger_template % self)
         return f
 
     def update(self, file, contents):
@@ -1665,6 +1666,7 @@ StaticInstPtr
             contents = open(filename).read()
         except OSError:
             error(f'Error including file "{filename}"')
+        self.input_files.append(filename)
 
         self.fileNameStack.push(LineTracker(filename))
 
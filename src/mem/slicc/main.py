@@ -91,6 +91,11 @@ def main(args=None):
         action="store_true",
         help="print traceback on error",
     )
+    parser.add_option(
+        "--transition-table",
+        action="store_true",
+        help="dispatch transitions through tables instead of a switch",
+    )
     parser.add_option("-q", "--quiet", help="don't print messages")
     opts, files = parser.parse_args(args=args)
 
@@ -118,6 +123,7 @@ def main(args=None):
             verbose=True,
             debug=opts.debug,
             traceback=opts.tb,
+            transition_table=opts.transition_table,
         )
 
         if opts.print_files:
@@ -60,15 +60,19 @@ class SLICC(Grammar):
         base_dir,
         verbose=False,
         traceback=False,
+        transition_table=False,
         **kwargs,
     ):
         """Entrypoint for SLICC parsing
         protocol: The protocol `.slicc` file to parse
         includes: list of `.slicc` files that are shared between all protocols
+        transition_table: Dispatch transitions through generated tables
+        rather than a switch statement
         """
         self.protocol = None
         self.traceback = traceback
         self.verbose = verbose
+        self.transition_table = transition_table
         self.symtab = SymbolTable(self)
         self.base_dir = base_dir
 
@@ -1643,6 +1643,7 @@ ${ident}_Controller::wakeup()
 // ${ident}: ${{self.short}}
 
 #include <cassert>
+#include <cstdint>
 
 #include "base/logging.hh"
 #include "base/trace.hh"
@@ -1814,6 +1815,76 @@ ${ident}_Controller::doTransitionWorker(${ident}_Event event,
 {
     m_curTransitionEvent = event;
     m_curTransitionNextState = next_state;
+"""
+        )
+
+        if self.symtab.slicc.transition_table:
+            self.printTransitionTable(code)
+        else:
+            self.printTransitionSwitch(code)
+
+        code(
+            """
+
+} // namespace ${protocol}
+} // namespace ruby
+} // namespace gem5
+"""
+        )
+        code.write(path, f"{gen_filename}_Transitions.cc")
+
+    def resourceChecks(self, trans):
+        """
+        Return the code checking that the resources a transition needs are
+        available.
+        """
+        checks = []
+        for key, val in trans.resources.items():
+            val = f"""
+if (!{key.code}.areNSlotsAvailable({val}, clockEdge()))
+    return TransitionResult_ResourceStall;
+"""
+            checks.append(val)
+
+        # Check all of the request_types for resource constraints
+        for request_type in trans.request_types:
+            val = """
+if (!checkResourceAvailable({}_RequestType_{}, addr)) {{
+    return TransitionResult_ResourceStall;
+}}
+""".format(
+                self.ident,
+                request_type.ident,
+            )
+            checks.append(val)
+
+        # Emit the code sequences in a sorted order.  This makes the
+        # output deterministic (without this the output order can vary
+        # since Map's keys() on a vector of pointers is not deterministic
+        return sorted(checks)
+
+    def isStall(self, trans):
+        return any(action.ident == "z_stall" for action in trans.actions)
+
+    def actionArgs(self):
+        """The arguments every action is called with."""
+        if self.TBEType != None and self.EntryType != None:
+            return "m_tbe_ptr, m_cache_entry_ptr, addr"
+        elif self.TBEType != None:
+            return "m_tbe_ptr, addr"
+        elif self.EntryType != None:
+            return "m_cache_entry_ptr, addr"
+        return "addr"
+
+    def printTransitionSwitch(self, code):
+        """
+        Dispatch transitions with a switch over HASH_FUN(state, event), with
+        a case for every distinct transition.
+        """
+        ident = self.ident
+
+        code(
+            """
     switch(HASH_FUN(state, event)) {
 """
         )
@@ -1854,31 +1925,7 @@ ${ident}_Controller::doTransitionWorker(${ident}_Event event,
             request_types = trans.request_types
 
             # Check for resources
-            case_sorter = []
-            res = trans.resources
-            for key, val in res.items():
-                val = f"""
-if (!{key.code}.areNSlotsAvailable({val}, clockEdge()))
-    return TransitionResult_ResourceStall;
-"""
-                case_sorter.append(val)
-
-            # Check all of the request_types for resource constraints
-            for request_type in request_types:
-                val = """
-if (!checkResourceAvailable({}_RequestType_{}, addr)) {{
-    return TransitionResult_ResourceStall;
-}}
-""".format(
-                    self.ident,
-                    request_type.ident,
-                )
-                case_sorter.append(val)
-
-            # Emit the code sequences in a sorted order.  This makes the
-            # output deterministic (without this the output order can vary
-            # since Map's keys() on a vector of pointers is not deterministic
-            for c in sorted(case_sorter):
+            for c in self.resourceChecks(trans):
                 case("$c")
 
             # Record access types for this transition
@@ -1888,13 +1935,7 @@ if (!checkResourceAvailable({}_RequestType_{}, addr)) {{
                 )
 
             # Figure out if we stall
-            stall = False
-            for action in actions:
-                if action.ident == "z_stall":
-                    stall = True
-                    break
-
-            if stall:
+            if self.isStall(trans):
                 case("return TransitionResult_ProtocolStall;")
             else:
                 if self.TBEType != None and self.EntryType != None:
@@ -1940,13 +1981,190 @@ if (!checkResourceAvailable({}_RequestType_{}, addr)) {{
 
     return TransitionResult_Valid;
 }
+"""
+        )
 
-} // namespace ${protocol}
-} // namespace ruby
-} // namespace gem5
+    def printTransitionTable(self, code):
+        """
+        Dispatch transitions through tables. Every (state, event) pair maps
+        to a transition descriptor, which gives the next state, the
+        resource checks and a range of an array of actions. Identical
+        descriptors, resource checks and action sequences are shared.
+        """
+        ident = self.ident
+        c_ident = f"{ident}_Controller"
+
+        params = []
+        if self.TBEType != None:
+            params.append(f"{self.TBEType.c_ident}*&")
+        if self.EntryType != None:
+            params.append(f"{self.EntryType.c_ident}*&")
+        params.append("Addr")
+        params = ", ".join(params)
+        args = self.actionArgs()
+
+        states = list(self.states)
+        events = list(self.events)
+        index = [[0] * len(events) for state in states]
+        actions = []
+        guards = OrderedDict()
+        descriptors = OrderedDict()
+
+        for trans in self.transitions:
+            # Only set next_state if it changes
+            if trans.state == trans.nextState:
+                next_state = "-1"
+            elif trans.nextState.isWildcard():
+                next_state = "-2"
+            else:
+                next_state = f"{ident}_State_{trans.nextState.ident}"
+
+            guard = self.symtab.codeFormatter()
+            for c in self.resourceChecks(trans):
+                guard("$c")
+            # Record access types for this transition
+            for request_type in trans.request_types:
+                guard(
+                    "recordRequestType(${ident}_RequestType_${{request_type.ident}}, addr);"
+                )
+            guard = str(guard)
+            guard_id = 0
+            if guard:
+                guard_id = guards.setdefault(guard, len(guards) + 1)
+
+            stall = self.isStall(trans)
+            sequence = [] if stall else [a.ident for a in trans.actions]
+            # Reuse any run of actions which is already in the array
+            first = next(
+                (
+                    i
+                    for i in range(len(actions) - len(sequence) + 1)
+                    if actions[i : i + len(sequence)] == sequence
+                ),
+                None,
+            )
+            if first is None:
+                first = len(actions)
+                actions.extend(sequence)
+
+            descriptor = (next_state, guard_id, first, len(sequence), stall)
+            descriptor_id = descriptors.setdefault(
+                descriptor, len(descriptors) + 1
+            )
+            index[states.index(trans.state.ident)][
+                events.index(trans.event.ident)
+            ] = descriptor_id
+
+        if len(descriptors) >= 1 << 16 or len(actions) >= 1 << 16:
+            self.error("Too many transitions for a transition table")
+
+        code()
+        code(
+            """
+    typedef void (${c_ident}::*Action)($params);
+
+    // The transition of every (state, event) pair, as an index into
+    // transitions plus one, or 0 if the pair has no transition
+    static constexpr uint16_t
+        transitionIndex[${ident}_State_NUM * ${ident}_Event_NUM] = {
+"""
+        )
+        for state, row in zip(states, index):
+            code("        // $state")
+            for i in range(0, len(row), 16):
+                values = ", ".join(str(v) for v in row[i : i + 16])
+                code("        $values,")
+        code(
+            """
+    };
+
+    struct Transition
+    {
+        // The next state, -1 if unchanged, or -2 if given by getNextState()
+        int16_t nextState;
+        // The resource checks, 0 if there are none
+        uint16_t guard;
+        uint16_t firstAction;
+        uint16_t numActions;
+        bool stall;
+    };
+
+    static constexpr Transition transitions[] = {
+"""
+        )
+        if not descriptors:
+            descriptors[("-1", 0, 0, 0, False)] = 1
+        for next_state, guard_id, first, count, stall in descriptors:
+            stall = "true" if stall else "false"
+            code("        { $next_state, $guard_id, $first, $count, $stall },")
+        code(
+            """
+    };
+
+    static constexpr Action actions[] = {
+"""
+        )
+        for action in actions:
+            code("        &${c_ident}::${action},")
+        if not actions:
+            code("        nullptr,")
+        code(
+            """
+    };
+
+    int i = transitionIndex[HASH_FUN(state, event)];
+    if (i == 0) {
+        panic("Invalid transition\\n"
+              "%s time: %d addr: %#x event: %s state: %s\\n",
+              name(), curCycle(), addr, event, state);
+    }
+    const Transition &t = transitions[i - 1];
+
+    if (t.nextState >= 0) {
+        next_state = ${ident}_State(t.nextState);
+        m_curTransitionNextState = next_state;
+"""
+        )
+        if any(d[0] == "-2" for d in descriptors):
+            # When * is encountered as an end state of a transition, the next
+            # state is determined by calling the machine-specific
+            # getNextState function, before any actions of the transition
+            # execute.
+            code(
+                """
+    } else if (t.nextState == -2) {
+        next_state = getNextState(addr);
+        m_curTransitionNextState = next_state;
+"""
+            )
+        code("    }")
+
+        if guards:
+            code(
+                """
+
+    switch (t.guard) {
+"""
+            )
+            for guard, guard_id in guards.items():
+                code("      case $guard_id:")
+                code("        $guard")
+                code("        break;")
+            code("    }")
+
+        code(
+            """
+
+    if (t.stall)
+        return TransitionResult_ProtocolStall;
+
+    for (int a = t.firstAction; a < t.firstAction + t.numActions; a++)
+        (this->*actions[a])($args);
+
+    return TransitionResult_Valid;
+}
 """
         )
-        code.write(path, f"{gen_filename}_Transitions.cc")
 
     # **************************
     # ******* HTML Files *******
@@ -43,10 +43,6 @@
 
 #include "python/embedded.hh"
 
-#include <zlib.h>
-
-#include <cstdlib>
-#include <iostream>
 #include <list>
 
 namespace py = pybind11;
@@ -68,31 +64,15 @@ EmbeddedPython::getList()
     return the_list;
 }
 
-/*
- * Uncompress and unmarshal the code object stored in the
- * EmbeddedPython
- */
-py::object
-EmbeddedPython::getCode() const
-{
-    auto marshalled = std::make_unique<Bytef[]>(len);
-    uLongf unzlen = len;
-    int ret = uncompress(marshalled.get(), &unzlen, code, zlen);
-    if (ret != Z_OK) {
-        std::cerr << "Could not uncompress code: " << zError(ret) << std::endl;
-        std::abort();
-    }
-    assert(unzlen == (uLongf)len);
-
-    auto marshal = py::module_::import("marshal");
-    return marshal.attr("loads")(py::bytes((char*)marshalled.get(), len));
-}
-
 bool
 EmbeddedPython::addModule() const
 {
+    // The code is only uncompressed and unmarshalled by the importer once
+    // the module is imported. The data is static, so the importer can hold
+    // a view of it instead of a copy.
     auto importer = py::module_::import("importer");
-    importer.attr("add_module")(abspath, modpath, getCode());
+    importer.attr("add_compressed_module")(abspath, modpath,
+            py::memoryview::from_memory(code, zlen), len);
     return true;
 }
 
@@ -24,11 +24,14 @@
 # (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
+import hashlib
 import json
-from math import ceil
+import os
 from pathlib import Path
 from typing import (
+    Dict,
     List,
+    Optional,
     Tuple,
 )
 
@@ -37,6 +40,15 @@ from m5.params import Addr
 from m5.util import inform
 
 
+def _numpy():
+    """Return the numpy module, or None if NumPy is not installed."""
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
 class SpatterKernel:
     """This class encapsulates one kernel in a spatter trace.
         A spatter trace is represented with a json file.
@@ -125,7 +137,7 @@ class SpatterKernel:
             `indices_per_stride` indices from the index array.
             User defined, i.e. spatter traces don't have this field.
             kernel_trace (List[int]): The elements of the `index` array.
-            `pattern` from spatter trace.
+            `pattern` from spatter trace. It can also be a NumPy array.
             index_size (int): The size of elements in `index`.
             User defined, i.e. spatter traces don't have this field.
             It represents the size of elements in the `index` array in code above.
@@ -184,14 +196,20 @@ class SpatterKernel:
             self._base_index_addr,
             self._value_size,
             self._base_value_addr,
-            self._trace,
+            # pybind11 converts a list much faster than a NumPy array, which
+            # it reads one NumPy scalar at a time.
+            (
+                self._trace
+                if isinstance(self._trace, list)
+                else self._trace.tolist()
+            ),
         ]
 
     def __str__(self):
         return (
             f"SpatterKernel(id={self._id}, delta={self._delta}, "
             f"count={self._count}, type={self._type}, "
-            f"trace[:8]={self._trace[:8]}"
+            f"trace[:8]={[int(i) for i in self._trace[:8]]}"
         )
 
 
@@ -244,7 +262,9 @@ def unroll_trace(
     than `min_elements`, it allows for filling the trace with zeros or elements
     from the pattern. By filling elements from the pattern, the unrolling
     process goes beyond the `count` limit. However, it will not decrement
-    `count`.
+    `count`. The unrolled trace is returned as a NumPy array of int64, or
+    as a list if NumPy is not installed, and `original_trace` is left
+    unchanged.
 
     Args:
         original_trace (List): The original trace to unroll.
@@ -277,30 +297,60 @@ def unroll_trace(
             "`count` limit (from the kernel in JSON) when unrolling."
         )
 
+    np = _numpy()
     og_len = len(original_trace)
-    ret_count = count
-    ret_trace = original_trace
-    while (len(ret_trace) < min_elements) and ret_count > 1:
-        ret_trace += [element + delta for element in ret_trace[-og_len:]]
-        ret_count -= 1
-    if (len(ret_trace) < min_elements) and fill_zero:
+    if og_len == 0:
+        return count, [] if np is None else np.zeros(0, np.int64)
+    # The trace is made of blocks, the nth block being the original trace
+    # plus n * delta. Unrolling adds a block for every decrement of count.
+    needed_blocks = -(-min_elements // og_len)
+    num_blocks = max(1, min(needed_blocks, count))
+    ret_count = count - (num_blocks - 1)
+    ret_len = og_len * num_blocks
+    if (ret_len < min_elements) and fill_zero:
         inform(
             "You have chosen to fill the trace with zero "
             f"until it reaches at least {min_elements} elements."
         )
-        ret_trace += [0] * (min_elements - len(ret_trace))
-    if (len(ret_trace) < min_elements) and fill_pattern:
+    if (ret_len < min_elements) and fill_pattern:
         inform(
             "You have chosen to fill the trace with the pattern "
             "(without dectementing count) until it "
             f"reaches at least {min_elements} elements."
         )
-        while len(ret_trace) < min_elements:
-            ret_trace += [element + delta for element in ret_trace[-og_len:]]
+        num_blocks = needed_blocks
+    if np is None:
+        ret_trace = [
+            element + block * delta
+            for block in range(num_blocks)
+            for element in original_trace
+        ]
+        if (len(ret_trace) < min_elements) and fill_zero:
+            ret_trace += [0] * (min_elements - len(ret_trace))
+        return ret_count, ret_trace
+
+    trace = np.asarray(original_trace, dtype=np.int64)
+    steps = np.arange(num_blocks, dtype=np.int64) * delta
+    ret_trace = (steps[:, None] + trace[None, :]).reshape(-1)
+    if (len(ret_trace) < min_elements) and fill_zero:
+        ret_trace = np.concatenate(
+            (ret_trace, np.zeros(min_elements - len(ret_trace), np.int64))
+        )
     return ret_count, ret_trace
 
 
 def partition_trace(original_trace, num_partitions, interleave_size):
+    """
+    Function to partition a trace between `num_partitions` cores. The trace
+    is cut into leaves of `interleave_size` elements, which are handed to the
+    partitions in a round-robin fashion. Returns a list of `num_partitions`
+    NumPy arrays, or of lists if NumPy is not installed.
+
+    Args:
+        original_trace (List): The trace to partition.
+        num_partitions (int): The number of partitions.
+        interleave_size (int): The number of elements in each leaf.
+    """
     if len(original_trace) < (num_partitions * interleave_size):
         raise ValueError(
             "Trace (`original_trace`) is too small for the "
@@ -311,15 +361,134 @@ def partition_trace(original_trace, num_partitions, interleave_size):
             "or it being folded too many times. You can solve "
             "this issue by using the `unroll_trace` function. "
         )
-    partitions = [[] for _ in range(num_partitions)]
-    num_leaves = ceil(len(original_trace) / interleave_size)
-    for i in range(num_leaves):
-        lower_bound = i * interleave_size
-        upper_bound = min(lower_bound + interleave_size, len(original_trace))
-        partitions[i % num_partitions] += original_trace[
-            lower_bound:upper_bound
-        ]
-    return partitions
+    np = _numpy()
+    if np is None:
+        partitions = [[] for _ in range(num_partitions)]
+        for i, start in enumerate(
+            range(0, len(original_trace), interleave_size)
+        ):
+            partitions[i % num_partitions] += original_trace[
+                start : start + interleave_size
+            ]
+        return partitions
+
+    trace = np.asarray(original_trace)
+    # Every full round of leaves gives one leaf to each partition, and the
+    # leaves of the last, partial, round go to the first partitions.
+    round_size = num_partitions * interleave_size
+    num_rounds = len(trace) // round_size
+    rounds = trace[: num_rounds * round_size].reshape(
+        num_rounds, num_partitions, interleave_size
+    )
+    tail = trace[num_rounds * round_size :]
+    return [
+        np.concatenate(
+            (
+                rounds[:, i, :].reshape(-1),
+                tail[i * interleave_size : (i + 1) * interleave_size],
+            )
+        )
+        for i in range(num_partitions)
+    ]
+
+
+# Prepared kernels, keyed by the hash of the trace file, the number of cores
+# and the interleave size.
+_prepared_traces: Dict[Tuple[str, int, int], List[Tuple]] = {}
+
+
+def _prepare_traces(
+    trace_path: Path,
+    num_cores: int,
+    interleave_size: int,
+    cache_dir: Optional[Path],
+) -> List[Tuple]:
+    """
+    Return a ``(delta, count, type, partitions)`` tuple for every kernel of
+    the trace at `trace_path`, where partitions holds one read-only uint32
+    NumPy array per core, or one list per core if NumPy is not installed.
+    """
+    np = _numpy()
+    data = trace_path.read_bytes()
+    key = (hashlib.sha256(data).hexdigest(), num_cores, interleave_size)
+    if key in _prepared_traces:
+        return _prepared_traces[key]
+
+    cache_file = None
+    if cache_dir is not None and np is not None:
+        cache_file = Path(cache_dir) / (
+            f"{key[0][:32]}-{num_cores}-{interleave_size}.npz"
+        )
+        if cache_file.is_file():
+            with np.load(cache_file) as cached:
+                prepared = []
+                for i, ((delta, count), type) in enumerate(
+                    zip(cached["kernels"], cached["types"])
+                ):
+                    partitions = [
+                        cached[f"k{i}_p{j}"] for j in range(num_cores)
+                    ]
+                    for partition in partitions:
+                        partition.flags.writeable = False
+                    prepared.append(
+                        (
+                            int(delta),
+                            int(count),
+                            SpatterKernelType(str(type)),
+                            partitions,
+                        )
+                    )
+            _prepared_traces[key] = prepared
+            return prepared
+
+    prepared = []
+    for kernel in json.loads(data):
+        delta, count, type, og_trace = parse_kernel(kernel)
+        new_count, unrolled_trace = unroll_trace(
+            og_trace,
+            delta,
+            count,
+            num_cores * interleave_size,
+            fill_pattern=True,
+        )
+        if np is None:
+            low, high = min(unrolled_trace), max(unrolled_trace)
+        else:
+            low, high = unrolled_trace.min(), unrolled_trace.max()
+        if low < 0 or high > 0xFFFFFFFF:
+            raise ValueError(
+                f"Trace '{trace_path}' has indices that do not fit in 32 bits."
+            )
+        if np is None:
+            partitions = partition_trace(
+                unrolled_trace, num_cores, interleave_size
+            )
+        else:
+            partitions = partition_trace(
+                unrolled_trace.astype(np.uint32), num_cores, interleave_size
+            )
+            for partition in partitions:
+                partition.flags.writeable = False
+        prepared.append((delta, new_count, type, partitions))
+
+    if cache_file is not None:
+        arrays = {
+            f"k{i}_p{j}": partition
+            for i, (_, _, _, partitions) in enumerate(prepared)
+            for j, partition in enumerate(partitions)
+        }
+        arrays["kernels"] = np.array(
+            [(delta, count) for delta, count, _, _ in prepared],
+            dtype=np.int64,
+        ).reshape(-1, 2)
+        arrays["types"] = np.array([str(type) for _, _, type, _ in prepared])
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp = cache_file.with_suffix(f".{os.getpid()}.npz")
+        np.savez(tmp, **arrays)
+        os.replace(tmp, cache_file)
+
+    _prepared_traces[key] = prepared
+    return prepared
 
 
 def prepare_kernels(
@@ -328,6 +497,7 @@ def prepare_kernels(
     interleave_size: int,
     base_index_addr: Addr,
     base_value_addr: Addr,
+    cache_dir: Optional[Path] = None,
 ) -> List[List[SpatterKernel]]:
     """
     Function to prepare kernels from a spatter trace. It will read the trace
@@ -339,36 +509,34 @@ def prepare_kernels(
     it will ask `unroll_trace` to fill the trace with elements from the
     pattern. It will return a list of list of kernels where each list of
     kernels represents a kernel with a length of `num_cores`.
+    The partitioned traces are kept as NumPy arrays and are cached, in
+    memory and optionally in `cache_dir`, by the hash of the trace file, the
+    number of cores and the interleave size. Without NumPy, they are kept as
+    lists and only cached in memory.
     Args:
         trace_path (Path): Path to the spatter trace.
         num_cores (int): Number of cores to partition the trace.
         interleave_size (int): Number of elements to interleave the trace by.
         base_index_addr (Addr): The base address of the index array.
         base_value_addr (Addr): The base address of the value array.
+        cache_dir (Optional[Path]): A directory to keep the partitioned
+        traces in between runs. If None, they are only cached in memory.
     Returns:
         List[List[SpatterKernel]]: A list of list of kernels where each list
         of kernels represents a kernel with a length of `num_cores`.
     """
-    trace_file = trace_path.open("r")
-    kernels = json.load(trace_file)
+    prepared = _prepare_traces(
+        Path(trace_path), num_cores, interleave_size, cache_dir
+    )
     ret = []
-    for i, kernel in enumerate(kernels):
-        delta, count, type, og_trace = parse_kernel(kernel)
-        new_count, unrolled_trace = unroll_trace(
-            og_trace,
-            delta,
-            count,
-            num_cores * interleave_size,
-            fill_pattern=True,
-        )
-        traces = partition_trace(unrolled_trace, num_cores, interleave_size)
+    for i, (delta, count, type, traces) in enumerate(prepared):
         temp = []
         for j, trace in enumerate(traces):
             temp.append(
                 SpatterKernel(
                     kernel_id=i,
                     kernel_delta=delta,
-                    kernel_count=new_count,
+                    kernel_count=count,
                     kernel_type=type,
                     base_index=j * interleave_size,
                     indices_per_stride=interleave_size,
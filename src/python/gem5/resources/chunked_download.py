@@ -0,0 +1,344 @@
+# Copyright (c) 2026 The Regents of the University of California
+# All Rights Reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met: redistributions of source code must retain the above copyright
+# notice, this list of conditions and the following disclaimer;
+# redistributions in binary form must reproduce the above copyright
+# notice, this list of conditions and the following disclaimer in the
+# documentation and/or other materials provided with the distribution;
+# neither the name of the copyright holders nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+# A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+# THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+
+"""
+Resumable, parallel HTTP downloads with streaming md5 computation.
+
+Data is written to a ``<file>.part`` file which is only renamed to its final
+name once complete, so an interrupted download can be resumed. If the server
+supports HTTP Range requests, large files are fetched as several chunks in
+parallel. The progress of each chunk is recorded in a ``<file>.part.json``
+state file, so these resume too.
+
+The md5 of the downloaded bytes is computed while the download progresses,
+so no second pass over the file is needed to verify it.
+"""
+
+import hashlib
+import json
+import os
+import ssl
+import threading
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import (
+    List,
+    Optional,
+    Tuple,
+)
+
+from ..utils.progress_bar import tqdm
+
+# The size of the blocks read from the network and from the part file.
+_BLOCK_SIZE = 1024 * 1024
+
+# How often, in bytes downloaded per chunk, the chunk state is saved.
+_STATE_SAVE_INTERVAL = 16 * 1024 * 1024
+
+
+def _open(
+    url: str,
+    context: Optional[ssl.SSLContext],
+    start: int = 0,
+    end: Optional[int] = None,
+    method: str = "GET",
+):
+    """Opens the URL, requesting the bytes in [start, end) if start or end is
+    given."""
+    request = urllib.request.Request(url, method=method)
+    if start or end is not None:
+        last = "" if end is None else str(end - 1)
+        request.add_header("Range", f"bytes={start}-{last}")
+    return urllib.request.urlopen(request, context=context)
+
+
+def _probe(
+    url: str, context: Optional[ssl.SSLContext]
+) -> Tuple[Optional[int], bool]:
+    """
+    Returns the size of the resource at the URL, if known, and whether the
+    server accepts Range requests.
+    """
+    try:
+        with _open(url, context, method="HEAD") as response:
+            length = response.headers.get("Content-Length")
+            ranges = response.headers.get("Accept-Ranges", "") == "bytes"
+            return (int(length) if length else None), ranges
+    except urllib.error.HTTPError:
+        # Some servers do not support HEAD requests. Fall back to a single,
+        # non-resumable stream.
+        return None, False
+
+
+class _ChunkState:
+    """The progress of each chunk of a parallel download."""
+
+    def __init__(self, path: Path, url: str, size: int, connections: int):
+        self._path = path
+        self._lock = threading.Lock()
+        self.chunks: Optional[List[List[int]]] = None
+        try:
+            with open(path) as f:
+                state = json.load(f)
+            if state["url"] == url and state["size"] == size:
+                self.chunks = state["chunks"]
+        except (OSError, ValueError, KeyError):
+            pass
+        self._url = url
+        self._size = size
+        self._connections = connections
+        if self.chunks is None:
+            self.reset()
+
+    def reset(self) -> None:
+        """Marks every chunk as not started."""
+        size = self._size
+        connections = self._connections
+        bounds = [size * i // connections for i in range(connections + 1)]
+        # Each chunk is [start, end, bytes done].
+        self.chunks = [
+            [bounds[i], bounds[i + 1], 0] for i in range(connections)
+        ]
+
+    def contiguous(self) -> int:
+        """Returns the length of the completed prefix of the file."""
+        with self._lock:
+            for start, end, done in self.chunks:
+                if start + done < end:
+                    return start + done
+            return self._size
+
+    def advance(self, index: int, n: int) -> None:
+        with self._lock:
+            self.chunks[index][2] += n
+
+    def save(self) -> None:
+        with self._lock:
+            data = json.dumps(
+                {"url": self._url, "size": self._size, "chunks": self.chunks}
+            )
+        tmp = Path(f"{self._path}.tmp")
+        tmp.write_text(data)
+        os.replace(tmp, self._path)
+
+
+def _download_stream(
+    url: str,
+    part: Path,
+    size: Optional[int],
+    resumable: bool,
+    context: Optional[ssl.SSLContext],
+    progress,
+) -> str:
+    """Downloads the URL as a single stream, resuming an existing part file
+    if possible. Returns the md5 of the file."""
+    md5 = hashlib.md5()
+    offset = part.stat().st_size if resumable and part.exists() else 0
+    if size is not None and offset > size:
+        offset = 0
+    if Path(f"{part}.json").exists():
+        # The part file was preallocated by a parallel download, so its size
+        # is not the number of bytes downloaded.
+        offset = 0
+
+    if offset:
+        with open(part, "rb") as f:
+            for block in iter(lambda: f.read(_BLOCK_SIZE), b""):
+                md5.update(block)
+        progress.update(offset)
+        if offset == size:
+            return md5.hexdigest()
+
+    with _open(url, context, start=offset) as response:
+        if offset and response.status != 206:
+            # The server ignored the Range request: start over.
+            offset = 0
+            md5 = hashlib.md5()
+        with open(part, "ab" if offset else "wb") as f:
+            for block in iter(lambda: response.read(_BLOCK_SIZE), b""):
+                f.write(block)
+                md5.update(block)
+                progress.update(len(block))
+    return md5.hexdigest()
+
+
+def _download_chunks(
+    url: str,
+    part: Path,
+    size: int,
+    connections: int,
+    context: Optional[ssl.SSLContext],
+    progress,
+) -> str:
+    """Downloads the URL as parallel Range requests. The md5 is computed in
+    order, by this thread, over the completed prefix of the part file while
+    later chunks are still being downloaded. Returns the md5 of the file."""
+    state_path = Path(f"{part}.json")
+    state = _ChunkState(state_path, url, size, connections)
+    if not part.exists() or part.stat().st_size != size:
+        state.reset()
+        with open(part, "wb") as f:
+            f.truncate(size)
+    progress.update(sum(done for _, _, done in state.chunks))
+
+    updated = threading.Condition()
+
+    def fetch(index: int) -> None:
+        start, end, done = state.chunks[index]
+        if start + done >= end:
+            return
+        with _open(url, context, start=start + done, end=end) as response:
+            if response.status != 206:
+                raise Exception(
+                    f"Server did not honor the Range request for '{url}'."
+                )
+            with open(part, "r+b") as f:
+                f.seek(start + done)
+                unsaved = 0
+                for block in iter(lambda: response.read(_BLOCK_SIZE), b""):
+                    block = block[: end - (start + done)]
+                    f.write(block)
+                    f.flush()
+                    done += len(block)
+                    unsaved += len(block)
+                    state.advance(index, len(block))
+                    progress.update(len(block))
+                    if unsaved >= _STATE_SAVE_INTERVAL:
+                        state.save()
+                        unsaved = 0
+                    with updated:
+                        updated.notify()
+                    if start + done >= end:
+                        break
+        if start + done < end:
+            raise Exception(f"Incomplete download of '{url}'.")
+
+    md5 = hashlib.md5()
+    hashed = 0
+    with ThreadPoolExecutor(max_workers=connections) as executor:
+        futures = [
+            executor.submit(fetch, index) for index in range(len(state.chunks))
+        ]
+
+        def notify(_) -> None:
+            with updated:
+                updated.notify()
+
+        for future in futures:
+            future.add_done_callback(notify)
+
+        def finished() -> bool:
+            return all(future.done() for future in futures)
+
+        # Unbuffered, as a read-ahead buffer could hold stale data for the
+        # parts of the file still being downloaded.
+        with open(part, "rb", buffering=0) as f:
+            while True:
+                contiguous = state.contiguous()
+                while hashed < contiguous:
+                    f.seek(hashed)
+                    block = f.read(min(_BLOCK_SIZE, contiguous - hashed))
+                    md5.update(block)
+                    hashed += len(block)
+                if hashed >= size or finished():
+                    break
+                with updated:
+                    updated.wait(timeout=1)
+        state.save()
+        for future in futures:
+            # Raises the exception of a failed chunk, if any. The state is
+            # saved so the download resumes from where it stopped.
+            future.result()
+
+    with open(part, "rb") as f:
+        f.seek(hashed)
+        for block in iter(lambda: f.read(_BLOCK_SIZE), b""):
+            md5.update(block)
+    return md5.hexdigest()
+
+
+def download_file(
+    url: str,
+    download_to: str,
+    connections: int = 4,
+    min_chunk_size: int = 64 * 1024 * 1024,
+    context: Optional[ssl.SSLContext] = None,
+    quiet: bool = False,
+) -> str:
+    """
+    Downloads a file, resuming a previously interrupted download of the same
+    file if possible.
+
+    :param url: The URL of the file to download.
+
+    :param download_to: The location the downloaded file is to be stored.
+
+    :param connections: The maximum number of parallel Range requests.
+
+    :param min_chunk_size: The minimum size, in bytes, of each chunk fetched
+                           in parallel. Files smaller than two chunks are
+                           downloaded as a single stream.
+
+    :param context: The SSL context to use, if any.
+
+    :param quiet: If ``True``, no progress bar is shown.
+
+    :returns: The md5 of the downloaded file.
+    """
+
+    part = Path(f"{download_to}.part")
+    size, ranges = _probe(url, context)
+    connections = max(1, min(connections, (size or 0) // min_chunk_size))
+
+    if quiet:
+        from ..utils.progress_bar import FakeTQDM
+
+        progress_tqdm = FakeTQDM()
+    else:
+        progress_tqdm = tqdm
+
+    with progress_tqdm(
+        total=size,
+        unit="B",
+        unit_scale=True,
+        unit_divisor=1024,
+        miniters=1,
+        desc=f"Downloading {download_to}",
+    ) as progress:
+        if ranges and size is not None and connections > 1:
+            md5 = _download_chunks(
+                url, part, size, connections, context, progress
+            )
+        else:
+            md5 = _download_stream(url, part, size, ranges, context, progress)
+
+    os.replace(part, download_to)
+    state_path = Path(f"{part}.json")
+    if state_path.exists():
+        state_path.unlink()
+    return md5
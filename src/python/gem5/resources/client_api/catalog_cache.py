@@ -0,0 +1,195 @@
+# Copyright (c) 2026 The Regents of the University of California
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met: redistributions of source code must retain the above copyright
+# notice, this list of conditions and the following disclaimer;
+# redistributions in binary form must reproduce the above copyright
+# notice, this list of conditions and the following disclaimer in the
+# documentation and/or other materials provided with the distribution;
+# neither the name of the copyright holders nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+# A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+# THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""
+An on-disk cache of downloaded resource catalogs.
+
+Loading a catalog from a URL means downloading it in every gem5 process.
+The cache keeps a copy of each downloaded catalog in
+``~/.cache/gem5/catalogs`` (or in the directory set by
+``GEM5_RESOURCE_CATALOG_CACHE``), keyed by its URL. The copies are plain
+JSON, as the directory may be shared with other users: a copy can't make
+the processes which read it run any code. Local catalogs are always read
+directly, as their cached copy would be no faster to read.
+
+* A cached copy is used for ``GEM5_RESOURCE_CATALOG_TTL`` seconds (one
+  day by default) after it was downloaded. Setting the TTL to 0 disables
+  the cache.
+* If ``GEM5_RESOURCE_CATALOG_OFFLINE`` is set, cached copies are
+  used however old they are, and the network is never accessed for them.
+  A stale copy is also used, with a warning, if the URL can't be reached.
+
+Entries are written atomically, and a lock makes sure that, when many
+processes start at once, the catalog is only fetched by one of them.
+"""
+
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+)
+
+from m5.util import warn
+
+from ...utils.filelock import FileLock
+
+DEFAULT_TTL = 24 * 60 * 60
+
+Resources = List[Dict[str, Any]]
+
+
+def cache_directory() -> Optional[Path]:
+    """
+    Return the directory of the catalog cache, or None if the cache is
+    disabled.
+    """
+    if cache_ttl() <= 0:
+        return None
+    if "GEM5_RESOURCE_CATALOG_CACHE" in os.environ:
+        return Path(os.environ["GEM5_RESOURCE_CATALOG_CACHE"])
+    return Path.home() / ".cache" / "gem5" / "catalogs"
+
+
+def cache_ttl() -> float:
+    """Return how long, in seconds, a downloaded catalog stays fresh."""
+    try:
+        return float(os.environ.get("GEM5_RESOURCE_CATALOG_TTL", DEFAULT_TTL))
+    except ValueError:
+        warn("Ignoring invalid GEM5_RESOURCE_CATALOG_TTL")
+        return DEFAULT_TTL
+
+
+def offline() -> bool:
+    return bool(os.environ.get("GEM5_RESOURCE_CATALOG_OFFLINE"))
+
+
+class CatalogCache:
+    """The cached copy of a single catalog."""
+
+    def __init__(self, source: str, directory: Path):
+        self.source = source
+        key = hashlib.sha256(source.encode()).hexdigest()[:32]
+        self.path = directory / f"{key}.json"
+
+    def load(self, max_age: Optional[float]) -> Optional[Resources]:
+        """
+        Return the cached catalog, or None if there is no usable copy.
+
+        :param max_age: The maximum age of the cached copy in seconds, or
+                        None to accept any age.
+        """
+        try:
+            with open(self.path, "rb") as f:
+                entry = json.load(f)
+            if entry["source"] != self.source:
+                return None
+            if max_age is not None and time.time() - entry["time"] > max_age:
+                return None
+            return entry["resources"]
+        except (OSError, ValueError, TypeError, KeyError):
+            return None
+
+    def store(self, resources: Resources) -> None:
+        """Atomically replace the cached catalog, ignoring any error."""
+        entry = {
+            "source": self.source,
+            "time": time.time(),
+            "resources": resources,
+        }
+        tmp = self.path.with_suffix(f".{os.getpid()}.tmp")
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp, "w") as f:
+                json.dump(entry, f, separators=(",", ":"))
+            os.replace(tmp, self.path)
+        except OSError as e:
+            warn(f"Could not cache the resource catalog '{self.source}': {e}")
+            try:
+                tmp.unlink()
+            except OSError:
+                pass
+
+    def lock(self) -> FileLock:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        return FileLock(str(self.path), timeout=600, delay=0.1)
+
+
+def load_catalog(
+    source: str,
+    local_path: Optional[Path],
+    fetch: Callable[[], Resources],
+) -> Resources:
+    """
+    Load a catalog through the cache.
+
+    :param source: The path or URL of the catalog, used as the cache key.
+    :param local_path: The local file holding the catalog, or None if the
+                       catalog is downloaded. Local catalogs are not cached.
+    :param fetch: Reads or downloads and parses the catalog.
+    """
+    directory = cache_directory()
+    if local_path is not None or directory is None:
+        return fetch()
+    cache = CatalogCache(source, directory)
+    max_age = None if offline() else cache_ttl()
+
+    resources = cache.load(max_age)
+    if resources is not None:
+        return resources
+
+    try:
+        lock = cache.lock()
+        lock.acquire()
+    except Exception:
+        # The cache directory isn't usable; read the catalog directly.
+        return fetch()
+    try:
+        # Another process may have fetched the catalog while we waited.
+        resources = cache.load(max_age)
+        if resources is not None:
+            return resources
+        try:
+            resources = fetch()
+        except ConnectionError:
+            stale = cache.load(None)
+            if stale is None:
+                raise
+            warn(
+                f"Could not reach '{source}', using the cached copy of "
+                "its resource catalog"
+            )
+            return stale
+        cache.store(resources)
+        return resources
+    finally:
+        lock.release()
@@ -43,6 +43,7 @@ from urllib.error import URLError
 from m5.util import warn
 
 from .abstract_client import AbstractClient
+from .catalog_cache import load_catalog
 from .client_query import ClientQuery
 
 
@@ -51,22 +52,41 @@ class JSONClient(AbstractClient):
         """
         Initializes a JSON client.
 
+        Downloaded catalogs are kept in an on-disk cache, see
+        :mod:`gem5.resources.client_api.catalog_cache`.
+
         :param path: The path to the Resource, either URL or local.
         """
         self.path = path
-        self.resources = []
+        self._by_id = None
+
+        local_path = None
+        if Path(path).is_file():
+            local_path = Path(path).resolve()
+        elif self._url_validator(path):
+            parsed_url = urllib.parse.urlparse(path)
+            if parsed_url.scheme == "file" and Path(parsed_url.path).is_file():
+                local_path = Path(parsed_url.path).resolve()
+
+        self.resources = load_catalog(
+            path, local_path, lambda: self._load(path)
+        )
+
+    def _load(self, path: str) -> List[Dict[str, Any]]:
+        """Reads and parses the JSON catalog at path."""
+        resources = []
 
         # Try loading as local file if it exists
         if Path(path).is_file():
             try:
                 with open(path, encoding="utf-8") as f:
-                    self.resources = json.load(f)
-                if not isinstance(self.resources, list):
+                    resources = json.load(f)
+                if not isinstance(resources, list):
                     raise ValueError(
                         f"Invalid JSON in file '{path}': "
                         "Top-level object must be a list"
                     )
-                return
+                return resources
             except json.JSONDecodeError as e:
                 raise ValueError(f"Invalid JSON in file '{path}': {e}")
             except Exception as e:
@@ -83,26 +103,24 @@ class JSONClient(AbstractClient):
                         raise FileNotFoundError(f"File not found: '{path}'")
 
                     with local_path.open("r", encoding="utf-8") as f:
-                        self.resources = json.load(f)
-                    if not isinstance(self.resources, list):
+                        resources = json.load(f)
+                    if not isinstance(resources, list):
                         raise ValueError(
                             f"Invalid JSON in file '{path}': "
                             "Top-level object must be a list"
                         )
-                    return
+                    return resources
 
                 # Handle HTTP/HTTPS URLs
                 req = request.Request(path)
                 with request.urlopen(req) as response:
-                    self.resources = json.loads(
-                        response.read().decode("utf-8")
-                    )
-                if not isinstance(self.resources, list):
+                    resources = json.loads(response.read().decode("utf-8"))
+                if not isinstance(resources, list):
                     raise ValueError(
                         f"Invalid JSON in file '{path}': "
                         "Top-level object must be a list"
                     )
-                return
+                return resources
 
             except URLError as e:
                 raise ConnectionError(f"Failed to access URL '{path}': {e}")
@@ -113,6 +131,17 @@ class JSONClient(AbstractClient):
 
         raise ValueError(f"'{path}' is not a valid file path or URL")
 
+    def _resources_by_id(self) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Returns the resources grouped by ID, in catalog order. The index is
+        built on first use.
+        """
+        if self._by_id is None:
+            self._by_id = {}
+            for resource in self.resources:
+                self._by_id.setdefault(resource["id"], []).append(resource)
+        return self._by_id
+
     def get_resources_json(self) -> List[Dict[str, Any]]:
         """Returns a JSON representation of the resources."""
         return self.resources
@@ -162,9 +191,17 @@ class JSONClient(AbstractClient):
 
             return False
 
+        # Only the resources with a queried ID can match.
+        by_id = self._resources_by_id()
+        candidates = []
+        for resource_id in dict.fromkeys(
+            query.get_resource_id() for query in client_queries
+        ):
+            candidates.extend(by_id.get(resource_id, []))
+
         filtered_resources = filter(
             lambda resource: filter_resource(resource, client_queries),
-            self.resources,
+            candidates,
         )
 
         resources_by_id = {}
@@ -25,6 +25,7 @@
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
 import gzip
+import hashlib
 import os
 import random
 import shutil
@@ -46,14 +47,13 @@ from m5.util import warn
 from _m5 import core
 
 from ..utils.filelock import FileLock
-from ..utils.progress_bar import (
-    progress_hook,
-    tqdm,
-)
 from ..utils.socks_ssl_context import get_proxy_context
+from .chunked_download import download_file
 from .client import get_resource_json_obj
 from .client import list_resources as client_list_resources
 from .md5_utils import (
+    cache_md5,
+    invalidate_md5_cache,
     md5_dir,
     md5_file,
 )
@@ -64,12 +64,18 @@ information about resources from resources.gem5.org.
 """
 
 
-def _download(url: str, download_to: str, max_attempts: int = 6) -> None:
+def _download(
+    url: str, download_to: str, max_attempts: int = 6, quiet: bool = False
+) -> str:
     """
     Downloads a file.
 
-    The function will run a Truncated Exponential Backoff algorithm to retry
-    the download if the HTTP Status Code returned is deemed retryable.
+    The download is resumable and, if the server supports HTTP Range
+    requests, large files are fetched in parallel chunks (see
+    ``gem5.resources.chunked_download``). The function will run a Truncated
+    Exponential Backoff algorithm to retry the download if the HTTP Status
+    Code returned is deemed retryable. Each retry resumes from where the
+    previous attempt stopped.
 
     :param url: The URL of the file to download.
 
@@ -78,6 +84,10 @@ def _download(url: str, download_to: str, max_attempts: int = 6) -> None:
     :param max_attempts: The max number of download attempts before stopping.
                          The default is 6. This translates to roughly 1 minute
                          of retrying before stopping.
+
+    :param quiet: If ``True``, no progress bar is shown.
+
+    :returns: The md5 of the downloaded file.
     """
 
     # TODO: This whole setup will only work for single files we can get via
@@ -90,34 +100,9 @@ def _download(url: str, download_to: str, max_attempts: int = 6) -> None:
         # number of download attempts has been reached or if a HTTP status code
         # other than 408, 429, or 5xx is received.
         try:
-            proxy_context = get_proxy_context()
-            if proxy_context:
-                # get the file as a bytes blob
-                request = urllib.request.Request(url)
-                with urllib.request.urlopen(
-                    request, context=proxy_context
-                ) as fr:
-                    with tqdm.wrapattr(
-                        open(download_to, "wb"),
-                        "write",
-                        miniters=1,
-                        desc="Downloading {download_to}",
-                        total=getattr(fr, "length", None),
-                    ) as fw:
-                        for chunk in fr:
-                            fw.write(chunk)
-            else:
-                with tqdm(
-                    unit="B",
-                    unit_scale=True,
-                    unit_divisor=1024,
-                    miniters=1,
-                    desc=f"Downloading {download_to}",
-                ) as t:
-                    urllib.request.urlretrieve(
-                        url, download_to, reporthook=progress_hook(t)
-                    )
-            return
+            return download_file(
+                url, download_to, context=get_proxy_context(), quiet=quiet
+            )
         except HTTPError as e:
             # If the error code retrieved is retryable, we retry using a
             # Truncated Exponential backoff algorithm, truncating after
@@ -154,7 +139,7 @@ def _download(url: str, download_to: str, max_attempts: int = 6) -> None:
             raise Exception(
                 f"ValueError: {e}\n"
                 "Environment variable GEM5_USE_PROXY is set to "
-                f"'{use_proxy}'. The expected form is "
+                f"'{os.getenv('GEM5_USE_PROXY')}'. The expected form is "
                 "<host>:<port>'."
             )
         except ImportError as e:
@@ -258,10 +243,12 @@ def get_resource(
         )
 
         if os.path.exists(to_path):
+            # The md5 is cached next to the resource, so an unchanged
+            # resource is not re-hashed on every call.
             if os.path.isfile(to_path):
-                md5 = md5_file(Path(to_path))
+                md5 = md5_file(Path(to_path), cached=True)
             else:
-                md5 = md5_dir(Path(to_path))
+                md5 = md5_dir(Path(to_path), cached=True)
 
             if md5 == resource_json.get("md5sum"):
                 # In this case, the file has already been download, no need to
@@ -398,9 +385,13 @@ def get_resource(
             # Get the URL.
             url = resource_json["url"]
 
-            _download(url=url, download_to=download_dest)
+            md5 = _download(url=url, download_to=download_dest, quiet=quiet)
             if not quiet:
                 print(f"Finished downloading resource '{resource_name}'.")
+            if not run_unzip and not run_tar_extract:
+                _check_downloaded_md5(
+                    resource_name, resource_json, to_path, md5
+                )
 
         if run_unzip:
             if not quiet:
@@ -409,11 +400,22 @@ def get_resource(
                     f"('{download_dest}')..."
                 )
             unzip_to = download_dest[: -len(zip_extension)]
+            # The md5 of the decompressed data is computed as it is written.
+            unzipped_md5 = hashlib.md5()
             with gzip.open(download_dest, "rb") as f:
                 with open(unzip_to, "wb") as o:
-                    shutil.copyfileobj(f, o)
+                    for block in iter(lambda: f.read(1024 * 1024), b""):
+                        o.write(block)
+                        unzipped_md5.update(block)
             os.remove(download_dest)
             download_dest = unzip_to
+            if not run_tar_extract and not file_uri_path:
+                _check_downloaded_md5(
+                    resource_name,
+                    resource_json,
+                    to_path,
+                    unzipped_md5.hexdigest(),
+                )
             if not quiet:
                 print(f"Finished decompressing resource '{resource_name}'.")
 
@@ -450,6 +452,30 @@ def get_resource(
             os.remove(download_dest)
 
 
+def _check_downloaded_md5(
+    resource_name: str, resource_json: Dict, path: str, md5: str
+) -> None:
+    """
+    Compares the md5 computed while downloading a resource with the md5sum
+    in its JSON. On a match, the md5 is cached so the next call to
+    ``get_resource`` does not need to re-hash the resource. On a mismatch,
+    any cached md5 is removed, so the next call re-hashes the resource and
+    downloads it again.
+    """
+    if "md5sum" not in resource_json:
+        return
+    if md5 == resource_json["md5sum"]:
+        cache_md5(Path(path), md5)
+    else:
+        invalidate_md5_cache(Path(path))
+        warn(
+            f"The md5sum of the downloaded resource '{resource_name}' "
+            f"({md5}) does not match the expected md5sum "
+            f"({resource_json['md5sum']}). Its md5sum will be computed again "
+            "the next time it is obtained."
+        )
+
+
 def _file_uri_to_path(uri: str) -> Optional[Path]:
     """
     If the URI uses the File scheme (e.g, ``file://host/path``) then
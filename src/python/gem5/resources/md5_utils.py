@@ -26,8 +26,30 @@
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
 import hashlib
+import json
+import os
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Type
+from typing import (
+    List,
+    Optional,
+    Tuple,
+    Type,
+)
+
+# The size of the blocks read from files while hashing.
+_BLOCK_SIZE = 1024 * 1024
+
+# Files up to this size are read whole by the thread pool when hashing a
+# directory. Larger files are streamed by the hashing thread.
+_READ_AHEAD_MAX_SIZE = 16 * 1024 * 1024
+
+# A cache entry is not written if the resource was modified less than this
+# many seconds ago, as a further modification within the resolution of the
+# file system timestamps would go unnoticed.
+_CACHE_MIN_AGE = 2.0
 
 
 def _md5_update_from_file(
@@ -35,7 +57,8 @@ def _md5_update_from_file(
 ) -> Type[hashlib.md5]:
     assert filename.is_file()
 
-    if filename.stat().st_size < 1024 * 1024 * 100:
+    size = filename.stat().st_size
+    if size < 1024 * 1024 * 100:
         from ..utils.progress_bar import FakeTQDM
 
         # if the file is less than 100MiB, no need to show a progress bar.
@@ -43,57 +66,204 @@ def _md5_update_from_file(
     else:
         from ..utils.progress_bar import tqdm
 
-    with tqdm.wrapattr(
-        open(str(filename), "rb"),
-        "read",
-        miniters=1,
-        desc=f"Computing md5sum on {filename}",
-        total=filename.stat().st_size,
-    ) as f:
-        for chunk in iter(lambda: f.read(4096), b""):
-            hash.update(chunk)
+    buffer = bytearray(_BLOCK_SIZE)
+    view = memoryview(buffer)
+    with open(str(filename), "rb", buffering=0) as f:
+        progress = tqdm(
+            total=size,
+            miniters=1,
+            desc=f"Computing md5sum on {filename}",
+        )
+        for n in iter(lambda: f.readinto(buffer), 0):
+            hash.update(view[:n])
+            progress.update(n)
+        progress.close()
     return hash
 
 
+def _list_dir(directory: Path) -> List[Path]:
+    """
+    Lists the files and directories under ``directory``, recursively, in the
+    order they are hashed by ``_md5_update_from_dir``.
+    """
+    paths = []
+    for path in sorted(directory.iterdir(), key=lambda p: str(p).lower()):
+        paths.append(path)
+        if path.is_dir():
+            paths.extend(_list_dir(path))
+    return paths
+
+
+def _read_small_file(path: Path) -> Optional[bytes]:
+    if path.is_file() and path.stat().st_size <= _READ_AHEAD_MAX_SIZE:
+        return path.read_bytes()
+    return None
+
+
 def _md5_update_from_dir(
-    directory: Path, hash: Type[hashlib.md5]
+    directory: Path, hash: Type[hashlib.md5], workers: Optional[int] = None
 ) -> Type[hashlib.md5]:
+    """
+    The digest is the md5 of the name of every entry, followed by its
+    contents if it is a file, walking the directory depth-first in
+    case-insensitive order. This is inherently sequential, so the thread pool
+    is used to read small files ahead of the hashing thread, overlapping the
+    I/O of many files. Only two reads per worker are in flight at once, which
+    bounds the memory held by files read but not yet hashed.
+    """
     assert directory.is_dir()
-    for path in sorted(directory.iterdir(), key=lambda p: str(p).lower()):
-        hash.update(path.name.encode())
-        if path.is_file():
-            hash = _md5_update_from_file(path, hash)
-        elif path.is_dir():
-            hash = _md5_update_from_dir(path, hash)
+    if workers is None:
+        # The default of ThreadPoolExecutor.
+        workers = min(32, (os.cpu_count() or 1) + 4)
+    read_ahead = 2 * workers
+    paths = _list_dir(directory)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        pending = deque(
+            executor.submit(_read_small_file, path)
+            for path in paths[:read_ahead]
+        )
+        for i, path in enumerate(paths):
+            content = pending.popleft().result()
+            if i + read_ahead < len(paths):
+                pending.append(
+                    executor.submit(_read_small_file, paths[i + read_ahead])
+                )
+            hash.update(path.name.encode())
+            if content is not None:
+                hash.update(content)
+            elif path.is_file():
+                hash = _md5_update_from_file(path, hash)
     return hash
 
 
-def md5(path: Path) -> str:
+def _cache_path(path: Path) -> Path:
+    return Path(f"{path}.md5cache")
+
+
+def _fingerprint(path: Path) -> Tuple[str, float]:
+    """
+    Returns a fingerprint of a file or directory made of the size,
+    modification time and inode of every file and directory it is made of,
+    along with the most recent modification time.
+    """
+    entries = [path] + (_list_dir(path) if path.is_dir() else [])
+    sha = hashlib.sha256()
+    latest = 0.0
+    for entry in entries:
+        stat = entry.stat()
+        latest = max(latest, stat.st_mtime)
+        sha.update(
+            f"{entry.relative_to(path)}\0{stat.st_size}\0{stat.st_mtime_ns}"
+            f"\0{stat.st_ino}\0{stat.st_dev}\n".encode()
+        )
+    return sha.hexdigest(), latest
+
+
+def _cached_md5(path: Path, compute) -> str:
+    """
+    Returns the md5 of ``path`` from the cache stored next to it if the
+    fingerprint of ``path`` is unchanged. Otherwise, the md5 is computed
+    with ``compute`` and the cache updated. Failing to read or write the
+    cache is not an error.
+    """
+    cache = _cache_path(path)
+    fingerprint, latest = _fingerprint(path)
+    try:
+        with open(cache) as f:
+            entry = json.load(f)
+        if entry.get("fingerprint") == fingerprint:
+            return entry["md5"]
+    except (OSError, ValueError, KeyError):
+        pass
+
+    md5 = compute()
+    if time.time() - latest >= _CACHE_MIN_AGE:
+        _write_cache(cache, fingerprint, md5)
+    return md5
+
+
+def _write_cache(cache: Path, fingerprint: str, md5: str) -> None:
+    try:
+        tmp = Path(f"{cache}.{os.getpid()}.tmp")
+        with open(tmp, "w") as f:
+            json.dump({"fingerprint": fingerprint, "md5": md5}, f)
+        os.replace(tmp, cache)
+    except OSError:
+        pass
+
+
+def cache_md5(path: Path, md5: str) -> None:
+    """
+    Records the md5 of a file or directory in the cache used by ``md5_file``
+    and ``md5_dir`` when ``cached`` is ``True``. This is used when the md5
+    is already known, e.g., because it was computed while the resource was
+    being downloaded.
+
+    As in ``md5_file`` and ``md5_dir``, nothing is recorded if ``path`` was
+    modified too recently for a further modification to be noticed.
+
+    :param path: The file or directory.
+
+    :param md5: The md5 of ``path``.
+    """
+    fingerprint, latest = _fingerprint(Path(path))
+    if time.time() - latest >= _CACHE_MIN_AGE:
+        _write_cache(_cache_path(Path(path)), fingerprint, md5)
+
+
+def invalidate_md5_cache(path: Path) -> None:
+    """
+    Removes the cached md5 of a file or directory, so that it is computed
+    again by the next call to ``md5_file`` or ``md5_dir``.
+
+    :param path: The file or directory.
+    """
+    try:
+        _cache_path(Path(path)).unlink()
+    except FileNotFoundError:
+        pass
+
+
+def md5(path: Path, cached: bool = False) -> str:
     """
     Gets the md5 value of a file or directory. ``md5_file`` is used if the path
     is a file and ``md5_dir`` is used if the path is a directory. An exception
     is returned if the path is not a valid file or directory.
 
     :param path: The path to get the md5 of.
+
+    :param cached: See ``md5_file`` and ``md5_dir``.
     """
     if path.is_file():
-        return md5_file(Path(path))
+        return md5_file(Path(path), cached=cached)
     elif path.is_dir():
-        return md5_dir(Path(path))
+        return md5_dir(Path(path), cached=cached)
     else:
         raise Exception(f"Path '{path}' is not a valid file or directory.")
 
 
-def md5_file(filename: Path) -> str:
+def md5_file(filename: Path, cached: bool = False) -> str:
     """
     Gives the md5 hash of a file.
 
     :filename: The file in which the md5 is to be calculated.
+
+    :param cached: If ``True``, the md5 is stored in a ``.md5cache`` file next
+                   to ``filename`` and reused as long as the size,
+                   modification time and inode of the file are unchanged.
     """
-    return str(_md5_update_from_file(filename, hashlib.md5()).hexdigest())
 
+    def compute() -> str:
+        return str(_md5_update_from_file(filename, hashlib.md5()).hexdigest())
+
+    if cached:
+        return _cached_md5(filename, compute)
+    return compute()
 
-def md5_dir(directory: Path) -> str:
+
+def md5_dir(
+    directory: Path, cached: bool = False, workers: Optional[int] = None
+) -> str:
     """
     Gives the md5 value of a directory.
 
@@ -103,5 +273,21 @@ def md5_dir(directory: Path) -> str:
 
         The path of files are also hashed so the md5 of the directory changes
         if empty files are included or filenames are changed.
+
+    :param cached: If ``True``, the md5 is stored in a ``.md5cache`` file next
+                   to ``directory`` and reused as long as the size,
+                   modification time and inode of every file and directory
+                   within it are unchanged.
+
+    :param workers: The number of threads used to read files. Defaults to the
+                    ``ThreadPoolExecutor`` default.
     """
-    return str(_md5_update_from_dir(directory, hashlib.md5()).hexdigest())
+
+    def compute() -> str:
+        return str(
+            _md5_update_from_dir(directory, hashlib.md5(), workers).hexdigest()
+        )
+
+    if cached:
+        return _cached_md5(directory, compute)
+    return compute()
@@ -1031,6 +1031,55 @@ def obtain_resource(
     )
 
 
+def prefetch_resources(
+    resources: List[AbstractResource], max_workers: int = 4
+) -> None:
+    """
+    Downloads the given resources concurrently, along with every resource
+    they refer to: the resources passed as parameters to a workload, and the
+    workloads of a suite. Resources which are already present locally, with
+    the correct md5sum, are not downloaded again.
+
+    Resources are otherwise only downloaded, one at a time, the first time
+    their local path is requested. Prefetching them ahead of time overlaps
+    these downloads.
+
+    .. code-block:: python
+
+        suite = obtain_resource("x86-getting-started-benchmark-suite")
+        prefetch_resources([suite])
+
+    :param resources: The resources to download.
+    :param max_workers: The maximum number of resources downloaded at once.
+    """
+    to_fetch: Dict[str, AbstractResource] = {}
+
+    def collect(resource: AbstractResource) -> None:
+        if isinstance(resource, SuiteResource):
+            for workload in resource:
+                collect(workload)
+        elif isinstance(resource, WorkloadResource):
+            for parameter in resource.get_parameters().values():
+                if isinstance(parameter, AbstractResource):
+                    collect(parameter)
+        if resource._downloader:
+            # Resources sharing a local path are only downloaded once.
+            to_fetch.setdefault(resource._local_path, resource)
+
+    for resource in resources:
+        collect(resource)
+
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        # Consuming the results raises the first exception, if any.
+        list(
+            executor.map(
+                lambda resource: resource.get_local_path(), to_fetch.values()
+            )
+        )
+
+
 def _resources_schema_validator(resource_json: Dict[str, Any]) -> None:
     """
     This function is used to validate the schema of the resource JSON object
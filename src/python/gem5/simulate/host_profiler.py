@@ -0,0 +1,308 @@
+# Copyright (c) 2026 The Regents of The University of California
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met: redistributions of source code must retain the above copyright
+# notice, this list of conditions and the following disclaimer;
+# redistributions in binary form must reproduce the above copyright
+# notice, this list of conditions and the following disclaimer in the
+# documentation and/or other materials provided with the distribution;
+# neither the name of the copyright holders nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+# A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+# THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""
+Host-time profiling of the Simulator's run loop.
+
+``Simulator.run()`` alternates between simulating (``m5.simulate()``) and
+handling exit events in Python. The profiler records, for every simulate
+call and every exit handler, the host wall time it took and the simulated
+ticks and committed instructions it covered. From these it derives the
+host simulation rate (ticks and instructions per host second) of every
+interval, which shows how much of a run is spent outside the C++
+simulation.
+
+Usage
+-----
+
+.. code-block::
+
+    simulator = Simulator(board=board)
+    profiler = simulator.enable_host_profiler()
+    simulator.run()
+
+    print(profiler.summary())
+    profiler.dump_json(Path(m5.options.outdir) / "host_profile.json")
+    profiler.dump_chrome_trace(Path(m5.options.outdir) / "host_trace.json")
+
+The Chrome trace can be opened in ``chrome://tracing`` or Perfetto.
+"""
+
+import json
+from pathlib import Path
+from time import perf_counter
+from typing import (
+    Any,
+    Dict,
+    List,
+    Optional,
+    Union,
+)
+
+
+class HostInterval:
+    """
+    A span of host time spent simulating or handling an exit event.
+    """
+
+    __slots__ = (
+        "kind",
+        "name",
+        "host_start",
+        "host_end",
+        "tick_start",
+        "tick_end",
+        "insts",
+    )
+
+    def __init__(
+        self,
+        kind: str,
+        name: str,
+        host_start: float,
+        host_end: float,
+        tick_start: int,
+        tick_end: int,
+        insts: int,
+    ) -> None:
+        """
+        :param kind: Either ``"simulate"`` or ``"handler"``.
+        :param name: A description of the interval, e.g., the exit handler.
+        :param host_start: The host time, in seconds, the interval began.
+        :param host_end: The host time, in seconds, the interval ended.
+        :param tick_start: The simulated tick the interval began.
+        :param tick_end: The simulated tick the interval ended.
+        :param insts: The number of instructions committed in the interval.
+        """
+        self.kind = kind
+        self.name = name
+        self.host_start = host_start
+        self.host_end = host_end
+        self.tick_start = tick_start
+        self.tick_end = tick_end
+        self.insts = insts
+
+    def host_seconds(self) -> float:
+        return self.host_end - self.host_start
+
+    def ticks(self) -> int:
+        return self.tick_end - self.tick_start
+
+    def ticks_per_second(self) -> float:
+        seconds = self.host_seconds()
+        return self.ticks() / seconds if seconds > 0 else 0.0
+
+    def kips(self) -> float:
+        """Thousands of committed instructions per host second."""
+        seconds = self.host_seconds()
+        return self.insts / seconds / 1000 if seconds > 0 else 0.0
+
+    def to_json(self) -> Dict[str, Any]:
+        return {
+            "kind": self.kind,
+            "name": self.name,
+            "host_start": self.host_start,
+            "host_seconds": self.host_seconds(),
+            "tick_start": self.tick_start,
+            "tick_end": self.tick_end,
+            "insts": self.insts,
+            "ticks_per_second": self.ticks_per_second(),
+            "kips": self.kips(),
+        }
+
+
+class HostProfiler:
+    """
+    Records the host time of the intervals of a Simulator's run loop.
+
+    Host times are stored relative to the creation of the profiler.
+    """
+
+    def __init__(self) -> None:
+        self._origin = perf_counter()
+        self.intervals: List[HostInterval] = []
+        self._open: Optional[tuple] = None
+
+    def _now(self) -> float:
+        return perf_counter() - self._origin
+
+    def begin(self, tick: int, insts: int) -> None:
+        """
+        Mark the beginning of an interval.
+
+        :param tick: The current simulated tick.
+        :param insts: The current committed instruction count.
+        """
+        self._open = (self._now(), tick, insts)
+
+    def end(self, kind: str, name: str, tick: int, insts: int) -> None:
+        """
+        Mark the end of the interval started by the last call to ``begin``.
+
+        :param kind: Either ``"simulate"`` or ``"handler"``.
+        :param name: A description of the interval.
+        :param tick: The current simulated tick.
+        :param insts: The current committed instruction count.
+        """
+        assert self._open is not None, "end() called without begin()"
+        host_start, tick_start, insts_start = self._open
+        self._open = None
+        # The instruction counts restart from zero when stats are reset.
+        committed = insts - insts_start if insts >= insts_start else insts
+        self.intervals.append(
+            HostInterval(
+                kind,
+                name,
+                host_start,
+                self._now(),
+                tick_start,
+                tick,
+                committed,
+            )
+        )
+
+    def totals(self) -> Dict[str, Dict[str, float]]:
+        """
+        Returns the total host seconds, ticks, instructions and number of
+        intervals of every kind.
+        """
+        totals = {}
+        for interval in self.intervals:
+            total = totals.setdefault(
+                interval.kind,
+                {"host_seconds": 0.0, "ticks": 0, "insts": 0, "count": 0},
+            )
+            total["host_seconds"] += interval.host_seconds()
+            total["ticks"] += interval.ticks()
+            total["insts"] += interval.insts
+            total["count"] += 1
+        return totals
+
+    def by_handler(self) -> Dict[str, Dict[str, float]]:
+        """
+        Returns the number of calls and the host seconds spent in each exit
+        handler.
+        """
+        handlers = {}
+        for interval in self.intervals:
+            if interval.kind != "handler":
+                continue
+            handler = handlers.setdefault(
+                interval.name, {"count": 0, "host_seconds": 0.0}
+            )
+            handler["count"] += 1
+            handler["host_seconds"] += interval.host_seconds()
+        return handlers
+
+    def summary(self) -> str:
+        """Returns a human readable summary of the profile."""
+        totals = self.totals()
+        simulate = totals.get("simulate", {})
+        handlers = totals.get("handler", {})
+        sim_seconds = simulate.get("host_seconds", 0.0)
+        handler_seconds = handlers.get("host_seconds", 0.0)
+        total_seconds = sim_seconds + handler_seconds
+        lines = [
+            "Host time profile",
+            f"  Simulating:        {sim_seconds:10.3f}s "
+            f"({simulate.get('count', 0)} calls)",
+            f"  In exit handlers:  {handler_seconds:10.3f}s "
+            f"({handlers.get('count', 0)} calls)",
+        ]
+        if total_seconds > 0:
+            lines.append(
+                "  Python overhead:   "
+                f"{100 * handler_seconds / total_seconds:10.1f}%"
+            )
+        if sim_seconds > 0:
+            lines.append(
+                "  Simulation rate:   "
+                f"{simulate['ticks'] / sim_seconds:10.4g} ticks/s, "
+                f"{simulate['insts'] / sim_seconds / 1000:.4g} KIPS"
+            )
+        for name, handler in sorted(
+            self.by_handler().items(),
+            key=lambda item: item[1]["host_seconds"],
+            reverse=True,
+        ):
+            lines.append(
+                f"  {handler['host_seconds']:10.3f}s "
+                f"{handler['count']:8d}  {name}"
+            )
+        return "\n".join(lines)
+
+    def to_json(self) -> Dict[str, Any]:
+        return {
+            "totals": self.totals(),
+            "intervals": [interval.to_json() for interval in self.intervals],
+        }
+
+    def to_chrome_trace(self) -> Dict[str, Any]:
+        """
+        Returns the intervals in the Chrome trace event format, with the
+        simulate calls and the exit handlers on separate tracks.
+        """
+        tids = {"simulate": 1, "handler": 2}
+        events = [
+            {
+                "name": "thread_name",
+                "ph": "M",
+                "pid": 1,
+                "tid": tid,
+                "args": {"name": kind},
+            }
+            for kind, tid in tids.items()
+        ]
+        for interval in self.intervals:
+            events.append(
+                {
+                    "name": interval.name,
+                    "cat": interval.kind,
+                    "ph": "X",
+                    "pid": 1,
+                    "tid": tids.get(interval.kind, 3),
+                    "ts": interval.host_start * 1e6,
+                    "dur": interval.host_seconds() * 1e6,
+                    "args": {
+                        "tick_start": interval.tick_start,
+                        "tick_end": interval.tick_end,
+                        "insts": interval.insts,
+                        "ticks_per_second": interval.ticks_per_second(),
+                        "kips": interval.kips(),
+                    },
+                }
+            )
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def dump_json(self, path: Union[str, Path]) -> None:
+        """Writes the profile to path as JSON."""
+        with open(path, "w") as f:
+            json.dump(self.to_json(), f, indent=2)
+
+    def dump_chrome_trace(self, path: Union[str, Path]) -> None:
+        """Writes the profile to path in the Chrome trace event format."""
+        with open(path, "w") as f:
+            json.dump(self.to_chrome_trace(), f)
@@ -0,0 +1,165 @@
+# Copyright (c) 2026 The Regents of The University of California
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met: redistributions of source code must retain the above copyright
+# notice, this list of conditions and the following disclaimer;
+# redistributions in binary form must reproduce the above copyright
+# notice, this list of conditions and the following disclaimer in the
+# documentation and/or other materials provided with the distribution;
+# neither the name of the copyright holders nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+# A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+# THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""
+Tick-periodic callbacks for the Simulator's run loop.
+
+Periodic work, such as sampling stats, reporting progress or logging a
+heartbeat, is usually done by scheduling an exit event for every period.
+Each of these exits is a round-trip from the C++ event loop to Python, and
+with short periods the round-trips can dominate the run time.
+
+Instead, the Simulator asks the scheduler for the next tick at which a
+callback must run and only simulates up to there. Callbacks may be given a
+``max_delay``: a callback may then run up to that many ticks after its
+deadline, which lets callbacks with nearby deadlines share a single exit.
+Callbacks that are due when the simulation exits for any other reason are
+run at that exit, without an exit of their own.
+"""
+
+from typing import (
+    TYPE_CHECKING,
+    Callable,
+    Dict,
+    List,
+    Optional,
+)
+
+if TYPE_CHECKING:
+    from .simulator import Simulator
+
+
+class PeriodicCallback:
+    """A callback run every ``period`` ticks."""
+
+    def __init__(
+        self,
+        period: int,
+        callback: Callable[["Simulator"], Optional[bool]],
+        max_delay: int = 0,
+        name: Optional[str] = None,
+    ) -> None:
+        """
+        :param period: The number of ticks between two calls.
+        :param callback: The function to call. It is passed the Simulator
+                         and may return True to exit the Simulator run loop.
+        :param max_delay: The number of ticks the call may be delayed by to
+                          share an exit with other callbacks.
+        :param name: A name for the callback, the function's name if None.
+        """
+        if period <= 0:
+            raise ValueError(f"The period must be positive, not {period}.")
+        if max_delay < 0:
+            raise ValueError(
+                f"The maximum delay cannot be negative, not {max_delay}."
+            )
+        self.period = period
+        self.callback = callback
+        self.max_delay = max_delay
+        self.name = name or getattr(callback, "__name__", repr(callback))
+        # The tick of the next call, set when the scheduler first sees it.
+        self.deadline: Optional[int] = None
+        self.calls = 0
+
+
+class PeriodicCallbackScheduler:
+    """
+    Keeps track of the deadlines of the periodic callbacks and of the
+    exits they needed.
+    """
+
+    def __init__(self) -> None:
+        self.callbacks: List[PeriodicCallback] = []
+        # Exits taken only to run callbacks.
+        self.exits = 0
+        self.calls = 0
+
+    def __len__(self) -> int:
+        return len(self.callbacks)
+
+    def add(self, callback: PeriodicCallback) -> None:
+        self.callbacks.append(callback)
+
+    def remove(self, callback: PeriodicCallback) -> None:
+        self.callbacks.remove(callback)
+
+    def next_stop(self, now: int) -> Optional[int]:
+        """
+        Returns the tick the simulation has to stop at to run the callbacks,
+        or None if there are no callbacks. This is now if a callback is
+        already late, e.g., because an exit handler simulated while draining.
+
+        :param now: The current tick.
+        """
+        stop = None
+        for callback in self.callbacks:
+            if callback.deadline is None:
+                callback.deadline = now + callback.period
+            latest = callback.deadline + callback.max_delay
+            if stop is None or latest < stop:
+                stop = latest
+        return stop if stop is None else max(stop, now)
+
+    def any_due(self, now: int) -> bool:
+        """Returns True if a callback's deadline has been reached."""
+        return any(
+            callback.deadline is not None and callback.deadline <= now
+            for callback in self.callbacks
+        )
+
+    def run_due(self, now: int, simulator: "Simulator") -> bool:
+        """
+        Runs every callback whose deadline has been reached and moves its
+        deadline to the next period after now.
+
+        :param now: The current tick.
+        :param simulator: The Simulator passed to the callbacks.
+
+        :returns: True if any callback asked to exit the run loop.
+        """
+        exit_loop = False
+        for callback in list(self.callbacks):
+            if callback.deadline is None or callback.deadline > now:
+                continue
+            periods = (now - callback.deadline) // callback.period + 1
+            callback.deadline += periods * callback.period
+            callback.calls += 1
+            self.calls += 1
+            if callback.callback(simulator):
+                exit_loop = True
+        return exit_loop
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Returns the number of callback calls, the number of exits taken to
+        run them, and the number of round-trips saved compared to an exit
+        per call.
+        """
+        return {
+            "callback_calls": self.calls,
+            "callback_exits": self.exits,
+            "round_trips_saved": self.calls - self.exits,
+        }
@@ -53,6 +53,11 @@ from .exit_handler import (
     ClassicGeneratorExitHandler,
     ExitHandler,
 )
+from .host_profiler import HostProfiler
+from .periodic_callbacks import (
+    PeriodicCallback,
+    PeriodicCallbackScheduler,
+)
 
 
 class Simulator:
@@ -214,6 +219,10 @@ class Simulator:
         # hit)
         self._exit_event_id_log = {}
 
+        self._host_profiler = None
+
+        self._periodic_callbacks = PeriodicCallbackScheduler()
+
     def switch_processor(self) -> None:
         """
         Switch the processor. This is a convenience function to call the
@@ -460,6 +469,85 @@ class Simulator:
         """
         return self._exit_event_id_log
 
+    def add_periodic_callback(
+        self,
+        period: int,
+        callback: Callable[["Simulator"], Optional[bool]],
+        max_delay: int = 0,
+        name: Optional[str] = None,
+    ) -> PeriodicCallback:
+        """
+        Run a callback every ``period`` ticks, e.g., to sample stats or
+        report progress, without scheduling an exit event for every call.
+
+        The ``run`` loop only simulates up to the next tick at which a
+        callback is due, and runs the callbacks that are due whenever the
+        simulation exits for another reason. Callbacks which may run a
+        little late can set ``max_delay``, letting callbacks with nearby
+        deadlines share one exit. Periods are counted from the first call
+        to ``run`` after the callback is added.
+
+        :param period: The number of ticks between two calls.
+        :param callback: The function to call. It is passed the Simulator
+                         and may return True to exit the run loop.
+        :param max_delay: The number of ticks a call may be delayed by.
+        :param name: A name for the callback.
+
+        :returns: The periodic callback, which can be passed to
+                  ``remove_periodic_callback``.
+        """
+        periodic_callback = PeriodicCallback(
+            period, callback, max_delay=max_delay, name=name
+        )
+        self._periodic_callbacks.add(periodic_callback)
+        return periodic_callback
+
+    def remove_periodic_callback(self, callback: PeriodicCallback) -> None:
+        """
+        Stop running a callback added with ``add_periodic_callback``.
+        """
+        self._periodic_callbacks.remove(callback)
+
+    def get_exit_batching_stats(self) -> Dict[str, int]:
+        """
+        Returns the number of periodic callback calls, the number of exits
+        taken to run them, and the number of C++ to Python round-trips saved
+        compared to taking an exit for every call.
+        """
+        return self._periodic_callbacks.stats()
+
+    def enable_host_profiler(self) -> HostProfiler:
+        """
+        Enable the host-time profiler. From then on, every ``m5.simulate()``
+        call and every exit handler executed by ``run`` is recorded with the
+        host wall time it took, and the ticks and instructions it covered.
+        See ``gem5.simulate.host_profiler`` for how to export the profile.
+
+        :returns: The profiler.
+        """
+        if self._host_profiler is None:
+            self._host_profiler = HostProfiler()
+        return self._host_profiler
+
+    def get_host_profiler(self) -> Optional[HostProfiler]:
+        """
+        Returns the host-time profiler, or None if it is not enabled.
+        """
+        return self._host_profiler
+
+    def _profile_point(self) -> Tuple[int, int]:
+        """
+        Returns the current tick and committed instruction count for the
+        host-time profiler.
+        """
+        try:
+            insts = self.get_instruction_count()
+        except NotImplementedError:
+            # Some cores, e.g., traffic generators, do not count
+            # instructions.
+            insts = 0
+        return self.get_current_tick(), insts
+
     def show_exit_event_messages(self) -> None:
         """
         Show exit event messages. This will print the exit event messages to
@@ -559,30 +647,87 @@ class Simulator:
         # We instantiate the board if it has not already been instantiated.
         self._instantiate()
 
+        profiler = self._host_profiler
+        periodic = self._periodic_callbacks
+        # The map is updated in place as handlers are defined, so it only
+        # needs to be looked up once.
+        handler_map = self.get_exit_handler_id_map()
+        # The tick the current simulation run is limited to. Stops made to
+        # run periodic callbacks do not restart the count.
+        limit = None
+
         # This while loop will continue until an a generator yields True.
         while True:
-            self._last_exit_event = m5.simulate(self.get_max_ticks())
+            if periodic:
+                # Exit handlers which drain the system simulate, and may
+                # have gone past the deadlines of some callbacks.
+                if self._run_periodic_callbacks():
+                    return
+                now = self.get_current_tick()
+                if limit is None:
+                    limit = min(now + self.get_max_ticks(), m5.MaxTick)
+                stop = min(periodic.next_stop(now), limit)
+                ticks = stop - now
+            else:
+                stop = None
+                ticks = self.get_max_ticks()
+
+            if profiler is not None:
+                profiler.begin(*self._profile_point())
+            self._last_exit_event = m5.simulate(ticks)
+            if profiler is not None:
+                profiler.end(
+                    "simulate",
+                    self._last_exit_event.getCause(),
+                    *self._profile_point(),
+                )
+
+            exit_on_completion = False
+            if periodic:
+                if (
+                    stop < limit
+                    and self.get_current_tick() == stop
+                    and self._last_exit_event.getCause()
+                    == "simulate() limit reached"
+                ):
+                    # We only stopped to run the periodic callbacks.
+                    periodic.exits += 1
+                    if self._run_periodic_callbacks():
+                        return
+                    continue
+                limit = None
+                # Run the callbacks that are due along with the exit event.
+                exit_on_completion = self._run_periodic_callbacks()
+
             exit_event_hypercall_id = self._last_exit_event.getHypercallId()
-            if (
-                exit_event_hypercall_id
-                not in self.get_exit_handler_id_map().keys()
-            ):
+            if exit_event_hypercall_id not in handler_map:
                 warn(
                     f"Warning: Exit event type ID "
                     f"{self._last_exit_event.getHypercallId()} "
                     f"not in exit handler ID map. Reentering simulation loop."
                 )
+                if exit_on_completion:
+                    return
                 continue
-            exit_handler = self.get_exit_handler_id_map()[
-                exit_event_hypercall_id
-            ](self._last_exit_event.getPayload())
+            exit_handler = handler_map[exit_event_hypercall_id](
+                self._last_exit_event.getPayload()
+            )
 
             if m5.options.show_exit_event_messages:
                 print(
                     f"Exit event: {exit_handler.get_handler_description()} called at tick {self.get_current_tick()}"
                 )
 
-            exit_on_completion = exit_handler.handle(self)
+            if profiler is not None:
+                profiler.begin(*self._profile_point())
+            if exit_handler.handle(self):
+                exit_on_completion = True
+            if profiler is not None:
+                profiler.end(
+                    "handler",
+                    exit_handler.get_handler_description(),
+                    *self._profile_point(),
+                )
             self._exit_event_id_log[self.get_current_tick()] = (
                 exit_handler.get_handler_description()
             )
@@ -592,6 +737,25 @@ class Simulator:
             if exit_on_completion:
                 return
 
+    def _run_periodic_callbacks(self) -> bool:
+        """
+        Runs the periodic callbacks that are due.
+
+        :returns: True if a callback asked to exit the run loop.
+        """
+        now = self.get_current_tick()
+        if not self._periodic_callbacks.any_due(now):
+            return False
+        profiler = self._host_profiler
+        if profiler is not None:
+            profiler.begin(*self._profile_point())
+        exit_loop = self._periodic_callbacks.run_due(now, self)
+        if profiler is not None:
+            profiler.end(
+                "handler", "periodic callbacks", *self._profile_point()
+            )
+        return exit_loop
+
     def save_checkpoint(self, checkpoint_dir: Path) -> None:
         """
         This function will save the checkpoint to the specified directory.
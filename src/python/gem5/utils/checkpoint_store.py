@@ -0,0 +1,368 @@
+# Copyright (c) 2026 The Regents of the University of California
+# All Rights Reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met: redistributions of source code must retain the above copyright
+# notice, this list of conditions and the following disclaimer;
+# redistributions in binary form must reproduce the above copyright
+# notice, this list of conditions and the following disclaimer in the
+# documentation and/or other materials provided with the distribution;
+# neither the name of the copyright holders nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+# A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+# THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+
+"""A content-addressed store for the memory images of checkpoints.
+
+Checkpoints taken at short intervals of the same run (e.g., the slices of
+a sliced run) contain full physical memory images, ``*.pmem``, which mostly
+hold the same data. Packing a checkpoint into the store splits each memory
+image into fixed size chunks, a multiple of the page size, and stores every
+chunk under the hash of its content. Chunks which are already in the store,
+e.g., because a previous checkpoint contains the same pages, are not stored
+again, and all-zero chunks are not stored at all. The memory image in the
+checkpoint directory is then replaced by a small manifest,
+``<image>.chunks``, listing the chunks of the image.
+
+Packed checkpoints can't be restored as is. ``materialize()`` creates a
+restorable copy of a packed checkpoint by writing its memory images
+uncompressed, which gem5 reads directly as well. Chunks are decompressed
+and written in parallel, which makes this considerably faster than
+restoring from a gzip-compressed image.
+
+Chunks are never removed when checkpoints are deleted; ``gc()`` removes the
+chunks which aren't referenced by any of the given checkpoints. It must not
+run while checkpoints are being packed into the same store.
+
+The store has the following layout:
+
+.. code-block::
+
+    <store>/objects/<first two hex digits>/<hash>
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import (
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
+
+PAGE_SIZE = 4096
+DEFAULT_CHUNK_SIZE = 16 * PAGE_SIZE
+MANIFEST_SUFFIX = ".chunks"
+MANIFEST_VERSION = 1
+
+# The number of chunks handed to the worker threads at a time
+_WINDOW = 256
+
+
+def _is_gzip(path: Path) -> bool:
+    with open(path, "rb") as f:
+        return f.read(2) == b"\x1f\x8b"
+
+
+def _open_image(path: Path):
+    # gem5 writes gzip-compressed memory images but reads uncompressed ones
+    # too, so both can appear in a checkpoint.
+    if _is_gzip(path):
+        return gzip.open(path, "rb")
+    return open(path, "rb")
+
+
+def _read_chunks(image, chunk_size: int) -> Iterator[bytes]:
+    while True:
+        chunk = image.read(chunk_size)
+        if not chunk:
+            return
+        yield chunk
+
+
+def _windows(iterable: Iterable, size: int) -> Iterator[List]:
+    window = []
+    for item in iterable:
+        window.append(item)
+        if len(window) == size:
+            yield window
+            window = []
+    if window:
+        yield window
+
+
+def is_packed(checkpoint_dir: Path) -> bool:
+    """Returns whether any memory image of a checkpoint is packed into a
+    store.
+
+    :param checkpoint_dir: The checkpoint directory.
+    """
+    return any(Path(checkpoint_dir).glob(f"*{MANIFEST_SUFFIX}"))
+
+
+class CheckpointStore:
+    """A content-addressed store of checkpoint memory chunks."""
+
+    def __init__(
+        self,
+        path: Path,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        compression_level: int = 1,
+        workers: Optional[int] = None,
+    ):
+        """
+        :param path: The directory of the store. It is created if needed.
+        :param chunk_size: The size of the chunks memory images are split
+        into when packing. It must be a multiple of the page size.
+        :param compression_level: The zlib compression level of the stored
+        chunks. Restoring is fastest with low levels.
+        :param workers: The number of threads used to hash, compress and
+        decompress chunks. Defaults to the number of CPUs.
+        """
+        if chunk_size <= 0 or chunk_size % PAGE_SIZE:
+            raise ValueError(
+                f"The chunk size must be a multiple of {PAGE_SIZE} bytes."
+            )
+        self.path = Path(path)
+        self.chunk_size = chunk_size
+        self.compression_level = compression_level
+        self.workers = workers or os.cpu_count() or 1
+        self._objects = self.path / "objects"
+        self._objects.mkdir(parents=True, exist_ok=True)
+
+    def _object_path(self, digest: str) -> Path:
+        return self._objects / digest[:2] / digest
+
+    def _put(self, chunk: bytes) -> Tuple[str, bool]:
+        """Stores a chunk if it isn't already stored.
+
+        :returns: The hash of the chunk, empty for all-zero chunks, and
+        whether it was newly stored.
+        """
+        if chunk.count(0) == len(chunk):
+            return "", False
+        digest = hashlib.blake2b(chunk, digest_size=20).hexdigest()
+        # Chunks of different sizes are different objects even if one is a
+        # prefix of the other, so make the size part of the name.
+        digest = f"{digest}-{len(chunk):x}"
+        path = self._object_path(digest)
+        if path.exists():
+            return digest, False
+        path.parent.mkdir(exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(zlib.compress(chunk, self.compression_level))
+            os.replace(tmp, path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+        return digest, True
+
+    def _get(self, digest: str) -> bytes:
+        return zlib.decompress(self._object_path(digest).read_bytes())
+
+    def pack_image(self, image_path: Path) -> Tuple[int, int]:
+        """Packs a single memory image into the store, replacing it with a
+        manifest.
+
+        :param image_path: The path of the memory image.
+
+        :returns: The number of chunks of the image and the number of chunks
+        which were newly stored.
+        """
+        image_path = Path(image_path)
+        manifest_path = image_path.with_name(image_path.name + MANIFEST_SUFFIX)
+        chunks: List[str] = []
+        stored = 0
+        size = 0
+        with _open_image(image_path) as image, ThreadPoolExecutor(
+            self.workers
+        ) as pool:
+            for window in _windows(
+                _read_chunks(image, self.chunk_size), _WINDOW
+            ):
+                size += sum(len(chunk) for chunk in window)
+                for digest, new in pool.map(self._put, window):
+                    chunks.append(digest)
+                    stored += new
+
+        manifest = {
+            "version": MANIFEST_VERSION,
+            "size": size,
+            "chunk_size": self.chunk_size,
+            "store": os.path.relpath(self.path, image_path.parent),
+            "chunks": chunks,
+        }
+        tmp = manifest_path.with_name(manifest_path.name + ".tmp")
+        with open(tmp, "w") as f:
+            json.dump(manifest, f)
+        os.replace(tmp, manifest_path)
+        image_path.unlink()
+        return len(chunks), stored
+
+    def pack(self, checkpoint_dir: Path) -> Tuple[int, int]:
+        """Packs all the memory images of a checkpoint into the store.
+
+        :param checkpoint_dir: The checkpoint directory.
+
+        :returns: The total number of chunks of the checkpoint's images and
+        the number of chunks which were newly stored.
+        """
+        total = stored = 0
+        for image in sorted(Path(checkpoint_dir).glob("*.pmem")):
+            image_total, image_stored = self.pack_image(image)
+            total += image_total
+            stored += image_stored
+        return total, stored
+
+    def referenced(self, checkpoint_dirs: Iterable[Path]) -> Set[str]:
+        """Returns the hashes of the chunks referenced by the packed
+        checkpoints in, or below, the given directories.
+        """
+        digests = set()
+        for directory in checkpoint_dirs:
+            for manifest_path in Path(directory).rglob(f"*{MANIFEST_SUFFIX}"):
+                manifest = _load_manifest(manifest_path)
+                digests.update(manifest["chunks"])
+        digests.discard("")
+        return digests
+
+    def gc(self, checkpoint_dirs: Iterable[Path]) -> Tuple[int, int]:
+        """Removes the chunks which aren't referenced by any of the packed
+        checkpoints in, or below, the given directories.
+
+        :returns: The number of chunks removed and the number of bytes freed.
+        """
+        live = self.referenced(checkpoint_dirs)
+        removed = freed = 0
+        for path in self._objects.glob("*/*"):
+            if path.name in live:
+                continue
+            if path.name.startswith(".tmp-"):
+                # A chunk which is being written by an interrupted or
+                # concurrent pack.
+                continue
+            freed += path.stat().st_size
+            path.unlink()
+            removed += 1
+        return removed, freed
+
+
+def _load_manifest(path: Path) -> dict:
+    with open(path) as f:
+        manifest = json.load(f)
+    if manifest.get("version") != MANIFEST_VERSION:
+        raise ValueError(f"Unsupported checkpoint manifest version in {path}")
+    return manifest
+
+
+def unpack_image(
+    manifest_path: Path, image_path: Path, workers: Optional[int] = None
+) -> None:
+    """Writes the uncompressed memory image described by a manifest.
+
+    :param manifest_path: The path of the manifest.
+    :param image_path: The path of the memory image to write.
+    :param workers: The number of threads decompressing and writing chunks.
+    """
+    manifest_path = Path(manifest_path)
+    manifest = _load_manifest(manifest_path)
+    store = CheckpointStore(
+        manifest_path.parent / manifest["store"],
+        chunk_size=manifest["chunk_size"],
+        workers=workers,
+    )
+    chunk_size = manifest["chunk_size"]
+
+    fd = os.open(image_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        # All-zero chunks are left as holes in the (sparse) image.
+        os.ftruncate(fd, manifest["size"])
+
+        def write(job):
+            index, digest = job
+            os.pwrite(fd, store._get(digest), index * chunk_size)
+
+        jobs = [
+            (index, digest)
+            for index, digest in enumerate(manifest["chunks"])
+            if digest
+        ]
+        with ThreadPoolExecutor(store.workers) as pool:
+            # Consume the results to propagate any exception
+            for _ in pool.map(write, jobs):
+                pass
+    finally:
+        os.close(fd)
+
+
+def unpack(checkpoint_dir: Path, workers: Optional[int] = None) -> None:
+    """Unpacks the memory images of a packed checkpoint in place, making it
+    a regular checkpoint again. The chunks stay in the store.
+
+    :param checkpoint_dir: The checkpoint directory.
+    :param workers: The number of threads decompressing and writing chunks.
+    """
+    for manifest_path in sorted(
+        Path(checkpoint_dir).glob(f"*{MANIFEST_SUFFIX}")
+    ):
+        image_path = manifest_path.with_name(
+            manifest_path.name[: -len(MANIFEST_SUFFIX)]
+        )
+        unpack_image(manifest_path, image_path, workers)
+        manifest_path.unlink()
+
+
+def materialize(
+    checkpoint_dir: Path, destination: Path, workers: Optional[int] = None
+) -> Path:
+    """Creates a restorable copy of a packed checkpoint, leaving the packed
+    checkpoint untouched.
+
+    :param checkpoint_dir: The packed checkpoint directory.
+    :param destination: The directory of the copy. It is replaced if it
+    already exists.
+    :param workers: The number of threads decompressing and writing chunks.
+
+    :returns: The directory of the copy.
+    """
+    checkpoint_dir = Path(checkpoint_dir)
+    destination = Path(destination)
+    if destination.exists():
+        shutil.rmtree(destination)
+    destination.mkdir(parents=True)
+    for path in sorted(checkpoint_dir.iterdir()):
+        if path.name.endswith(MANIFEST_SUFFIX):
+            unpack_image(
+                path,
+                destination / path.name[: -len(MANIFEST_SUFFIX)],
+                workers,
+            )
+        elif path.is_dir():
+            shutil.copytree(path, destination / path.name)
+        else:
+            shutil.copy2(path, destination / path.name)
+    return destination
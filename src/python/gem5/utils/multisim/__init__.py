@@ -26,8 +26,10 @@
 
 from .multisim import (
     add_simulator,
+    get_multisim_info,
     get_simulator_ids,
     num_simulators,
     run,
+    set_memory_limit,
     set_num_processes,
 )
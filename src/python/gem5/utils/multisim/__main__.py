@@ -29,6 +29,7 @@ This module is the entry point for the multi-simulation (MultiSim) framework.
 It provides a CLI using argparse to obtain the path to the simulation
 configuration script and the number of processes to run in parallel.
 """
+
 from gem5.utils.multisim.multisim import (
     module_run,
     run,
@@ -52,8 +53,15 @@ def main():
         help="The path to the config script specifying the simulations to run using multisim.",
     )
 
+    parser.add_argument(
+        "--no-resume",
+        action="store_true",
+        help="Run every simulation, including those the job ledger in the "
+        "output directory records as already completed.",
+    )
+
     args = parser.parse_args()
-    run(module_path=Path(args.config))
+    run(module_path=Path(args.config), resume=not args.no_resume)
 
 
 if __name__ == "__m5_main__":
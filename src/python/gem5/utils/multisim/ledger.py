@@ -0,0 +1,145 @@
+# Copyright (c) 2026 The Regents of the University of California
+# All Rights Reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met: redistributions of source code must retain the above copyright
+# notice, this list of conditions and the following disclaimer;
+# redistributions in binary form must reproduce the above copyright
+# notice, this list of conditions and the following disclaimer in the
+# documentation and/or other materials provided with the distribution;
+# neither the name of the copyright holders nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+# A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+# THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+
+"""A persistent record of the simulations run by a MultiSim sweep.
+
+The ledger is stored as a JSON Lines file in the sweep's output directory.
+A line is appended every time a simulation finishes, so the ledger survives
+the sweep being killed. When the sweep is rerun, simulations whose last
+entry completed successfully with the same config hash are skipped.
+"""
+
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+from typing import (
+    Dict,
+    Iterable,
+    List,
+    Optional,
+)
+
+LEDGER_FILENAME = "multisim-ledger.jsonl"
+
+
+def config_hash(config_path: Path, id: str) -> str:
+    """Returns the hash identifying the configuration of a simulation: the
+    contents of the config script and the ID of the simulator. Any change to
+    the config script therefore invalidates every entry for that sweep.
+
+    :param config_path: The path to the MultiSim config script.
+    :param id: The ID of the simulator.
+    """
+    sha = hashlib.sha256()
+    sha.update(Path(config_path).read_bytes())
+    sha.update(b"\0")
+    sha.update(id.encode())
+    return sha.hexdigest()
+
+
+class JobLedger:
+    """The ledger of a MultiSim sweep's output directory."""
+
+    def __init__(self, outdir: Path):
+        """
+        :param outdir: The output directory of the sweep. The ledger is
+        stored in this directory.
+        """
+        self._path = Path(outdir) / LEDGER_FILENAME
+        self._entries: Dict[str, Dict] = {}
+        if self._path.exists():
+            with open(self._path) as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except json.JSONDecodeError:
+                        # A partially written line, from the sweep being
+                        # killed while writing.
+                        continue
+                    # The latest entry for a simulation takes precedence.
+                    self._entries[entry["id"]] = entry
+
+    def get_path(self) -> Path:
+        return self._path
+
+    def get_entry(self, id: str) -> Optional[Dict]:
+        """Returns the latest entry recorded for a simulation, if any."""
+        return self._entries.get(id)
+
+    def is_complete(self, id: str, config_hash: str) -> bool:
+        """Returns `True` if the simulation's latest entry is a successful
+        run with the same config hash.
+        """
+        entry = self._entries.get(id)
+        return (
+            entry is not None
+            and entry["status"] == "completed"
+            and entry["config_hash"] == config_hash
+        )
+
+    def pending(self, ids: Iterable[str], hashes: Dict[str, str]) -> List[str]:
+        """Returns the IDs, in order, which still need to be run: those which
+        failed, never finished, or whose config hash changed.
+
+        :param ids: The IDs of the simulations in the sweep.
+        :param hashes: The config hash of each simulation, keyed by ID.
+        """
+        return [id for id in ids if not self.is_complete(id, hashes[id])]
+
+    def record(
+        self, id: str, config_hash: str, exitcode: int, wall_time: float
+    ) -> None:
+        """Appends an entry for a finished simulation.
+
+        :param id: The ID of the simulator.
+        :param config_hash: The config hash of the simulation.
+        :param exitcode: The exit code of the simulation's process.
+        :param wall_time: The wall time, in seconds, the simulation ran for.
+        """
+        entry = {
+            "id": id,
+            "config_hash": config_hash,
+            "status": "completed" if exitcode == 0 else "failed",
+            "exitcode": exitcode,
+            "wall_time": wall_time,
+            "finished": time.time(),
+        }
+        line = json.dumps(entry) + "\n"
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self._path, "a+b") as f:
+            # Start a new line if the last one was cut short by the sweep
+            # being killed while writing it.
+            if f.seek(0, os.SEEK_END) > 0:
+                f.seek(-1, os.SEEK_END)
+                if f.read(1) != b"\n":
+                    line = "\n" + line
+            f.write(line.encode())
+            f.flush()
+            os.fsync(f.fileno())
+        self._entries[id] = entry
@@ -51,17 +51,29 @@ This script is then passed to the child processes to load.
 
 import importlib
 import multiprocessing
+import multiprocessing.connection
+import os
 import signal
+import sys
 import time
 from multiprocessing import Lock
 from pathlib import Path
 from typing import (
+    Dict,
     Optional,
     Set,
+    Tuple,
+    Union,
 )
 
 from m5.core import override_re_outdir
 from m5.util import inform
+from m5.util.convert import toMemorySize
+
+from .ledger import (
+    JobLedger,
+    config_hash,
+)
 
 # A global variable which __main__.py flips to `True` when multisim is run as
 # an executable module.
@@ -75,6 +87,14 @@ _num_processes = None
 
 _multi_sim: Set["Simulator"] = set()
 
+# The estimated memory footprint, in bytes, and runtime, in seconds, of each
+# simulator, keyed by simulator id. Either may be `None` if unknown.
+_estimates: Dict[str, Tuple[Optional[int], Optional[float]]] = {}
+
+# The total memory, in bytes, available to the simulations. If `None` and
+# memory estimates are given, the physical memory of the host is used.
+_memory_limit: Optional[int] = None
+
 
 def _load_module(module_path: Path) -> None:
     """Load the module at the given path."""
@@ -85,79 +105,74 @@ def _load_module(module_path: Path) -> None:
     spec.loader.exec_module(modulevar)
 
 
-def _get_simulator_ids_child_process(id_list, module_path: Path) -> None:
-    """Get the ids of the simulations to be run.
+def _get_multisim_info_child_process(info_dict, module_path: Path) -> None:
+    """Get the ids of the simulations to be run, the maximum number of
+    processes, and the resource estimates of each simulation.
 
     This function is passed to the Python multiprocessing module and run with
-    the correct module path in the `_get_simulator_ids` function. This function
-    is run in a child process which loads the module (config script) then reads
-    the IDs.
+    the correct module path in the `get_multisim_info` function. This function
+    is run in a child process which loads the module (config script) once then
+    reads everything the scheduler needs.
 
     Note: We run this as child process as we cannot load the config script as
-    a module in the main process. This function is used in
-    `get_simulator_ids` and should be used separately.
+    a module in the main process.
     """
 
     _load_module(module_path)
-    global _multi_sim
-    if len(id_list) != 0:
-        id_list *= 0
-    id_list.extend([sim.get_id() for sim in _multi_sim])
-
+    global _multi_sim, _num_processes, _estimates, _memory_limit
+    info_dict["ids"] = [sim.get_id() for sim in _multi_sim]
+    info_dict["num_processes"] = _num_processes
+    info_dict["estimates"] = dict(_estimates)
+    info_dict["memory_limit"] = _memory_limit
+
+
+def get_multisim_info(config_module_path: Path) -> dict:
+    """This is a hack to determine the simulations we are to run and how to
+    schedule them. The only way we can know is by importing the module, which
+    we can only do in a child process. We therefore create a child process
+    with the sole purpose of importing the module and returning the
+    information via a `multiprocessing.Manager` dictionary.
+
+    :returns: A dictionary with the simulator "ids", the "num_processes" set
+    by the config script, the per-simulator resource "estimates" and the
+    "memory_limit" set by the config script.
+    """
 
-def _get_num_processes_child_process(
-    num_processes_dict, module_path: Path
-) -> None:
-    """Get the ids of the simulations to be run.
+    manager = multiprocessing.Manager()
+    info_dict = manager.dict()
+    p = multiprocessing.Process(
+        target=_get_multisim_info_child_process,
+        args=(info_dict, config_module_path),
+    )
+    p.start()
+    p.join()
+    info = dict(info_dict)
+    manager.shutdown()
+    return info
 
-    This function is passed to the Python multiprocessing module and run with
-    the correct module path in the `_get_simulator_ids` function. This function
-    is run in a child process which loads the module (config script) then reads
-    the IDs.
 
-    Note: We run this as child process as we cannot load the config script as
-    a module in the main process. This function is used in
-    `get_simulator_ids` and should be used separately.
+def get_simulator_ids(config_module_path: Path) -> list[str]:
+    """Returns the IDs of the simulations in the config script. See
+    `get_multisim_info`.
     """
 
-    _load_module(module_path)
-    global _num_processes
-    num_processes_dict["num_processes"] = _num_processes
+    return get_multisim_info(config_module_path)["ids"]
 
 
-def get_simulator_ids(config_module_path: Path) -> list[str]:
-    """This is a  hack to determine the IDs of the simulations we are to run.
-    The only way we can know is by importing the module, which we can only do
-    in the child processes. We therefore create a child process with the
-    sole purpose of importing the module and returning the IDs via
-    a `multiprocessing.Manager` dictionary.
-
-    This function handles the creation of the `multiprocessing.Manager` and the
-    `multiprocessing.Process`. It then waits for the process to finish to then
-    return the ids as a set of strings.
+def get_num_processes(config_module_path: Path) -> Optional[int]:
+    """Returns the number of processes set by the config script. See
+    `get_multisim_info`.
     """
 
-    manager = multiprocessing.Manager()
-    id_list = manager.list()
-    p = multiprocessing.Process(
-        target=_get_simulator_ids_child_process,
-        args=(id_list, config_module_path),
-    )
-    p.start()
-    p.join()
-    return id_list
+    return get_multisim_info(config_module_path)["num_processes"]
 
 
-def get_num_processes(config_module_path: Path) -> Optional[int]:
-    manager = multiprocessing.Manager()
-    num_processes_dict = manager.dict()
-    p = multiprocessing.Process(
-        target=_get_num_processes_child_process,
-        args=(num_processes_dict, config_module_path),
-    )
-    p.start()
-    p.join()
-    return num_processes_dict["num_processes"]
+def _available_memory() -> Optional[int]:
+    """Returns the physical memory of the host in bytes, if known."""
+    try:
+        return os.sysconf("SC_PAGE_SIZE") * os.sysconf("SC_PHYS_PAGES")
+    except (ValueError, OSError, AttributeError):
+        return None
 
 
 def _run(module_path: Path, id: str) -> None:
@@ -180,15 +195,33 @@ def _run(module_path: Path, id: str) -> None:
         sim_list[0].run()
     except Exception as e:
         inform(f"Error running simulator {id}: {e}")
+        # Exit with a non-zero code so the failure is recorded in the ledger.
+        sys.exit(1)
 
 
-def run(module_path: Path, processes: Optional[int] = None) -> None:
+def run(
+    module_path: Path, processes: Optional[int] = None, resume: bool = True
+) -> None:
     """Run the simulators specified in the module in parallel.
 
+    A new simulation is started as soon as a running one finishes. If the
+    config script gives runtime estimates (see `add_simulator`), the longest
+    simulations are started first. If it gives memory estimates, simulations
+    are only started while their combined estimates fit in the memory limit
+    (see `set_memory_limit`).
+
+    The outcome of every simulation is recorded in a ledger in the output
+    directory (see `gem5.utils.multisim.ledger`). When resuming, simulations
+    which already completed successfully with an unchanged config script are
+    skipped, and only failed or missing ones are run.
+
     :param module_path: The path to the module containing the simulators to
     run.
     :param processes: The number of processes to run in parallel. If not
-    specified, the number of available threads will be used.
+    specified, the number set via `set_num_processes` in the config script is
+    used.
+    :param resume: If `True`, skip the simulations the ledger records as
+    completed. If `False`, every simulation is run.
     """
 
     assert len(_multi_sim) == 0, (
@@ -196,10 +229,14 @@ def run(module_path: Path, processes: Optional[int] = None) -> None:
         "(prior to determining number of jobs)."
     )
 
-    # Get the simulator IDs. This both provides us a list of targets
-    # and, by-proxy, the number of jobs.
-    ids = get_simulator_ids(module_path)
-    max_num_processes = get_num_processes(module_path)
+    # Get the simulator IDs, the number of processes and the resource
+    # estimates. This loads the config script once, in a child process.
+    info = get_multisim_info(module_path)
+    ids = info["ids"]
+    estimates = info["estimates"]
+    max_num_processes = (
+        processes if processes is not None else info["num_processes"]
+    )
 
     assert len(_multi_sim) == 0, (
         "Simulators instantiated in main thread instead of child thread "
@@ -211,15 +248,45 @@ def run(module_path: Path, processes: Optional[int] = None) -> None:
         "configuration script."
     )
 
+    import m5
+
+    ledger = JobLedger(Path(m5.options.outdir))
+    hashes = {id: config_hash(module_path, id) for id in ids}
+    if resume:
+        pending = ledger.pending(ids, hashes)
+        if len(pending) != len(ids):
+            inform(
+                f"Skipping {len(ids) - len(pending)} simulation(s) already "
+                f"completed according to '{ledger.get_path()}'."
+            )
+        ids = pending
+
+    memory_limit = info["memory_limit"]
+    if memory_limit is None and any(
+        estimate[0] is not None for estimate in estimates.values()
+    ):
+        memory_limit = _available_memory()
+
+    def memory_of(id: str) -> int:
+        return (estimates.get(id, (None, None))[0]) or 0
+
+    # Schedule the longest running simulations first so that a long
+    # simulation does not end up holding up the tail of the run. Simulations
+    # without an estimate keep the order in which they were found.
+    remaining_ids = sorted(
+        ids,
+        key=lambda id: (estimates.get(id, (None, None))[1]) or 0,
+        reverse=True,
+    )
+
     active_processes = []
-    remaining_ids = list(ids).copy()
+    start_times = {}
+    used_memory = 0
     process_lock = Lock()
     from ..multiprocessing import Process
 
     def handle_exit(signum, frame):
         """Signal handler to clean up processes on termination."""
-        import sys
-
         inform("Cleaning up processes")
         with process_lock:
             for process in active_processes:
@@ -228,6 +295,19 @@ def run(module_path: Path, processes: Optional[int] = None) -> None:
                     process.terminate()
         sys.exit(0)
 
+    def next_id() -> Optional[str]:
+        """Pops the next simulation which fits in the available memory, or
+        returns `None` if none does. If nothing is running, the next
+        simulation is always returned, even if its estimate exceeds the
+        memory limit.
+        """
+        if memory_limit is None or not active_processes:
+            return remaining_ids.pop(0)
+        for index, id in enumerate(remaining_ids):
+            if used_memory + memory_of(id) <= memory_limit:
+                return remaining_ids.pop(index)
+        return None
+
     # Register signal handler
     signal.signal(signal.SIGINT, handle_exit)
     signal.signal(signal.SIGTERM, handle_exit)
@@ -236,21 +316,45 @@ def run(module_path: Path, processes: Optional[int] = None) -> None:
         while remaining_ids or active_processes:
             # Start new processes if available
             while remaining_ids and len(active_processes) < max_num_processes:
-                id_to_run = remaining_ids.pop()
+                id_to_run = next_id()
+                if id_to_run is None:
+                    break
+                too_big = memory_limit is not None and (
+                    memory_of(id_to_run) > memory_limit
+                )
+                if too_big:
+                    inform(
+                        f"Memory estimate of {id_to_run} exceeds the memory "
+                        "limit. Running it on its own."
+                    )
                 try:
                     process = Process(
                         target=_run,
                         args=(module_path, id_to_run),
                         name=id_to_run,
                     )
+                    start_times[id_to_run] = time.monotonic()
                     process.start()
                     with process_lock:
                         active_processes.append(process)
+                    used_memory += memory_of(id_to_run)
                 except Exception as e:
+                    start_times.pop(id_to_run, None)
                     inform(f"Error starting process for {id_to_run}: {e}")
-            # Wait for active processes to finish
-            time.sleep(1)  # Avoid busy-waiting
+
+            if not active_processes:
+                continue
+
+            # Block until at least one of the active processes finishes.
+            multiprocessing.connection.wait(
+                [process.sentinel for process in active_processes]
+            )
             with process_lock:
+                finished = [
+                    process
+                    for process in active_processes
+                    if not process.is_alive()
+                ]
                 # Using list comprehension to remove finished processes
                 # as using `remove` in a loop over the list will cause
                 # the list to be modified during iteration.
@@ -259,6 +363,15 @@ def run(module_path: Path, processes: Optional[int] = None) -> None:
                     for process in active_processes
                     if process.is_alive()
                 ]
+            for process in finished:
+                process.join()
+                used_memory -= memory_of(process.name)
+                ledger.record(
+                    process.name,
+                    hashes[process.name],
+                    process.exitcode,
+                    time.monotonic() - start_times.pop(process.name),
+                )
     finally:
         handle_exit(None, None)
 
@@ -277,12 +390,27 @@ def set_num_processes(num_processes: int) -> None:
         raise ValueError("Number of processes must be an integer.")
 
 
+def set_memory_limit(memory: Union[int, str]) -> None:
+    """Set the total memory available to the simulations running in
+    parallel. This is only used if memory estimates are passed to
+    `add_simulator`. By default, the physical memory of the host is used.
+
+    :param memory: The memory limit, in bytes or as a string (e.g., "64GiB").
+    """
+    global _memory_limit
+    _memory_limit = toMemorySize(memory) if isinstance(memory, str) else memory
+
+
 def num_simulators() -> int:
     """Returns the number of simulators added to the MultiSim."""
     return len(_multi_sim)
 
 
-def add_simulator(simulator: "Simulator") -> None:
+def add_simulator(
+    simulator: "Simulator",
+    memory: Optional[Union[int, str]] = None,
+    runtime: Optional[float] = None,
+) -> None:
     """Add a single simulator to the Multisim. Doing so informs the simulators
     to run this simulator via multiprocessing.
 
@@ -294,9 +422,11 @@ def add_simulator(simulator: "Simulator") -> None:
     simulations having been run).
 
     :param simulator: The simulator to add to the multisim.
-    :param id: The id of the simulator. This is used to reference the
-    simulation. This is particularly important when referencing the correct
-    m5out subdirectory.
+    :param memory: An optional estimate of the memory footprint of the
+    simulation, in bytes or as a string (e.g., "4GiB"). Used to pack
+    simulations into the available memory.
+    :param runtime: An optional estimate of the runtime of the simulation, in
+    seconds. Simulations with the longest estimates are run first.
     """
     global _multi_sim
     if not simulator.get_id():
@@ -305,6 +435,11 @@ def add_simulator(simulator: "Simulator") -> None:
         # id.
         simulator.set_id(f"sim_{len(_multi_sim)}")
     _multi_sim.add(simulator)
+    if memory is not None or runtime is not None:
+        _estimates[simulator.get_id()] = (
+            toMemorySize(memory) if isinstance(memory, str) else memory,
+            runtime,
+        )
 
     # The following code is used to enable a user to run a single simulation
     # from the config script, based on an ID, in the case the config script is
@@ -27,7 +27,10 @@
 import importlib
 import importlib.abc
 import importlib.util
+import marshal
 import os
+import time
+import zlib
 
 
 class ByteCodeLoader(importlib.abc.Loader):
@@ -44,12 +47,16 @@ class ByteCodeLoader(importlib.abc.Loader):
 
 # Simple importer that allows python to import data from a dict of
 # code objects.  The keys are the module path, and the items are the
-# filename and bytecode of the file.
+# filename and bytecode of the file. Modules embedded in the gem5 binary
+# are added compressed, and are only uncompressed and unmarshalled when
+# they are first imported.
 class CodeImporter:
     def __init__(self):
         self.modules = {}
         override_var = os.environ.get("M5_OVERRIDE_PY_SOURCE", "false")
         self.override = override_var.lower() in ("true", "yes")
+        # The number of compressed modules which have been decoded.
+        self.decoded = 0
 
     def add_module(self, abspath, modpath, code):
         if modpath in self.modules:
@@ -57,15 +64,36 @@ class CodeImporter:
 
         self.modules[modpath] = (abspath, code)
 
+    def add_compressed_module(self, abspath, modpath, compressed, length):
+        """
+        Add a module from the zlib compressed, marshalled code object
+        produced by build_tools/marshal.py. length is the size of the
+        marshalled code.
+        """
+        self.add_module(abspath, modpath, (compressed, length))
+
+    def get_code(self, fullname):
+        abspath, code = self.modules[fullname]
+        if isinstance(code, tuple):
+            compressed, length = code
+            code = marshal.loads(zlib.decompress(compressed, bufsize=length))
+            self.decoded += 1
+            # Keep the code, so that it isn't decoded again if the module is
+            # looked up again, e.g., when it is reloaded.
+            self.modules[fullname] = (abspath, code)
+        return code
+
     def find_spec(self, fullname, path, target=None):
         if fullname not in self.modules:
             return None
 
-        abspath, code = self.modules[fullname]
+        abspath = self.modules[fullname][0]
 
         if self.override and os.path.exists(abspath):
             src = open(abspath).read()
             code = compile(src, abspath, "exec")
+        else:
+            code = self.get_code(fullname)
 
         is_package = os.path.basename(abspath) == "__init__.py"
         spec = importlib.util.spec_from_loader(
@@ -81,12 +109,30 @@ class CodeImporter:
 # use it.  There's currently nothing in the importer, but calls to
 # add_module can be used to add code.
 def install():
+    start = time.perf_counter()
     importer = CodeImporter()
-    global add_module
+    global add_module, add_compressed_module
     add_module = importer.add_module
+    add_compressed_module = importer.add_compressed_module
     import sys
 
     sys.meta_path.insert(0, importer)
 
     # Injected into this module's namespace by the c++ code that loads it.
     _init_all_embedded()
+    registered = time.perf_counter()
+
+    global startup_stats
+
+    def startup_stats():
+        """
+        Returns the seconds since the importer was installed, the seconds
+        it took to register the embedded modules, the number of embedded
+        modules decoded so far and the number of embedded modules.
+        """
+        return (
+            time.perf_counter() - start,
+            registered - start,
+            importer.decoded,
+            len(importer.modules),
+        )
@@ -40,6 +40,10 @@
 
 import inspect
 import sys
+from bisect import (
+    bisect_left,
+    bisect_right,
+)
 from functools import wraps
 from types import (
     FunctionType,
@@ -122,6 +126,10 @@ instanceDict = {}
 # Did any of the SimObjects lack a header file?
 noCxxHeader = False
 
+# Flattened view of the current SimObject hierarchy (see
+# SimObjectHierarchy). Dropped whenever an object is re-parented.
+_hierarchy = None
+
 
 def public_value(key, value):
     return key.startswith("_") or isinstance(
@@ -945,13 +953,17 @@ class SimObject(metaclass=MetaSimObject):
 
     # Also implemented by SimObjectVector
     def clear_parent(self, old_parent):
+        global _hierarchy
         assert self._parent is old_parent
         self._parent = None
+        _hierarchy = None
 
     # Also implemented by SimObjectVector
     def set_parent(self, parent, name):
+        global _hierarchy
         self._parent = parent
         self._name = name
+        _hierarchy = None
 
     # Return parent object of this SimObject, not implemented by
     # SimObjectVector because the elements in a SimObjectVector may not share
@@ -1041,6 +1053,12 @@ class SimObject(metaclass=MetaSimObject):
         if isinstance(self, ptype):
             return self, True
 
+        hierarchy = _activeHierarchy(self)
+        if hierarchy is not None and isSimObjectClass(ptype):
+            params = hierarchy.object_params(type(self))
+        else:
+            params = self._params.items()
+
         found_obj = None
         for child in self._children.values():
             visited = False
@@ -1055,7 +1073,7 @@ class SimObject(metaclass=MetaSimObject):
                     )
                 found_obj = child
         # search param space
-        for pname, pdesc in self._params.items():
+        for pname, pdesc in params:
             if isinstance(pdesc, DictParamDesc):
                 # DictParams are not supported
                 continue
@@ -1071,6 +1089,10 @@ class SimObject(metaclass=MetaSimObject):
         return found_obj, found_obj != None
 
     def find_all(self, ptype):
+        hierarchy = _activeHierarchy(self)
+        if hierarchy is not None and isSimObjectClass(ptype):
+            return hierarchy.find_all(self, ptype), True
+
         all = {}
         # search children
         for child in self._children.values():
@@ -1135,33 +1157,31 @@ class SimObject(metaclass=MetaSimObject):
 
         instanceDict[self.path()] = self
 
+        for key, value in self.ini_items():
+            print(f"{key}={value}", file=ini_file)
+
+        print(file=ini_file)  # blank line between objects
+
+    # Generate the (key, value) pairs of this object's .ini section
+    def ini_items(self):
         if hasattr(self, "type"):
-            print(f"type={self.type}", file=ini_file)
+            yield "type", self.type
 
         if len(self._children.keys()):
-            print(
-                "children=%s"
-                % " ".join(
-                    self._children[n].get_name()
-                    for n in sorted(self._children.keys())
-                ),
-                file=ini_file,
+            yield "children", " ".join(
+                self._children[n].get_name()
+                for n in sorted(self._children.keys())
             )
 
         for param in sorted(self._params.keys()):
             value = self._values.get(param)
             if value != None:
-                print(
-                    f"{param}={self._values[param].ini_str()}",
-                    file=ini_file,
-                )
+                yield param, self._values[param].ini_str()
 
         for port_name in sorted(self._ports.keys()):
             port = self._port_refs.get(port_name, None)
             if port != None:
-                print(f"{port_name}={port.ini_str()}", file=ini_file)
-
-        print(file=ini_file)  # blank line between objects
+                yield port_name, port.ini_str()
 
     # generate a tree of dictionaries expressing all the parameters in the
     # instantiated system for use by scripts that want to do power, thermal
@@ -1302,6 +1322,11 @@ class SimObject(metaclass=MetaSimObject):
         return self._ccObject
 
     def descendants(self):
+        hierarchy = _activeHierarchy(self)
+        if hierarchy is not None:
+            yield from hierarchy.subtree(self)
+            return
+
         yield self
         # The order of the dict is implementation dependent, so sort
         # it based on the key (name) to ensure the order is the same
@@ -1377,6 +1402,168 @@ class SimObject(metaclass=MetaSimObject):
         return eval(simobj_path, d)
 
 
+class SimObjectHierarchy:
+    """
+    A frozen, flattened view of the SimObject hierarchy below a root.
+
+    Objects are kept in the order produced by ``SimObject.descendants()``,
+    so the subtree below any object is a contiguous slice. On top of that
+    the hierarchy keeps lazily built path and type indices, which lets
+    ``descendants()``, ``find_all()`` and ``find_any()`` avoid walking and
+    re-sorting the children of every object each time they are called.
+
+    The view is only valid until an object in the configuration is
+    re-parented, after which ``valid()`` returns False and a new view has
+    to be built with ``getHierarchy()``.
+    """
+
+    def __init__(self, root):
+        self.root = root
+        objects = []
+        ends = []
+        self._flatten(root, objects, ends)
+        self.objects = tuple(objects)
+        self._ends = ends
+        self._position = {id(obj): i for i, obj in enumerate(objects)}
+        self._paths = None
+        # ptype -> positions of the objects which are instances of it
+        self._types = {}
+        # ptype -> (position, param name) of params which may refer to it
+        self._param_types = {}
+        # SimObject class -> its SimObject-valued params
+        self._object_params = {}
+
+    @classmethod
+    def _flatten(cls, obj, objects, ends):
+        pos = len(objects)
+        objects.append(obj)
+        ends.append(None)
+        # Same order as SimObject.descendants()
+        for name, child in sorted(obj._children.items()):
+            for item in child:  # For looping over SimObjectVectors
+                if isSimObject(item):
+                    cls._flatten(item, objects, ends)
+        ends[pos] = len(objects)
+
+    def valid(self):
+        return _hierarchy is self
+
+    def __contains__(self, obj):
+        return id(obj) in self._position
+
+    def __iter__(self):
+        return iter(self.objects)
+
+    def __len__(self):
+        return len(self.objects)
+
+    def subtree(self, obj):
+        """
+        Return ``obj`` and all of its descendants in descendants() order.
+        """
+        pos = self._position[id(obj)]
+        return self.objects[pos : self._ends[pos]]
+
+    def paths(self):
+        """
+        Return a dict mapping the path of every object to the object.
+        """
+        if self._paths is None:
+            self._paths = {obj.path(): obj for obj in self.objects}
+        return self._paths
+
+    def find(self, path):
+        return self.paths()[path]
+
+    def object_params(self, cls):
+        """
+        Return the ``(name, desc)`` pairs of the params of ``cls`` which can
+        hold a SimObject.
+        """
+        params = self._object_params.get(cls)
+        if params is None:
+            params = tuple(
+                (pname, pdesc)
+                for pname, pdesc in cls._params.items()
+                if not isinstance(pdesc, DictParamDesc)
+                and isSimObjectClass(pdesc.ptype)
+            )
+            self._object_params[cls] = params
+        return params
+
+    def _of_type(self, ptype):
+        positions = self._types.get(ptype)
+        if positions is None:
+            positions = [
+                i
+                for i, obj in enumerate(self.objects)
+                if isinstance(obj, ptype)
+            ]
+            self._types[ptype] = positions
+        return positions
+
+    def _params_of_type(self, ptype):
+        entries = self._param_types.get(ptype)
+        if entries is None:
+            entries = []
+            positions = []
+            for i, obj in enumerate(self.objects):
+                for pname, pdesc in self.object_params(type(obj)):
+                    if issubclass(pdesc.ptype, ptype):
+                        positions.append(i)
+                        entries.append(pname)
+            entries = (positions, entries)
+            self._param_types[ptype] = entries
+        return entries
+
+    def find_all(self, obj, ptype):
+        """
+        Equivalent of ``SimObject.find_all()`` using the type indices.
+        Param values are looked up when called since unproxying may still
+        be replacing them.
+        """
+        start = self._position[id(obj)]
+        end = self._ends[start]
+        found = {}
+
+        positions = self._of_type(ptype)
+        for i in positions[
+            bisect_right(positions, start) : bisect_left(positions, end)
+        ]:
+            found[self.objects[i]] = True
+
+        positions, pnames = self._params_of_type(ptype)
+        for j in range(
+            bisect_left(positions, start), bisect_left(positions, end)
+        ):
+            match_obj = self.objects[positions[j]]._values[pnames[j]]
+            if not isproxy(match_obj) and not isNullPointer(match_obj):
+                found[match_obj] = True
+        # Also make sure to sort the keys based on the objects' path to
+        # ensure that the order is the same on all hosts
+        return sorted(found.keys(), key=lambda o: o.path())
+
+
+def _activeHierarchy(obj):
+    hierarchy = _hierarchy
+    if hierarchy is not None and obj in hierarchy:
+        return hierarchy
+    return None
+
+
+def getHierarchy(root):
+    """
+    Return a flattened view of the hierarchy below root, reusing the
+    current one if nothing has been re-parented since it was built.
+    """
+    global _hierarchy
+    hierarchy = _hierarchy
+    if hierarchy is None or hierarchy.root is not root:
+        hierarchy = SimObjectHierarchy(root)
+        _hierarchy = hierarchy
+    return hierarchy
+
+
 # Function to provide to C++ so it can look up instances based on paths
 def resolveSimObject(name):
     obj = instanceDict[name]
@@ -1440,11 +1627,12 @@ baseInstances = instanceDict.copy()
 
 
 def clear():
-    global allClasses, instanceDict, noCxxHeader
+    global allClasses, instanceDict, noCxxHeader, _hierarchy
 
     allClasses = baseClasses.copy()
     instanceDict = baseInstances.copy()
     noCxxHeader = False
+    _hierarchy = None
 
 
 # __all__ defines the list of symbols that get exported when
@@ -25,6 +25,10 @@
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
 from .abstract_stat import AbstractStat
+from .columnar import (
+    ColumnarStatsReader,
+    ColumnarStatsWriter,
+)
 from .group import (
     Group,
     SimObjectGroup,
@@ -42,4 +46,8 @@ from .statistic import (
     Vector2d,
 )
 from .storagetype import StorageType
+from .textstats import (
+    TextStat,
+    TextStatsReader,
+)
 from .timeconversion import TimeConversion
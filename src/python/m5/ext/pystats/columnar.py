@@ -0,0 +1,360 @@
+# Copyright (c) 2026 The Regents of The University of California
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met: redistributions of source code must retain the above copyright
+# notice, this list of conditions and the following disclaimer;
+# redistributions in binary form must reproduce the above copyright
+# notice, this list of conditions and the following disclaimer in the
+# documentation and/or other materials provided with the distribution;
+# neither the name of the copyright holders nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+# A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+# THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+
+"""
+A columnar, memory-mappable store for time series of gem5 statistics.
+
+Every stat dump is a row and every stat element is a column. The file is
+append-only and made of blocks, each starting with a 4-byte tag and the
+length of its payload:
+
+* ``DICT``: a JSON stat-name dictionary, i.e., the name and width (number of
+  elements) of every stat. The columns of a stat are consecutive. A new
+  dictionary is only written when the set of stats changes.
+* ``CHNK``: a chunk of up to ``chunk_size`` dumps. The payload holds the
+  number of rows and columns, the tick of each row, then the values stored
+  column-major (``float64``). The values of a stat within a chunk are
+  therefore contiguous.
+
+Reading one stat across all dumps only touches the block headers and that
+stat's columns in each chunk.
+
+Usage
+-----
+
+.. code-block::
+
+    from m5.ext.pystats.columnar import ColumnarStatsReader
+
+    with ColumnarStatsReader("m5out/stats.gcol") as reader:
+        cycles = reader.get("system.cpu.numCycles")
+"""
+
+import json
+import mmap
+import struct
+from array import array
+from typing import (
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+MAGIC = b"GEM5COL1"
+_BLOCK_HEADER = struct.Struct("<4sQ")
+_CHUNK_HEADER = struct.Struct("<II")
+_DICT_TAG = b"DICT"
+_CHUNK_TAG = b"CHNK"
+
+# A stat dictionary is a sequence of (name, width) pairs.
+Layout = Tuple[Tuple[str, int], ...]
+
+
+class ColumnarStatsWriter:
+    """
+    Appends stat dumps to a columnar stats file. Dumps are buffered in memory
+    and written out one chunk at a time.
+    """
+
+    def __init__(self, path: str, chunk_size: int = 64):
+        """
+        :param path: The file to write. It is truncated when opened.
+
+        :param chunk_size: The number of dumps held per chunk. Larger chunks
+                           make reads of a single stat more sequential at the
+                           cost of more dumps being lost if the simulation
+                           crashes.
+        """
+
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1.")
+
+        self.path = path
+        self.chunk_size = chunk_size
+        self._layout: Optional[Layout] = None
+        self._columns = 0
+        self._ticks = array("Q")
+        self._rows: List[array] = []
+        self._file = open(path, "wb")
+        self._file.write(MAGIC)
+        self._file.flush()
+
+    def append(self, tick: int, layout: Layout, values: Sequence[float]):
+        """
+        Adds a dump.
+
+        :param tick: The tick at which the dump was taken.
+
+        :param layout: The name and width of every stat in the dump, in the
+                       order their values appear in ``values``.
+
+        :param values: The flattened values of every stat.
+        """
+
+        if layout != self._layout:
+            columns = sum(width for _, width in layout)
+            self.flush()
+            self._write_block(
+                _DICT_TAG,
+                json.dumps({"stats": layout, "columns": columns}).encode(),
+            )
+            self._layout = tuple(layout)
+            self._columns = columns
+
+        if len(values) != self._columns:
+            raise ValueError(
+                f"Expected {self._columns} values, got {len(values)}."
+            )
+
+        self._ticks.append(tick)
+        self._rows.append(array("d", values))
+        if len(self._rows) >= self.chunk_size:
+            self.flush()
+
+    def flush(self) -> None:
+        """Writes the buffered dumps, if any, as a chunk."""
+
+        if not self._rows:
+            return
+
+        nrows = len(self._rows)
+        data = array("d", bytes(8 * nrows * self._columns))
+        for row_index, row in enumerate(self._rows):
+            data[row_index::nrows] = row
+
+        self._write_block(
+            _CHUNK_TAG,
+            _CHUNK_HEADER.pack(nrows, self._columns)
+            + self._ticks.tobytes()
+            + data.tobytes(),
+        )
+        self._ticks = array("Q")
+        self._rows = []
+
+    def close(self) -> None:
+        """Flushes any buffered dumps and closes the file."""
+
+        if self._file.closed:
+            return
+        self.flush()
+        self._file.close()
+
+    def _write_block(self, tag: bytes, payload: bytes) -> None:
+        self._file.write(_BLOCK_HEADER.pack(tag, len(payload)))
+        self._file.write(payload)
+        self._file.flush()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+class _Chunk:
+    __slots__ = ("offset", "nrows", "dictionary")
+
+    def __init__(self, offset: int, nrows: int, dictionary: int):
+        self.offset = offset
+        self.nrows = nrows
+        self.dictionary = dictionary
+
+
+class ColumnarStatsReader:
+    """
+    Reads a file written by ``ColumnarStatsWriter``. The file is memory
+    mapped and only the block headers are parsed when it is opened. A
+    trailing block truncated by a crashed simulation is ignored.
+
+    Requires NumPy.
+    """
+
+    def __init__(self, path: str):
+        """
+        :param path: The columnar stats file to read.
+        """
+
+        try:
+            import numpy
+        except ImportError:
+            raise ImportError(
+                "NumPy is required to read columnar stats files."
+            )
+        self._np = numpy
+
+        self._file = open(path, "rb")
+        self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        if self._mmap[: len(MAGIC)] != MAGIC:
+            self.close()
+            raise ValueError(f"'{path}' is not a columnar stats file.")
+
+        # For every dictionary, a map of stat name to (column, width).
+        self._dictionaries: List[Dict[str, Tuple[int, int]]] = []
+        self._chunks: List[_Chunk] = []
+        self._index()
+
+    def _index(self) -> None:
+        offset = len(MAGIC)
+        size = len(self._mmap)
+        while offset + _BLOCK_HEADER.size <= size:
+            tag, length = _BLOCK_HEADER.unpack_from(self._mmap, offset)
+            payload = offset + _BLOCK_HEADER.size
+            if payload + length > size:
+                break
+            if tag == _DICT_TAG:
+                layout = json.loads(self._mmap[payload : payload + length])
+                columns = {}
+                column = 0
+                for name, width in layout["stats"]:
+                    columns[name] = (column, width)
+                    column += width
+                self._dictionaries.append(columns)
+            elif tag == _CHUNK_TAG:
+                nrows, _ = _CHUNK_HEADER.unpack_from(self._mmap, payload)
+                self._chunks.append(
+                    _Chunk(payload, nrows, len(self._dictionaries) - 1)
+                )
+            offset = payload + length
+
+    def __len__(self) -> int:
+        """The number of dumps in the file."""
+        return sum(chunk.nrows for chunk in self._chunks)
+
+    def names(self) -> List[str]:
+        """The names of all stats found in the file."""
+
+        names = {}
+        for dictionary in self._dictionaries:
+            names.update(dict.fromkeys(dictionary))
+        return list(names)
+
+    def ticks(self):
+        """
+        :returns: A NumPy array of the tick at which each dump was taken.
+        """
+
+        np = self._np
+        parts = [
+            np.frombuffer(
+                self._mmap,
+                dtype="<u8",
+                count=chunk.nrows,
+                offset=chunk.offset + _CHUNK_HEADER.size,
+            )
+            for chunk in self._chunks
+        ]
+        return np.concatenate(parts) if parts else np.empty(0, dtype="<u8")
+
+    def get(self, name: str):
+        """
+        Loads a single stat across all dumps.
+
+        :param name: The full name of the stat, e.g., ``system.cpu.numCycles``.
+
+        :returns: A NumPy array of shape ``(dumps,)`` for single-element
+                  stats, or ``(dumps, width)`` otherwise. Dumps in which the
+                  stat does not exist hold NaN.
+        """
+
+        np = self._np
+        width = None
+        for dictionary in self._dictionaries:
+            if name in dictionary:
+                width = dictionary[name][1]
+                break
+        if width is None:
+            raise KeyError(f"No stat named '{name}'.")
+
+        parts = []
+        for chunk in self._chunks:
+            location = self._dictionaries[chunk.dictionary].get(name)
+            if location is None or location[1] != width:
+                parts.append(np.full((chunk.nrows, width), np.nan))
+                continue
+            column, _ = location
+            data_offset = (
+                chunk.offset + _CHUNK_HEADER.size + 8 * chunk.nrows
+            ) + 8 * column * chunk.nrows
+            parts.append(
+                np.frombuffer(
+                    self._mmap,
+                    dtype="<f8",
+                    count=width * chunk.nrows,
+                    offset=data_offset,
+                ).reshape(width, chunk.nrows)
+                # Transpose to one row per dump.
+                .T
+            )
+
+        values = (
+            np.concatenate(parts) if parts else np.empty((0, width), "<f8")
+        )
+        return values[:, 0] if width == 1 else values
+
+    def dump(self, index: int) -> Dict[str, List[float]]:
+        """
+        Loads all stats of a single dump.
+
+        :param index: The index of the dump. Negative indices count from the
+                      last dump.
+
+        :returns: A dictionary mapping each stat name to its values.
+        """
+
+        if index < 0:
+            index += len(self)
+        for chunk in self._chunks:
+            if index >= chunk.nrows:
+                index -= chunk.nrows
+                continue
+            data_offset = chunk.offset + _CHUNK_HEADER.size + 8 * chunk.nrows
+            values = {}
+            for name, (column, width) in self._dictionaries[
+                chunk.dictionary
+            ].items():
+                values[name] = [
+                    struct.unpack_from(
+                        "<d",
+                        self._mmap,
+                        data_offset + 8 * ((column + i) * chunk.nrows + index),
+                    )[0]
+                    for i in range(width)
+                ]
+            return values
+        raise IndexError("Dump index out of range.")
+
+    def close(self) -> None:
+        self._mmap.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
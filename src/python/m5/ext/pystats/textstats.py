@@ -0,0 +1,358 @@
+# Copyright (c) 2026 The Regents of The University of California
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met: redistributions of source code must retain the above copyright
+# notice, this list of conditions and the following disclaimer;
+# redistributions in binary form must reproduce the above copyright
+# notice, this list of conditions and the following disclaimer in the
+# documentation and/or other materials provided with the distribution;
+# neither the name of the copyright holders nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+# A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+# THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""
+An indexed reader for text (``stats.txt``) statistics files.
+
+A text stats file is a sequence of dumps, each delimited by the ``Begin``
+and ``End Simulation Statistics`` banners. The first time a file is read,
+it is scanned once to build an index holding the byte range of every
+dump and, for every stat name, the dumps it appears in and the offset of
+its line in each of them. Queries only read the lines they need:
+
+* ``values(name)`` reads one line per dump.
+* ``dump(n)`` only reads the byte range of dump ``n``.
+* ``find(pattern)`` reads the lines of the matching stats, in file order.
+
+With ``persist_index=True``, the index is saved next to the stats file
+(``stats.txt.index``) and reused as long as the size and modification
+time of the stats file do not change. The index is made of a JSON header
+and the raw contents of its arrays, so reading an index from an untrusted
+directory can't run any code.
+
+Gzipped stats files (``stats.txt.gz``) are supported, but seeking in them
+decompresses the data in between, so reads are only cheap in file order.
+
+Usage
+-----
+
+.. code-block::
+
+    from m5.ext.pystats.textstats import TextStatsReader
+
+    with TextStatsReader("m5out/stats.txt") as reader:
+        ipc = reader.values("system.cpu.ipc")
+        first = reader.dump(0)
+"""
+
+import gzip
+import json
+import os
+import re
+import sys
+from array import array
+from typing import (
+    Dict,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+)
+
+BEGIN = b"---------- Begin Simulation Statistics ----------"
+END = b"---------- End Simulation Statistics   ----------"
+
+_INDEX_VERSION = 2
+_INDEX_SUFFIX = ".index"
+
+
+class TextStat(NamedTuple):
+    """A single line of a text stats file."""
+
+    name: str
+    value: float
+    description: str
+
+
+def parse_line(line: str) -> Optional[TextStat]:
+    """
+    Parse a stat line. For multi-column stats, e.g., distribution buckets,
+    the value is the first column.
+
+    :returns: The stat, or None if the line is not a stat line.
+    """
+    line, _, description = line.partition("#")
+    fields = line.split()
+    if len(fields) < 2:
+        return None
+    try:
+        value = float(fields[1].rstrip("%"))
+    except ValueError:
+        value = float("nan")
+    return TextStat(fields[0], value, description.strip())
+
+
+def _open(filename: str):
+    if filename.endswith(".gz"):
+        return gzip.open(filename, "rb")
+    return open(filename, "rb")
+
+
+class _Index:
+    """
+    The index of a stats file. ``dumps`` holds the begin and end offset of
+    every dump's body and ``stats`` maps every stat name to the dumps it
+    appears in and the offsets of its lines.
+    """
+
+    def __init__(self, size: int, mtime: int) -> None:
+        self.size = size
+        self.mtime = mtime
+        self.truncated = False
+        self.dumps = array("Q")
+        self.stats: Dict[str, Tuple[array, array]] = {}
+
+    def scan(self, f) -> None:
+        stats = self.stats
+        offset = 0
+        begin = None
+        dump = 0
+        try:
+            for line in f:
+                start = offset
+                offset += len(line)
+                if begin is None:
+                    if line.startswith(BEGIN):
+                        begin = offset
+                    continue
+                if line.startswith(END):
+                    self.dumps.extend((begin, start))
+                    begin = None
+                    dump += 1
+                    continue
+                fields = line.split(None, 1)
+                if not fields:
+                    continue
+                name = fields[0].decode()
+                entry = stats.get(name)
+                if entry is None:
+                    entry = stats[name] = (array("I"), array("Q"))
+                entry[0].append(dump)
+                entry[1].append(start)
+        except (EOFError, OSError):
+            # A gzip stream that was not closed properly, e.g., if the
+            # simulation was killed. Keep what could be read.
+            self.truncated = True
+        if begin is not None and offset > begin:
+            # The last dump has no end banner.
+            self.dumps.extend((begin, offset))
+            self.truncated = True
+
+    def save(self, f) -> None:
+        """
+        Write the index as a line of JSON describing it, followed by the
+        contents of its arrays.
+        """
+        header = {
+            "version": _INDEX_VERSION,
+            "byteorder": sys.byteorder,
+            "itemsizes": [array("I").itemsize, array("Q").itemsize],
+            "size": self.size,
+            "mtime": self.mtime,
+            "truncated": self.truncated,
+            "dumps": len(self.dumps),
+            "stats": [
+                [name, len(dumps)] for name, (dumps, _) in self.stats.items()
+            ],
+        }
+        f.write(json.dumps(header, separators=(",", ":")).encode() + b"\n")
+        f.write(self.dumps.tobytes())
+        for dumps, offsets in self.stats.values():
+            f.write(dumps.tobytes())
+            f.write(offsets.tobytes())
+
+    @classmethod
+    def load(cls, f, size: int, mtime: int) -> Optional["_Index"]:
+        """
+        Read an index written by save(). Returns None if it is not the
+        index of a stats file with the given size and modification time.
+        """
+        header = json.loads(f.readline())
+        if (
+            header["version"] != _INDEX_VERSION
+            or header["byteorder"] != sys.byteorder
+            or header["itemsizes"]
+            != [array("I").itemsize, array("Q").itemsize]
+            or header["size"] != size
+            or header["mtime"] != mtime
+        ):
+            return None
+        data = memoryview(f.read())
+
+        def read(typecode, count):
+            nonlocal data
+            values = array(typecode)
+            length = values.itemsize * count
+            if count < 0 or len(data) < length:
+                raise ValueError("Truncated stats index")
+            values.frombytes(data[:length])
+            data = data[length:]
+            return values
+
+        index = cls(size, mtime)
+        index.truncated = bool(header["truncated"])
+        index.dumps = read("Q", header["dumps"])
+        for name, count in header["stats"]:
+            index.stats[name] = (read("I", count), read("Q", count))
+        if len(data):
+            raise ValueError("Trailing data in stats index")
+        return index
+
+
+class TextStatsReader:
+    """
+    Reads a text stats file through its index.
+
+    :param filename: The stats file, optionally gzipped.
+    :param index_path: Where to keep the index. Defaults to the stats file
+        name with an ``.index`` suffix.
+    :param persist_index: Whether to load and save the index. If False, or
+        if the index cannot be written, it is only kept in memory.
+    """
+
+    def __init__(
+        self,
+        filename: str,
+        index_path: Optional[str] = None,
+        persist_index: bool = False,
+    ) -> None:
+        self._filename = filename
+        if not persist_index:
+            self._index_path = None
+        else:
+            self._index_path = index_path or filename + _INDEX_SUFFIX
+        self._file = _open(filename)
+        self._index = self._load_index()
+
+    def close(self) -> None:
+        self._file.close()
+
+    def __enter__(self) -> "TextStatsReader":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def _load_index(self) -> _Index:
+        st = os.stat(self._filename)
+        if self._index_path is not None:
+            try:
+                with open(self._index_path, "rb") as f:
+                    index = _Index.load(f, st.st_size, st.st_mtime_ns)
+                if index is not None:
+                    return index
+            except (OSError, KeyError, TypeError, ValueError):
+                pass
+
+        index = _Index(st.st_size, st.st_mtime_ns)
+        index.scan(self._file)
+        if self._index_path is not None:
+            tmp = f"{self._index_path}.{os.getpid()}.tmp"
+            try:
+                with open(tmp, "wb") as f:
+                    index.save(f)
+                os.replace(tmp, self._index_path)
+            except OSError:
+                pass
+        return index
+
+    @property
+    def truncated(self) -> bool:
+        """Whether the last dump of the file is incomplete."""
+        return self._index.truncated
+
+    def __len__(self) -> int:
+        """The number of dumps in the file."""
+        return len(self._index.dumps) // 2
+
+    def names(self) -> List[str]:
+        """Return the names of all stats in the order they first appear."""
+        return list(self._index.stats)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._index.stats
+
+    def _read_line(self, offset: int) -> Optional[TextStat]:
+        self._file.seek(offset)
+        return parse_line(self._file.readline().decode())
+
+    def stat(self, name: str) -> List[Optional[TextStat]]:
+        """
+        Return the line of a stat in every dump, or None for the dumps the
+        stat is missing from.
+
+        :raises KeyError: If the stat is not in the file.
+        """
+        dumps, offsets = self._index.stats[name]
+        stats: List[Optional[TextStat]] = [None] * len(self)
+        for dump, offset in zip(dumps, offsets):
+            stats[dump] = self._read_line(offset)
+        return stats
+
+    def values(self, name: str) -> List[Optional[float]]:
+        """
+        Return the value of a stat in every dump, or None for the dumps the
+        stat is missing from.
+
+        :raises KeyError: If the stat is not in the file.
+        """
+        return [
+            None if stat is None else stat.value for stat in self.stat(name)
+        ]
+
+    def find(self, pattern: str) -> List[Tuple[int, TextStat]]:
+        """
+        Return the ``(dump, stat)`` pairs of all the stats whose name
+        matches the regular expression pattern (using ``re.search``), in
+        file order.
+        """
+        regex = re.compile(pattern)
+        lines = []
+        for name, (dumps, offsets) in self._index.stats.items():
+            if regex.search(name):
+                lines.extend(zip(offsets, dumps))
+        lines.sort()
+        return [(dump, self._read_line(offset)) for offset, dump in lines]
+
+    def dump(self, n: int) -> Dict[str, TextStat]:
+        """
+        Return all the stats of dump n, by name, in file order.
+
+        :raises IndexError: If there is no dump n.
+        """
+        if n < 0:
+            n += len(self)
+        if not 0 <= n < len(self):
+            raise IndexError(f"dump {n} out of range")
+        begin, end = self._index.dumps[2 * n : 2 * n + 2]
+        self._file.seek(begin)
+        body = self._file.read(end - begin).decode()
+        stats = {}
+        for line in body.splitlines():
+            stat = parse_line(line)
+            if stat is not None:
+                stats[stat.name] = stat
+        return stats
@@ -248,6 +248,13 @@ def parse_options():
         default="config.json",
         help="Create JSON output of the configuration [Default: %default]",
     )
+    option(
+        "--config-snapshot",
+        metavar="FILE",
+        default=None,
+        help="Create a binary snapshot of the configuration which can be "
+        "queried and diffed with util/config_snapshot.py [Default: %default]",
+    )
     option(
         "--dot-config",
         metavar="FILE",
@@ -261,6 +268,26 @@ def parse_options():
         help="Create DOT & pdf outputs of the DVFS configuration"
         + " [Default: %default]",
     )
+    option(
+        "--profile-config",
+        metavar="FILE",
+        default=None,
+        help="Profile the time spent building the configuration and write "
+        "a report to FILE once it has been instantiated [Default: %default]",
+    )
+    option(
+        "--eager-objects",
+        action="store_true",
+        default=False,
+        help="Import every SimObject module before running the script, "
+        "rather than on first use (also set by M5_EAGER_OBJECTS)",
+    )
+    option(
+        "--startup-time",
+        action="store_true",
+        default=False,
+        help="Report the time gem5 took to start before running the script",
+    )
 
     # Debugging options
     group("Debugging Options")
@@ -481,7 +508,12 @@ def main():
         debug.help()
 
     if options.list_sim_objects:
-        from . import SimObject
+        from . import (
+            SimObject,
+            objects,
+        )
+
+        objects.load_all()
 
         done = True
         print("SimObjects:")
@@ -633,6 +665,31 @@ def main():
         _check_tracing()
         trace.ignore(ignore)
 
+    if options.profile_config:
+        import atexit
+
+        from .util import config_profile
+
+        config_profile.enable()
+        atexit.register(
+            config_profile.finish,
+            os.path.join(options.outdir, options.profile_config),
+        )
+
+    if options.eager_objects:
+        from . import objects
+
+        objects.load_all()
+
+    if options.startup_time:
+        import importer
+
+        elapsed, registered, decoded, total = importer.startup_stats()
+        print(
+            f"gem5 started in {elapsed:.3f}s, registered {total} embedded "
+            f"modules in {registered:.3f}s and decoded {decoded} of them"
+        )
+
     sys.argv = arguments
 
     if options.m:
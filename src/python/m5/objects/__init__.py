@@ -24,6 +24,94 @@
 # (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
-for module in __spec__.loader_state:
-    if module.startswith("m5.objects."):
-        exec(f"from {module} import *")
+"""
+The SimObject classes, and everything else defined by the SimObject modules.
+
+The package is lazy: when a name is first used, it is looked up in an index
+generated at build time and only the module defining it is imported. Names
+which are not in the index, and ``from m5.objects import *``, import every
+SimObject module, as the package used to do on import. Setting the
+``M5_EAGER_OBJECTS`` environment variable, or calling ``load_all``, restores
+that eager behaviour.
+"""
+
+import importlib as _importlib
+import os as _os
+import sys as _sys
+import types as _types
+
+try:
+    from ._index import index as _index
+except ImportError:
+    _index = None
+
+_embedded = __spec__.loader_state
+_modules = [
+    module
+    for module in _embedded
+    if module.startswith("m5.objects.")
+    and not module.rpartition(".")[2].startswith("_")
+]
+_loaded_all = False
+
+
+def load_all():
+    """Import every SimObject module into the package."""
+    global _loaded_all
+    if _loaded_all:
+        return
+    _loaded_all = True
+    for module in _modules:
+        exec(f"from {module} import *", globals())
+
+
+def __getattr__(name):
+    if name == "__all__":
+        load_all()
+        return [
+            name
+            for name in globals()
+            if not name.startswith("_") and name != "load_all"
+        ]
+    if name.startswith("__"):
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    if _index is not None and name in _index:
+        module = f"{__name__}.{_index[name]}"
+        if module in _embedded:
+            value = getattr(_importlib.import_module(module), name, None)
+            if value is not None:
+                globals()[name] = value
+                return value
+
+    # The name may have been imported by a module rather than defined by it.
+    load_all()
+    try:
+        return globals()[name]
+    except KeyError:
+        raise AttributeError(
+            f"module {__name__!r} has no attribute {name!r}"
+        ) from None
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_index or ()))
+
+
+class _LazyObjects(_types.ModuleType):
+    def __setattr__(self, name, value):
+        # Importing a submodule binds it in the package. Don't let it hide
+        # the name the submodule defines, e.g., the BaseCPU class.
+        if (
+            isinstance(value, _types.ModuleType)
+            and name in _index
+            and value.__name__ == f"{self.__name__}.{name}"
+        ):
+            return
+        super().__setattr__(name, value)
+
+
+if _index is None or _os.environ.get("M5_EAGER_OBJECTS"):
+    load_all()
+else:
+    _sys.modules[__name__].__class__ = _LazyObjects
@@ -105,6 +105,8 @@ class MetaParamValue(type):
 # Dummy base class to identify types that are legitimate for SimObject
 # parameters.
 class ParamValue(metaclass=MetaParamValue):
+    __slots__ = ()
+
     cmd_line_settable = False
 
     # Generate the code needed as a prerequisite for declaring a C++
@@ -200,7 +202,13 @@ class SingleTypeParamDesc(ParamDesc):
         if attr == "ptype":
             from . import SimObject
 
-            ptype = SimObject.allClasses[self.ptype_str]
+            ptype = SimObject.allClasses.get(self.ptype_str)
+            if ptype is None:
+                # The class may be defined by a module that m5.objects has
+                # not imported yet.
+                import m5.objects
+
+                ptype = getattr(m5.objects, self.ptype_str)
             assert isSimObjectClass(ptype)
             self.ptype = ptype
             return ptype
@@ -230,15 +238,36 @@ class SingleTypeParamDesc(ParamDesc):
         if isinstance(value, proxy.BaseProxy):
             value.set_param_desc(self)
             return value
-        if "ptype" not in self.__dict__ and isNullPointer(value):
-            # deferred evaluation of SimObject; continue to defer if
-            # we're just assigning a null pointer
-            return value
-        if isinstance(value, self.ptype):
-            return value
-        if isNullPointer(value) and isSimObjectClass(self.ptype):
-            return value
-        return self.ptype(value)
+        converter = self.__dict__.get("_converter")
+        if converter is None:
+            if "ptype" not in self.__dict__ and isNullPointer(value):
+                # deferred evaluation of SimObject; continue to defer if
+                # we're just assigning a null pointer
+                return value
+            converter = self._make_converter()
+            self._converter = converter
+        return converter(value)
+
+    # Build the conversion function for this param once its type is
+    # known, so that the type checks are not repeated on every
+    # assignment.
+    def _make_converter(self):
+        ptype = self.ptype
+        if isSimObjectClass(ptype):
+
+            def converter(value):
+                if isinstance(value, ptype) or isNullPointer(value):
+                    return value
+                return ptype(value)
+
+        else:
+
+            def converter(value):
+                if isinstance(value, ptype):
+                    return value
+                return ptype(value)
+
+        return converter
 
     def pretty_print(self, value):
         if isinstance(value, proxy.BaseProxy):
@@ -717,6 +746,8 @@ class String(ParamValue, str):
 # operations in a type-safe way.  e.g., a Latency times an int returns
 # a new Latency object.
 class NumericParamValue(ParamValue):
+    __slots__ = ("value",)
+
     @staticmethod
     def unwrap(v):
         return v.value if isinstance(v, NumericParamValue) else v
@@ -813,6 +844,12 @@ class NumericParamValue(ParamValue):
 
 # Metaclass for bounds-checked integer parameters.  See CheckedInt.
 class CheckedIntType(MetaParamValue):
+    def __new__(mcls, name, bases, dct):
+        # Bounds-checked integers only hold the value slot declared by
+        # NumericParamValue, so don't give every instance a __dict__.
+        dct.setdefault("__slots__", ())
+        return super().__new__(mcls, name, bases, dct)
+
     def __init__(cls, name, bases, dict):
         super().__init__(name, bases, dict)
 
@@ -1908,6 +1945,8 @@ frequency_tolerance = 0.001  # 0.1%
 
 
 class TickParamValue(NumericParamValue):
+    __slots__ = ("ticks",)
+
     cxx_type = "Tick"
     ex_str = "1MHz"
     cmd_line_settable = True
@@ -1935,6 +1974,8 @@ class TickParamValue(NumericParamValue):
 
 
 class Latency(TickParamValue):
+    __slots__ = ()
+
     ex_str = "100ns"
 
     def __init__(self, value):
@@ -1978,6 +2019,8 @@ class Latency(TickParamValue):
 
 
 class Frequency(TickParamValue):
+    __slots__ = ()
+
     ex_str = "1GHz"
 
     def __init__(self, value):
@@ -2023,6 +2066,8 @@ class Frequency(TickParamValue):
 # A generic Frequency and/or Latency value. Value is stored as a
 # latency, just like Latency and Frequency.
 class Clock(TickParamValue):
+    __slots__ = ()
+
     def __init__(self, value):
         if isinstance(value, (Latency, Clock)):
             self.ticks = value.ticks
@@ -41,6 +41,8 @@ import atexit
 import os
 import sys
 
+from m5.util import config_profile
+from m5.util.config_snapshot import write_snapshot
 from m5.util.dot_writer import (
     do_dot,
     do_dvfs_dot,
@@ -99,15 +101,29 @@ def instantiate(ckpt_dir=None):
     for obj in root.descendants():
         obj.adoptOrphanParams()
 
-    # Unproxy in sorted order for determinism
-    for obj in root.descendants():
-        obj.unproxyParams()
+    # From here on the shape of the hierarchy is fixed, so flatten it
+    # once and reuse the flattened view for every pass below.
+    hierarchy = SimObject.getHierarchy(root)
+
+    # Unproxy in sorted order for determinism. Unproxying may still
+    # adopt new objects, in which case the newly found objects are
+    # unproxied in a further pass.
+    unproxied = set()
+    while True:
+        for obj in hierarchy:
+            if id(obj) not in unproxied:
+                unproxied.add(id(obj))
+                obj.unproxyParams()
+        if hierarchy.valid():
+            break
+        hierarchy = SimObject.getHierarchy(root)
 
     if options.dump_config:
         ini_file = open(os.path.join(options.outdir, options.dump_config), "w")
         # Print ini sections in sorted order for easier diffing
-        for obj in sorted(root.descendants(), key=lambda o: o.path()):
-            obj.print_ini(ini_file)
+        paths = hierarchy.paths()
+        for path in sorted(paths):
+            paths[path].print_ini(ini_file)
         ini_file.close()
 
     if options.json_config:
@@ -123,6 +139,11 @@ def instantiate(ckpt_dir=None):
         except ImportError:
             pass
 
+    if options.config_snapshot:
+        write_snapshot(
+            os.path.join(options.outdir, options.config_snapshot), hierarchy
+        )
+
     if options.dot_config:
         do_dot(root, options.outdir, options.dot_config)
         do_ruby_dot(root, options.outdir, options.dot_config)
@@ -131,13 +152,13 @@ def instantiate(ckpt_dir=None):
     stats.initSimStats()
 
     # Create the C++ sim objects and connect ports
-    for obj in root.descendants():
+    for obj in hierarchy:
         obj.createCCObject()
-    for obj in root.descendants():
+    for obj in hierarchy:
         obj.connectPorts()
 
     # Do a second pass to finish initializing the sim objects
-    for obj in root.descendants():
+    for obj in hierarchy:
         obj.init()
 
     # Do a third pass to initialize statistics
@@ -145,11 +166,11 @@ def instantiate(ckpt_dir=None):
     root.regStats()
 
     # Do a fourth pass to initialize probe points
-    for obj in root.descendants():
+    for obj in hierarchy:
         obj.regProbePoints()
 
     # Do a fifth pass to connect probe listeners
-    for obj in root.descendants():
+    for obj in hierarchy:
         obj.regProbeListeners()
 
     # We want to generate the DVFS diagram for the system. This can only be
@@ -165,10 +186,10 @@ def instantiate(ckpt_dir=None):
     if ckpt_dir:
         _drain_manager.preCheckpointRestore()
         ckpt = _m5.core.getCheckpoint(ckpt_dir)
-        for obj in root.descendants():
+        for obj in hierarchy:
             obj.loadState(ckpt)
     else:
-        for obj in root.descendants():
+        for obj in hierarchy:
             obj.initState()
 
     # Check to see if any of the stat events are in the past after resuming from
@@ -177,6 +198,11 @@ def instantiate(ckpt_dir=None):
 
     gather_citations(root)
 
+    if options.profile_config:
+        config_profile.finish(
+            os.path.join(options.outdir, options.profile_config)
+        )
+
 
 need_startup = True
 
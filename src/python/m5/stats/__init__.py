@@ -51,7 +51,10 @@ import _m5.stats
 from _m5.stats import periodicStatDump
 from _m5.stats import schedStatEvent as schedEvent
 
-from .gem5stats import JsonOutputVistor
+from .gem5stats import (
+    ColumnarOutputVisitor,
+    JsonOutputVistor,
+)
 
 outputList = []
 
@@ -202,6 +205,29 @@ def _jsonFactory(fn):
     return JsonOutputVistor(fn)
 
 
+@_url_factory(["col"])
+def _columnarFactory(fn, chunk_size=64):
+    """Output stats as a columnar time series.
+
+    Every dump is appended as a row of a memory-mappable file holding a
+    stat-name dictionary and one fixed-width column per stat element. Use
+    m5.ext.pystats.ColumnarStatsReader to load one stat across all dumps as
+    a NumPy array without reading the rest of the file.
+
+    Sparse histograms are not included. Distributions are stored as their
+    buckets followed by underflow, overflow, min, max, sum and squares.
+
+    Parameters:
+      * chunk_size (unsigned): Number of dumps buffered per chunk (default: 64)
+
+    Example:
+      col://stats.gcol?chunk_size=128
+
+    """
+
+    return ColumnarOutputVisitor(fn, chunk_size=chunk_size)
+
+
 def addStatVisitor(url):
     """Add a stat visitor specified using a URL string
 
@@ -418,7 +444,7 @@ def dump(roots=None):
         prepare()
 
     for output in outputList:
-        if isinstance(output, JsonOutputVistor):
+        if isinstance(output, (JsonOutputVistor, ColumnarOutputVisitor)):
             if not all_roots:
                 output.dump(Root.getInstance())
             else:
@@ -29,13 +29,17 @@ This serves as the bridge between the gem5 statistics exposed via PyBind11 and
 the Python Stats model.
 """
 
+import atexit
+import json
 from datetime import datetime
 from typing import (
     IO,
+    Any,
     List,
     Union,
 )
 
+from m5.ext.pystats.columnar import ColumnarStatsWriter
 from m5.ext.pystats.group import *
 from m5.ext.pystats.simstat import *
 from m5.ext.pystats.statistic import *
@@ -43,6 +47,8 @@ from m5.ext.pystats.storagetype import *
 from m5.objects import *
 from m5.params import SimObjectVector
 
+import m5
+
 import _m5.stats
 
 
@@ -54,16 +60,23 @@ class JsonOutputVistor:
 
     file: str
     json_args: Dict
+    incremental: bool
 
-    def __init__(self, file: str, **kwargs):
+    def __init__(self, file: str, incremental: bool = False, **kwargs):
         """
         :param file: The output file location in which the JSON will be dumped.
 
+        :param incremental: If ``True``, the SimStat tree is built on the
+                            first dump and only its values are refreshed on
+                            subsequent dumps (see ``SimStatSnapshot``).
+
         :param kwargs: Additional parameters to be passed to the ``json.dumps`` method.
         """
 
         self.file = file
+        self.incremental = incremental
         self.json_args = kwargs
+        self._snapshots = {}
 
     def dump(self, roots: Union[List[SimObject], Root]) -> None:
         """
@@ -80,17 +93,107 @@ class JsonOutputVistor:
         """
 
         with open(self.file, "w") as fp:
-            simstat = get_simstat(root=roots, prepare_stats=False)
+            if self.incremental:
+                key = tuple(id(r) for r in roots)
+                if key not in self._snapshots:
+                    self._snapshots[key] = SimStatSnapshot(
+                        root=roots, prepare_stats=False
+                    )
+                else:
+                    self._snapshots[key].refresh(prepare_stats=False)
+                simstat = self._snapshots[key].simstat
+            else:
+                simstat = get_simstat(root=roots, prepare_stats=False)
             simstat.dump(fp=fp, **self.json_args)
 
 
-def __get_statistic(statistic: _m5.stats.Info) -> Optional[Statistic]:
+class ColumnarOutputVisitor:
+    """
+    A stat visitor which appends every dump as a row of a columnar,
+    memory-mappable stats file (see ``m5.ext.pystats.columnar``).
+    """
+
+    def __init__(self, file: str, chunk_size: int = 64):
+        """
+        :param file: The output file location.
+
+        :param chunk_size: The number of dumps buffered before they are
+                           written to the file.
+        """
+
+        self._writer = ColumnarStatsWriter(file, chunk_size=chunk_size)
+        atexit.register(self._writer.close)
+
+    def dump(self, roots: Union[List[SimObject], Root]) -> None:
+        """
+        Appends the current values of the stats of a simulation root (or list
+        of roots) to the output file.
+
+        .. warning::
+
+            This dump assumes the statistics have already been prepared
+            for the target root.
+
+        :param roots: The Root, or List of roots, whose stats are to be
+                      dumped.
+        """
+
+        layout = []
+        values = []
+
+        def visit_group(group: _m5.stats.Group, prefix: str) -> None:
+            for stat in group.getStats():
+                stat_values = _get_flat_values(stat)
+                if stat_values is not None:
+                    layout.append((prefix + stat.name, len(stat_values)))
+                    values.extend(stat_values)
+            for name, child in group.getStatGroups().items():
+                visit_group(child, f"{prefix}{name}.")
+
+        for root in roots:
+            path = root.path()
+            visit_group(root, "" if path == "root" else f"{path}.")
+
+        self._writer.append(int(m5.curTick()), tuple(layout), values)
+
+
+def _get_flat_values(statistic: _m5.stats.Info) -> Optional[List[float]]:
+    """
+    Returns the values of a statistic as a flat list, or ``None`` if the
+    statistic does not have a fixed number of values (sparse histograms).
+    For distributions the bucket values are followed by the underflow,
+    overflow, minimum, maximum, sum and sum of squares.
+    """
+
+    if isinstance(statistic, _m5.stats.ScalarInfo):
+        return [statistic.value]
+    elif isinstance(statistic, _m5.stats.DistInfo):
+        return list(statistic.values) + [
+            statistic.underflow,
+            statistic.overflow,
+            statistic.min_val,
+            statistic.max_val,
+            statistic.sum,
+            statistic.squares,
+        ]
+    elif isinstance(statistic, (_m5.stats.VectorInfo, _m5.stats.Vector2dInfo)):
+        return list(statistic.value)
+
+    return None
+
+
+def __get_statistic(
+    statistic: _m5.stats.Info, keep_nozero: bool = False
+) -> Optional[Statistic]:
     """
     Translates a _m5.stats.Info object into a Statistic object, to process
     statistics at the Python level.
 
     :param statistic: The Info object to be translated to a Statistic object.
 
+    :param keep_nozero: If ``True``, scalars flagged as "nozero" are
+                        translated even when their value is zero.
+
     :returns: The Statistic object of the Info object. Returns ``None`` if
               Info object cannot, or should not, be translated.
     """
@@ -99,7 +202,7 @@ def __get_statistic(statistic: _m5.stats.Info) -> Optional[Statistic]:
     statistic.prepare()
 
     if isinstance(statistic, _m5.stats.ScalarInfo):
-        if statistic.is_nozero and statistic.value == 0.0:
+        if not keep_nozero and statistic.is_nozero and statistic.value == 0.0:
             # In the case where the "nozero" flag is set, and the value is
             # zero, we don't want to include this statistic so return None.
             return None
@@ -171,9 +274,11 @@ def __get_distribution(statistic: _m5.stats.DistInfo) -> Distribution:
 def __get_vector(statistic: _m5.stats.VectorInfo) -> Vector:
     vec: Dict[Union[str, int, float], Scalar] = {}
 
+    # Each access to `statistic.value` copies the C++ vector, so fetch once.
+    values = statistic.value
     for index in range(statistic.size):
         # All the values in a Vector are Scalar values
-        value = statistic.value[index]
+        value = values[index]
         assert isinstance(value, float) or isinstance(value, int)
 
         # Sometimes elements within a vector are defined by their name. Other
@@ -213,6 +318,7 @@ def __get_vector2d(statistic: _m5.stats.Vector2dInfo) -> Vector2d:
     description = statistic.desc
     x_size = statistic.x_size
     y_size = statistic.y_size
+    values = statistic.value
 
     vector_rep: Dict[Union[str, int, float], Vector] = {}
     for x_index in range(x_size):
@@ -230,7 +336,7 @@ def __get_vector2d(statistic: _m5.stats.Vector2dInfo) -> Vector2d:
                 y_index_val = str(statistic.subnames[y_index])
 
             x_vec[y_index_val] = Scalar(
-                value=statistic.value[x_index * y_size + y_index],
+                value=values[x_index * y_size + y_index],
                 unit=statistic.unit,
                 datatype=StorageType["f64"],
             )
@@ -276,13 +382,19 @@ def _prepare_stats(group: _m5.stats.Group):
         _prepare_stats(child)
 
 
-def _process_simobject_object(simobject: SimObject) -> SimObjectGroup:
+def _process_simobject_object(
+    simobject: SimObject, bindings: Optional[List["_StatBinding"]] = None
+) -> SimObjectGroup:
     """
     Processes the stats of a SimObject, and returns a dictionary of the stats
     for the SimObject with PyStats objects when appropriate.
 
     :param simobject: The SimObject to process the stats for.
 
+    :param bindings: If not ``None``, a ``_StatBinding`` is appended to this
+                     list for every translated statistic so its value can be
+                     refreshed later without rebuilding the tree.
+
     :returns: A dictionary of the PyStats stats for the SimObject.
     """
 
@@ -298,13 +410,18 @@ def _process_simobject_object(simobject: SimObject) -> SimObjectGroup:
         else {}
     )
 
+    keep_nozero = bindings is not None
     for stat in simobject.getStats():
-        val = __get_statistic(stat)
+        val = __get_statistic(stat, keep_nozero=keep_nozero)
         if val:
             stats[stat.name] = val
+            if bindings is not None:
+                bindings.append(
+                    _StatBinding(_stat_path(simobject, stat.name), stat, val)
+                )
 
     for name, child in simobject._children.items():
-        to_add = _process_simobject_stats(child)
+        to_add = _process_simobject_stats(child, bindings=bindings)
         if to_add:
             stats[name] = to_add
 
@@ -317,7 +434,9 @@ def _process_simobject_object(simobject: SimObject) -> SimObjectGroup:
             re.compile(f"{to_match}" + r"\d*").search(name)
             for to_match in stats.keys()
         ):
-            stats[name] = Group(**_process_simobject_stats(child))
+            stats[name] = Group(
+                **_process_simobject_stats(child, bindings=bindings)
+            )
 
     return SimObjectGroup(**stats)
 
@@ -326,6 +445,7 @@ def _process_simobject_stats(
     simobject: Union[
         SimObject, SimObjectVector, List[Union[SimObject, SimObjectVector]]
     ],
+    bindings: Optional[List["_StatBinding"]] = None,
 ) -> Union[List[Dict], Dict]:
     """
     Processes the stats of a SimObject, SimObjectVector, or List of either, and
@@ -333,27 +453,281 @@ def _process_simobject_stats(
 
     :param simobject: The SimObject to process the stats for.
 
+    :param bindings: Passed through to ``_process_simobject_object``.
+
     :returns: A dictionary of the stats for the SimObject.
     """
 
     if isinstance(simobject, SimObject):
-        return _process_simobject_object(simobject)
+        return _process_simobject_object(simobject, bindings=bindings)
 
     if isinstance(simobject, (list, SimObjectVector)):
         stats_list = []
         for obj in simobject:
-            stats_list.append(_process_simobject_stats(obj))
+            stats_list.append(_process_simobject_stats(obj, bindings=bindings))
         return SimObjectVectorGroup(value=stats_list)
 
     return {}
 
 
+def _stat_path(simobject: SimObject, name: str) -> str:
+    """
+    Returns the dotted name of a stat as it appears in the text stats output,
+    e.g. ``system.cpu.numCycles``.
+    """
+    path = simobject.path()
+    if path == "root":
+        return name
+    return f"{path}.{name}"
+
+
+def _refresh_statistic(statistic: _m5.stats.Info, pystat: Statistic) -> Any:
+    """
+    Updates the values of an existing PyStats Statistic in place from its
+    _m5.stats.Info object. The structure of the Statistic (its keys and
+    number of elements) is assumed not to have changed since it was created
+    by ``__get_statistic``, with the exception of sparse histograms whose
+    sampled values are rebuilt.
+
+    :param statistic: The Info object the Statistic was translated from.
+
+    :param pystat: The Statistic to update.
+
+    :returns: A hashable representation of the raw values, used to detect
+              whether the Statistic has changed between refreshes.
+    """
+
+    statistic.prepare()
+
+    if isinstance(statistic, _m5.stats.ScalarInfo):
+        value = statistic.value
+        pystat.value = value
+        return value
+    elif isinstance(statistic, _m5.stats.DistInfo):
+        values = statistic.values
+        for scalar, value in zip(pystat.value.values(), values):
+            scalar.value = value
+        pystat.min = statistic.min_val
+        pystat.max = statistic.max_val
+        pystat.sum = statistic.sum
+        pystat.sum_squared = statistic.squares
+        pystat.underflow = statistic.underflow
+        pystat.overflow = statistic.overflow
+        pystat.logs = statistic.logs
+        return (
+            tuple(values),
+            pystat.min,
+            pystat.max,
+            pystat.sum,
+            pystat.sum_squared,
+            pystat.underflow,
+            pystat.overflow,
+            pystat.logs,
+        )
+    elif isinstance(statistic, _m5.stats.VectorInfo):
+        values = statistic.value
+        for scalar, value in zip(pystat.value.values(), values):
+            scalar.value = value
+        return tuple(values)
+    elif isinstance(statistic, _m5.stats.Vector2dInfo):
+        values = statistic.value
+        scalars = (
+            scalar
+            for vector in pystat.value.values()
+            for scalar in vector.value.values()
+        )
+        for scalar, value in zip(scalars, values):
+            scalar.value = value
+        return tuple(values)
+    elif isinstance(statistic, _m5.stats.SparseHistInfo):
+        values = statistic.values
+        pystat.value = {
+            val: Scalar(
+                value=values[val],
+                unit=statistic.unit,
+                datatype=StorageType["f64"],
+            )
+            for val in values
+        }
+        return tuple(sorted(values.items()))
+
+    return None
+
+
+class _StatBinding:
+    """
+    Associates a PyStats Statistic with the _m5.stats.Info object it was
+    translated from, along with the raw values seen at the last refresh.
+    """
+
+    __slots__ = ("path", "info", "pystat", "last")
+
+    def __init__(self, path: str, info: _m5.stats.Info, pystat: Statistic):
+        self.path = path
+        self.info = info
+        self.pystat = pystat
+        self.last = None
+
+
+class SimStatSnapshot:
+    """
+    An incrementally updated SimStat.
+
+    ``get_simstat`` walks every SimObject and builds a new PyStats tree each
+    time it is called. A SimStatSnapshot builds the tree once (typically
+    after ``m5.instantiate()``) and keeps a flat list of bindings between each
+    PyStats Statistic and its C++ Info object. Subsequent calls to
+    ``refresh()`` only update the values held in the existing tree, and record
+    which stats have changed since the previous refresh.
+
+    .. note::
+
+        The structure of the tree is frozen when the snapshot is created.
+        Stat groups or SimObjects created after that point are not tracked.
+        Scalars flagged as "nozero" are always included, so that they are
+        tracked even if they are zero when the snapshot is created.
+
+    Usage
+    -----
+
+    .. code-block::
+
+        snapshot = SimStatSnapshot(root)
+        ...
+        m5.simulate(period)
+        snapshot.refresh()
+        for path, value in snapshot.delta().items():
+            print(path, value)
+    """
+
+    def __init__(
+        self,
+        root: Union[
+            Union[SimObject, SimObjectVector],
+            List[Union[SimObject, SimObjectVector]],
+        ],
+        prepare_stats: bool = True,
+    ):
+        """
+        :param root: A SimObject, or list of SimObjects, whose stats are to
+                     be tracked. See ``get_simstat``.
+
+        :param prepare_stats: Dictates whether the stats are to be prepared
+                              prior to building the snapshot.
+        """
+
+        self._root = root
+        self._bindings: List[_StatBinding] = []
+        self._changed: List[_StatBinding] = []
+        self.simstat = get_simstat(
+            root=root, prepare_stats=prepare_stats, _bindings=self._bindings
+        )
+        for binding in self._bindings:
+            binding.last = _refresh_statistic(binding.info, binding.pystat)
+        self._changed = list(self._bindings)
+
+    def refresh(self, prepare_stats: bool = True) -> SimStat:
+        """
+        Updates the values of the snapshot's SimStat from the current
+        simulation statistics.
+
+        :param prepare_stats: Dictates whether the stats are to be prepared
+                              prior to reading them. By default this is
+                              ``True``.
+
+        :returns: The updated SimStat object. This is the same object on
+                  every call.
+        """
+
+        if prepare_stats:
+            _m5.stats.processDumpQueue()
+            for r in self._root:
+                if isinstance(r, list):
+                    for obj in r:
+                        _prepare_stats(obj)
+                else:
+                    _prepare_stats(r)
+
+        changed = []
+        for binding in self._bindings:
+            current = _refresh_statistic(binding.info, binding.pystat)
+            if current != binding.last:
+                binding.last = current
+                changed.append(binding)
+        self._changed = changed
+
+        _update_simstat_times(self.simstat)
+        return self.simstat
+
+    def changed(self) -> List[str]:
+        """
+        :returns: The paths of the stats whose values changed during the last
+                  ``refresh()``. Before the first refresh, all tracked stats
+                  are considered changed.
+        """
+
+        return [binding.path for binding in self._changed]
+
+    def delta(self) -> Dict[str, Any]:
+        """
+        :returns: A dictionary mapping the path of every stat that changed
+                  during the last ``refresh()`` to its new value. Scalars are
+                  given as numbers, other stats in their JSON form.
+        """
+
+        return {
+            binding.path: (
+                binding.pystat.value
+                if isinstance(binding.pystat, Scalar)
+                else binding.pystat.to_json()
+            )
+            for binding in self._changed
+        }
+
+    def dump_delta(self, fp: IO[str], **kwargs) -> None:
+        """
+        Writes the output of ``delta()``, along with the simulated begin and
+        end times, as a single line of JSON to ``fp``. Appending one line per
+        dump to the same file gives a compact, delta-encoded time series.
+
+        :param fp: The Text IO stream to output the JSON to.
+
+        :param kwargs: Additional parameters to be passed to the ``json.dump``
+                       method.
+        """
+
+        json.dump(
+            {
+                "simulated_begin_time": self.simstat.simulated_begin_time,
+                "simulated_end_time": self.simstat.simulated_end_time,
+                "delta": self.delta(),
+            },
+            fp,
+            **kwargs,
+        )
+        fp.write("\n")
+
+
+def _update_simstat_times(simstat: SimStat) -> None:
+    """
+    Sets the creation time and simulated begin/end times of a SimStat from
+    the current state of the simulation.
+    """
+
+    final_tick = Root.getInstance().resolveStat("finalTick").value
+    sim_ticks = Root.getInstance().resolveStat("simTicks").value
+    simstat.creation_time = datetime.now()
+    simstat.simulated_begin_time = int(final_tick - sim_ticks)
+    simstat.simulated_end_time = int(final_tick)
+
+
 def get_simstat(
     root: Union[
         Union[SimObject, SimObjectVector],
         List[Union[SimObject, SimObjectVector]],
     ],
     prepare_stats: bool = True,
+    _bindings: Optional[List[_StatBinding]] = None,
 ) -> SimStat:
     """
     This function will return the SimStat object for a simulation given a
@@ -372,6 +746,12 @@ def get_simstat(
 
     :Returns: The SimStat Object of the current simulation.
 
+    .. note::
+
+        To repeatedly obtain the stats of the same simulation, e.g. for
+        periodic stat dumps, ``SimStatSnapshot`` avoids rebuilding the
+        SimStat on every call.
+
     """
 
     if prepare_stats:
@@ -386,7 +766,7 @@ def get_simstat(
             else:
                 _prepare_stats(r)
 
-        stats = _process_simobject_stats(r).__dict__
+        stats = _process_simobject_stats(r, bindings=_bindings).__dict__
         stats["name"] = r.get_name() if r.get_name() else "root"
         stats_map[stats["name"]] = stats
 
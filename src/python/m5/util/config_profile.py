@@ -0,0 +1,202 @@
+# Copyright (c) 2026 The Regents of the University of California
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met: redistributions of source code must retain the above copyright
+# notice, this list of conditions and the following disclaimer;
+# redistributions in binary form must reproduce the above copyright
+# notice, this list of conditions and the following disclaimer in the
+# documentation and/or other materials provided with the distribution;
+# neither the name of the copyright holders nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+# A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+# THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""
+Profiling of the time spent building a configuration.
+
+When enabled (``--profile-config``), the SimObject and parameter methods
+that dominate configuration time are wrapped with timers. Every call is
+attributed to the SimObject class and parameter it operates on, and the
+time spent in nested calls is only counted once, against the innermost
+call. The report is written when ``m5.instantiate()`` has finished.
+"""
+
+from collections import defaultdict
+from functools import wraps
+from time import perf_counter
+
+_profiler = None
+
+
+def _class_name(obj):
+    return obj.__name__ if isinstance(obj, type) else type(obj).__name__
+
+
+class ConfigProfiler:
+    def __init__(self):
+        # (kind, class name, param name) -> [calls, inclusive, exclusive]
+        self.entries = {}
+        self._stack = []
+        self._patched = []
+        self._start = perf_counter()
+
+    def _record(self, key, func, args, kwargs):
+        stack = self._stack
+        stack.append(0.0)
+        start = perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            elapsed = perf_counter() - start
+            nested = stack.pop()
+            if stack:
+                stack[-1] += elapsed
+            entry = self.entries.get(key)
+            if entry is None:
+                entry = self.entries[key] = [0, 0.0, 0.0]
+            entry[0] += 1
+            entry[1] += elapsed
+            entry[2] += elapsed - nested
+
+    def _wrap(self, owner, name, kind, key):
+        func = owner.__dict__[name]
+
+        @wraps(func)
+        def timed(*args, **kwargs):
+            return self._record((kind,) + key(*args), func, args, kwargs)
+
+        type.__setattr__(owner, name, timed)
+        self._patched.append((owner, name, func))
+
+    def install(self):
+        from m5 import params
+        from m5.SimObject import (
+            MetaSimObject,
+            SimObject,
+        )
+
+        def attr_key(obj, attr, *args):
+            return _class_name(obj), attr
+
+        def object_key(obj, *args, **kwargs):
+            return _class_name(obj), None
+
+        def convert_key(desc, value):
+            return desc.ptype_str, getattr(desc, "name", None)
+
+        self._wrap(MetaSimObject, "__setattr__", "set", attr_key)
+        self._wrap(MetaSimObject, "__getattr__", "get", attr_key)
+        self._wrap(SimObject, "__init__", "create", object_key)
+        self._wrap(SimObject, "__setattr__", "set", attr_key)
+        self._wrap(SimObject, "__getattr__", "get", attr_key)
+        self._wrap(SimObject, "unproxyParams", "unproxy", object_key)
+        for desc in (
+            params.SingleTypeParamDesc,
+            params.VectorParamDesc,
+            params.OptionalParamDesc,
+            params.DictParamDesc,
+        ):
+            self._wrap(desc, "convert", "convert", convert_key)
+
+    def uninstall(self):
+        for owner, name, func in reversed(self._patched):
+            type.__setattr__(owner, name, func)
+        self._patched = []
+
+    def by_class(self):
+        """
+        Return ``{class name: [calls, exclusive seconds]}`` for all the
+        SimObject methods, excluding parameter conversions.
+        """
+        totals = defaultdict(lambda: [0, 0.0])
+        for (kind, cls, attr), (calls, _, exclusive) in self.entries.items():
+            if kind != "convert":
+                totals[cls][0] += calls
+                totals[cls][1] += exclusive
+        return dict(totals)
+
+    def by_param(self):
+        """
+        Return ``{(kind, class name, param): [calls, inclusive, exclusive]}``
+        for the accesses to individual params.
+        """
+        return {
+            key: entry
+            for key, entry in self.entries.items()
+            if key[2] is not None
+        }
+
+    def report(self, out, limit=50):
+        total = perf_counter() - self._start
+        profiled = sum(entry[2] for entry in self.entries.values())
+        print("Configuration time profile", file=out)
+        print(f"  Wall time since profiling began: {total:.3f}s", file=out)
+        print(f"  Time in profiled methods:        {profiled:.3f}s", file=out)
+
+        print(file=out)
+        print("Exclusive time by SimObject class:", file=out)
+        print(f"{'seconds':>10} {'calls':>10}  class", file=out)
+        classes = sorted(
+            self.by_class().items(), key=lambda kv: kv[1][1], reverse=True
+        )
+        for cls, (calls, seconds) in classes[:limit]:
+            print(f"{seconds:10.4f} {calls:10d}  {cls}", file=out)
+
+        print(file=out)
+        print("Time by parameter (inclusive, exclusive):", file=out)
+        print(
+            f"{'incl':>10} {'excl':>10} {'calls':>10}  kind     param",
+            file=out,
+        )
+        param_entries = sorted(
+            self.by_param().items(), key=lambda kv: kv[1][1], reverse=True
+        )
+        for (kind, cls, attr), (calls, inclusive, exclusive) in param_entries[
+            :limit
+        ]:
+            print(
+                f"{inclusive:10.4f} {exclusive:10.4f} {calls:10d}  "
+                f"{kind:<8} {cls}.{attr}",
+                file=out,
+            )
+
+
+def enable():
+    """Start profiling configuration time."""
+    global _profiler
+    if _profiler is None:
+        _profiler = ConfigProfiler()
+        _profiler.install()
+    return _profiler
+
+
+def enabled():
+    return _profiler is not None
+
+
+def finish(path):
+    """
+    Stop profiling and write the report to path. Does nothing if profiling
+    isn't enabled or the report has already been written.
+    """
+    global _profiler
+    if _profiler is None:
+        return
+    profiler = _profiler
+    _profiler = None
+    profiler.uninstall()
+    with open(path, "w") as out:
+        profiler.report(out)
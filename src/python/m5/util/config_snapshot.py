@@ -0,0 +1,341 @@
+# Copyright (c) 2026 The Regents of The University of California
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met: redistributions of source code must retain the above copyright
+# notice, this list of conditions and the following disclaimer;
+# redistributions in binary form must reproduce the above copyright
+# notice, this list of conditions and the following disclaimer in the
+# documentation and/or other materials provided with the distribution;
+# neither the name of the copyright holders nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+# A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+# THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+"""
+A compact binary snapshot of an instantiated configuration.
+
+The snapshot holds the same information as ``config.ini``: for every
+SimObject, its path and the ``key=value`` pairs of its section (type,
+children, params and ports). The file is laid out as follows:
+
+* A fixed size header with the number of strings and objects, and the
+  offsets of the string table and of the path index.
+* One record per object: the number of items followed by the
+  ``(key, value)`` string ids of each item.
+* The string table. Every distinct string (paths, keys and values) is
+  stored once and looked up by id through an offset array.
+* The path index, sorted by path. Every entry holds the path string id,
+  the offset of the object's record, and a digest of the object's items.
+
+Looking up an object only needs a binary search through the index, and
+only that object's record and strings are decoded. Two snapshots are
+compared by walking their indices together and only decoding the
+records whose digests differ.
+
+Usage
+-----
+
+.. code-block::
+
+    from m5.util.config_snapshot import ConfigSnapshot, diff_snapshots
+
+    with ConfigSnapshot("a/config.snap") as a, ConfigSnapshot(
+        "b/config.snap"
+    ) as b:
+        print(a.get("system.cpu.dcache"))
+        for path, key, old, new in diff_snapshots(a, b):
+            ...
+"""
+
+import hashlib
+import mmap
+import struct
+from typing import (
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+)
+
+MAGIC = b"GEM5CFG1"
+# magic, number of strings, number of objects, string table offset, index
+# offset
+_HEADER = struct.Struct("<8sIIQQ")
+_COUNT = struct.Struct("<I")
+_ITEM = struct.Struct("<II")
+_OFFSET = struct.Struct("<Q")
+# path string id, record offset, digest of the record's items
+_INDEX_ENTRY = struct.Struct("<IQ8s")
+
+Items = List[Tuple[str, str]]
+
+
+def _digest(items: Items) -> bytes:
+    h = hashlib.blake2b(digest_size=8)
+    for key, value in items:
+        h.update(f"{key}={value}\n".encode())
+    return h.digest()
+
+
+class ConfigSnapshotWriter:
+    """
+    Writes a configuration snapshot. Records are written as objects are
+    added, the string table and the index once the writer is closed.
+    """
+
+    def __init__(self, filename: str) -> None:
+        self._file = open(filename, "wb")
+        self._file.write(_HEADER.pack(MAGIC, 0, 0, 0, 0))
+        self._strings: Dict[str, int] = {}
+        self._index: List[Tuple[str, int, bytes]] = []
+
+    def _intern(self, string: str) -> int:
+        sid = self._strings.get(string)
+        if sid is None:
+            sid = self._strings[string] = len(self._strings)
+        return sid
+
+    def add(self, path: str, items: Items) -> None:
+        """
+        Add the object at path with its ``(key, value)`` items.
+        """
+        intern = self._intern
+        record = bytearray(_COUNT.pack(len(items)))
+        for key, value in items:
+            record += _ITEM.pack(intern(key), intern(value))
+        self._intern(path)
+        self._index.append((path, self._file.tell(), _digest(items)))
+        self._file.write(record)
+
+    def close(self) -> None:
+        if self._file.closed:
+            return
+        out = self._file
+        strings_offset = out.tell()
+        encoded = [string.encode() for string in self._strings]
+        offset = 0
+        offsets = bytearray()
+        for data in encoded:
+            offsets += _OFFSET.pack(offset)
+            offset += len(data)
+        offsets += _OFFSET.pack(offset)
+        out.write(offsets)
+        out.write(b"".join(encoded))
+
+        index_offset = out.tell()
+        self._index.sort()
+        out.write(
+            b"".join(
+                _INDEX_ENTRY.pack(self._strings[path], record, digest)
+                for path, record, digest in self._index
+            )
+        )
+
+        out.seek(0)
+        out.write(
+            _HEADER.pack(
+                MAGIC,
+                len(self._strings),
+                len(self._index),
+                strings_offset,
+                index_offset,
+            )
+        )
+        out.close()
+
+    def __enter__(self) -> "ConfigSnapshotWriter":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+
+def write_snapshot(filename: str, objects: Iterable) -> None:
+    """
+    Write a snapshot of the given SimObjects, usually all the descendants
+    of the root, to filename.
+    """
+    with ConfigSnapshotWriter(filename) as writer:
+        for obj in objects:
+            writer.add(obj.path(), list(obj.ini_items()))
+
+
+class ConfigSnapshot:
+    """
+    Reads a configuration snapshot. The file is memory-mapped and strings
+    and records are only decoded when they are needed.
+    """
+
+    def __init__(self, filename: str) -> None:
+        with open(filename, "rb") as f:
+            if f.read(len(MAGIC)) != MAGIC:
+                raise ValueError(f"{filename} is not a gem5 config snapshot")
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        (
+            _,
+            self._num_strings,
+            self._num_objects,
+            self._strings_offset,
+            self._index_offset,
+        ) = _HEADER.unpack_from(self._map, 0)
+        self._data_offset = self._strings_offset + _OFFSET.size * (
+            self._num_strings + 1
+        )
+        self._string_cache: Dict[int, str] = {}
+        self._paths: Optional[List[str]] = None
+
+    def close(self) -> None:
+        self._map.close()
+
+    def __enter__(self) -> "ConfigSnapshot":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self._num_objects
+
+    def _string(self, sid: int) -> str:
+        string = self._string_cache.get(sid)
+        if string is None:
+            start, end = struct.unpack_from(
+                "<QQ", self._map, self._strings_offset + _OFFSET.size * sid
+            )
+            string = self._map[
+                self._data_offset + start : self._data_offset + end
+            ].decode()
+            self._string_cache[sid] = string
+        return string
+
+    def _entry(self, pos: int) -> Tuple[int, int, bytes]:
+        return _INDEX_ENTRY.unpack_from(
+            self._map, self._index_offset + _INDEX_ENTRY.size * pos
+        )
+
+    def _path(self, pos: int) -> str:
+        if self._paths is not None:
+            return self._paths[pos]
+        return self._string(self._entry(pos)[0])
+
+    def _find(self, path: str) -> Optional[int]:
+        lo, hi = 0, self._num_objects
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._path(mid) < path:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo < self._num_objects and self._path(lo) == path:
+            return lo
+        return None
+
+    def _items(self, record: int) -> Items:
+        (count,) = _COUNT.unpack_from(self._map, record)
+        offset = record + _COUNT.size
+        return [
+            (self._string(key), self._string(value))
+            for key, value in _ITEM.iter_unpack(
+                self._map[offset : offset + _ITEM.size * count]
+            )
+        ]
+
+    def _type(self, pos: int) -> str:
+        return dict(self._items(self._entry(pos)[1])).get("type", "")
+
+    def paths(self) -> List[str]:
+        """Return the paths of all objects in sorted order."""
+        if self._paths is None:
+            self._paths = [self._path(pos) for pos in range(self._num_objects)]
+        return self._paths
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.paths())
+
+    def __contains__(self, path: str) -> bool:
+        return self._find(path) is not None
+
+    def items(self, path: str) -> Items:
+        """
+        Return the ``(key, value)`` items of the object at path in
+        ``config.ini`` order.
+
+        :raises KeyError: If there is no object at path.
+        """
+        pos = self._find(path)
+        if pos is None:
+            raise KeyError(path)
+        return self._items(self._entry(pos)[1])
+
+    def get(self, path: str) -> Dict[str, str]:
+        """
+        Return the items of the object at path as a dict.
+
+        :raises KeyError: If there is no object at path.
+        """
+        return dict(self.items(path))
+
+    def digest(self, path: str) -> bytes:
+        pos = self._find(path)
+        if pos is None:
+            raise KeyError(path)
+        return self._entry(pos)[2]
+
+
+Difference = Tuple[str, Optional[str], Optional[str], Optional[str]]
+
+
+def diff_snapshots(
+    a: ConfigSnapshot, b: ConfigSnapshot
+) -> Iterator[Difference]:
+    """
+    Compare two snapshots and generate their differences in path order.
+
+    Every difference is a ``(path, key, a_value, b_value)`` tuple, where a
+    value of None means that the item is missing from that snapshot.
+    Objects only present in one snapshot are reported once, with a key of
+    None and the type of the object as the value.
+    """
+    a_paths = a.paths()
+    b_paths = b.paths()
+    i = j = 0
+    while i < len(a_paths) or j < len(b_paths):
+        if j == len(b_paths) or (i < len(a_paths) and a_paths[i] < b_paths[j]):
+            yield a_paths[i], None, a._type(i), None
+            i += 1
+            continue
+        if i == len(a_paths) or b_paths[j] < a_paths[i]:
+            yield b_paths[j], None, None, b._type(j)
+            j += 1
+            continue
+
+        _, a_record, a_digest = a._entry(i)
+        _, b_record, b_digest = b._entry(j)
+        if a_digest != b_digest:
+            path = a_paths[i]
+            a_items = dict(a._items(a_record))
+            b_items = dict(b._items(b_record))
+            for key, value in a_items.items():
+                other = b_items.get(key)
+                if value != other:
+                    yield path, key, value, other
+            for key, value in b_items.items():
+                if key not in a_items:
+                    yield path, key, None, value
+        i += 1
+        j += 1
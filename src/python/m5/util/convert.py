@@ -38,6 +38,7 @@
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
 # metric prefixes
+from functools import lru_cache
 from typing import Optional
 
 atto = 1.0e-18
@@ -108,6 +109,14 @@ base_10_to_2 = {
 }
 
 
+# Configuration scripts tend to repeat the same handful of literals
+# ("1GHz", "64KiB", ...) for thousands of parameters, so the converters
+# used for clocks, latencies and sizes remember their results. Only
+# successful conversions are cached, errors are raised every time, and
+# the base 10 size warning is printed once per literal.
+_cached_conversion = lru_cache(maxsize=4096)
+
+
 def assertStr(value):
     if not isinstance(value, str):
         raise TypeError(f"wrong type '{type(value)}' should be str")
@@ -210,14 +219,17 @@ def toBool(value):
     raise ValueError(f"cannot convert '{value}' to bool")
 
 
+@_cached_conversion
 def toFrequency(value):
     return toMetricFloat(value, "frequency", "Hz")
 
 
+@_cached_conversion
 def toLatency(value):
     return toMetricFloat(value, "latency", "s")
 
 
+@_cached_conversion
 def anyToLatency(value):
     """Convert a magnitude and unit to a clock period."""
 
@@ -239,6 +251,7 @@ def anyToLatency(value):
         raise ValueError(f"'{value}' needs a valid unit to be unambiguous.")
 
 
+@_cached_conversion
 def anyToFrequency(value):
     """Convert a magnitude and unit to a clock frequency."""
 
@@ -260,10 +273,12 @@ def anyToFrequency(value):
         raise ValueError(f"'{value}' needs a valid unit to be unambiguous.")
 
 
+@_cached_conversion
 def toNetworkBandwidth(value):
     return toMetricFloat(value, "network bandwidth", "bps")
 
 
+@_cached_conversion
 def toMemoryBandwidth(value):
     checkBaseConversion(value, "B/s")
     return toBinaryFloat(value, "memory bandwidth", "B/s")
@@ -295,6 +310,7 @@ def checkBaseConversion(value, unit):
             )
 
 
+@_cached_conversion
 def toMemorySize(value):
     checkBaseConversion(value, "B")
     return toBinaryInteger(value, "memory size", "B")
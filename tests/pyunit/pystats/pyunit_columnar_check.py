@@ -0,0 +1,114 @@
+# Copyright (c) 2026 The Regents of The University of California
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met: redistributions of source code must retain the above copyright
+# notice, this list of conditions and the following disclaimer;
+# redistributions in binary form must reproduce the above copyright
+# notice, this list of conditions and the following disclaimer in the
+# documentation and/or other materials provided with the distribution;
+# neither the name of the copyright holders nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+# A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+# THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+
+import os
+import tempfile
+import unittest
+
+from m5.ext.pystats.columnar import (
+    ColumnarStatsReader,
+    ColumnarStatsWriter,
+)
+
+try:
+    import numpy
+
+    _have_numpy = True
+except ImportError:
+    _have_numpy = False
+
+
+@unittest.skipUnless(_have_numpy, "NumPy is required to read columnar stats")
+class ColumnarStatsTestSuite(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, "stats.gcol")
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def _write(self, dumps, chunk_size):
+        with ColumnarStatsWriter(self.path, chunk_size=chunk_size) as writer:
+            for tick, layout, values in dumps:
+                writer.append(tick, layout, values)
+
+    def test_round_trip(self):
+        layout = (("simTicks", 1), ("system.cpu.ipc", 1), ("vec", 3))
+        dumps = [
+            (i * 100, layout, [float(i), i / 2, i, i + 1, i + 2])
+            for i in range(10)
+        ]
+        # A chunk size of 4 leaves a partially filled final chunk.
+        self._write(dumps, chunk_size=4)
+
+        with ColumnarStatsReader(self.path) as reader:
+            self.assertEqual(10, len(reader))
+            self.assertEqual(
+                ["simTicks", "system.cpu.ipc", "vec"], reader.names()
+            )
+            self.assertEqual(
+                [i * 100 for i in range(10)], reader.ticks().tolist()
+            )
+            self.assertEqual(
+                [i / 2 for i in range(10)],
+                reader.get("system.cpu.ipc").tolist(),
+            )
+            vec = reader.get("vec")
+            self.assertEqual((10, 3), vec.shape)
+            self.assertEqual([7, 8, 9], vec[7].tolist())
+            self.assertEqual(
+                {
+                    "simTicks": [9.0],
+                    "system.cpu.ipc": [4.5],
+                    "vec": [9, 10, 11],
+                },
+                reader.dump(-1),
+            )
+            with self.assertRaises(KeyError):
+                reader.get("missing")
+
+    def test_layout_change(self):
+        first = (("a", 1),)
+        second = (("a", 1), ("b", 2))
+        self._write(
+            [(0, first, [1.0]), (1, second, [2.0, 3.0, 4.0])], chunk_size=8
+        )
+
+        with ColumnarStatsReader(self.path) as reader:
+            self.assertEqual([1.0, 2.0], reader.get("a").tolist())
+            b = reader.get("b")
+            self.assertTrue(numpy.isnan(b[0]).all())
+            self.assertEqual([3.0, 4.0], b[1].tolist())
+
+    def test_truncated_file(self):
+        layout = (("a", 1),)
+        self._write([(i, layout, [float(i)]) for i in range(4)], chunk_size=2)
+        with open(self.path, "r+b") as f:
+            f.truncate(os.path.getsize(self.path) - 1)
+
+        with ColumnarStatsReader(self.path) as reader:
+            self.assertEqual([0.0, 1.0], reader.get("a").tolist())
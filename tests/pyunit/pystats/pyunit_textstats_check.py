@@ -0,0 +1,136 @@
+# Copyright (c) 2026 The Regents of The University of California
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met: redistributions of source code must retain the above copyright
+# notice, this list of conditions and the following disclaimer;
+# redistributions in binary form must reproduce the above copyright
+# notice, this list of conditions and the following disclaimer in the
+# documentation and/or other materials provided with the distribution;
+# neither the name of the copyright holders nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+# A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+# THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import gzip
+import os
+import tempfile
+import unittest
+
+from m5.ext.pystats.textstats import (
+    TextStatsReader,
+    parse_line,
+)
+
+
+def _dump(tick, ipc, extra=""):
+    return (
+        "\n---------- Begin Simulation Statistics ----------\n"
+        f"final_tick {tick:>30} # Number of ticks (Tick)\n"
+        f"system.cpu.ipc {ipc:>26} # IPC ((Count/Cycle))\n"
+        f"{extra}"
+        "system.mem.lat::0-1 3 60.00% 60.00% # Latency (Tick)\n"
+        "\n---------- End Simulation Statistics   ----------\n"
+    )
+
+
+class TextStatsTestSuite(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, "stats.txt")
+        self.text = (
+            _dump(100, 0.5)
+            + _dump(200, 1.5, "system.cpu.extra 7 # Only here (Count)\n")
+            + _dump(300, 2.5)
+        )
+        with open(self.path, "w") as f:
+            f.write(self.text)
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_parse_line(self):
+        stat = parse_line("system.cpu.ipc   1.25   # IPC (Count)")
+        self.assertEqual(stat.name, "system.cpu.ipc")
+        self.assertEqual(stat.value, 1.25)
+        self.assertEqual(stat.description, "IPC (Count)")
+        self.assertIsNone(parse_line(""))
+
+    def test_queries(self):
+        with TextStatsReader(self.path) as reader:
+            self.assertEqual(len(reader), 3)
+            self.assertFalse(reader.truncated)
+            self.assertEqual(reader.values("final_tick"), [100, 200, 300])
+            self.assertEqual(
+                reader.values("system.cpu.extra"), [None, 7, None]
+            )
+            self.assertEqual(reader.values("system.mem.lat::0-1"), [3, 3, 3])
+            self.assertEqual(
+                list(reader.dump(1)),
+                [
+                    "final_tick",
+                    "system.cpu.ipc",
+                    "system.cpu.extra",
+                    "system.mem.lat::0-1",
+                ],
+            )
+            self.assertEqual(reader.dump(-1)["system.cpu.ipc"].value, 2.5)
+            self.assertEqual(
+                [(dump, stat.value) for dump, stat in reader.find(r"\.ipc$")],
+                [(0, 0.5), (1, 1.5), (2, 2.5)],
+            )
+            with self.assertRaises(IndexError):
+                reader.dump(3)
+            with self.assertRaises(KeyError):
+                reader.values("missing")
+
+    def test_index_reuse(self):
+        # The index is only saved when asked to.
+        with TextStatsReader(self.path) as reader:
+            self.assertEqual(reader.values("system.cpu.ipc"), [0.5, 1.5, 2.5])
+        self.assertFalse(os.path.exists(self.path + ".index"))
+
+        with TextStatsReader(self.path, persist_index=True) as reader:
+            self.assertEqual(reader.values("system.cpu.ipc"), [0.5, 1.5, 2.5])
+        self.assertTrue(os.path.exists(self.path + ".index"))
+        with TextStatsReader(self.path, persist_index=True) as reader:
+            self.assertEqual(
+                reader.values("system.cpu.extra"), [None, 7, None]
+            )
+            self.assertEqual(reader.dump(2)["final_tick"].value, 300)
+
+        # A stale index is rebuilt.
+        with open(self.path, "a") as f:
+            f.write(_dump(400, 3.5))
+        with TextStatsReader(self.path, persist_index=True) as reader:
+            self.assertEqual(len(reader), 4)
+            self.assertEqual(reader.values("final_tick")[-1], 400)
+
+        # So is an index which isn't valid.
+        with open(self.path + ".index", "r+b") as f:
+            f.truncate(os.path.getsize(self.path + ".index") - 1)
+        with TextStatsReader(self.path, persist_index=True) as reader:
+            self.assertEqual(reader.values("final_tick")[-1], 400)
+
+    def test_truncated_gzip(self):
+        # Drop the gzip trailer, as if the stream was not closed properly.
+        data = gzip.compress(self.text.encode())
+        path = self.path + ".gz"
+        with open(path, "wb") as f:
+            f.write(data[:-8])
+        with TextStatsReader(path, persist_index=False) as reader:
+            self.assertTrue(reader.truncated)
+            self.assertEqual(reader.values("final_tick"), [100, 200, 300])
+        self.assertFalse(os.path.exists(path + ".index"))
@@ -0,0 +1,122 @@
+# Copyright (c) 2026 The Regents of the University of California
+# All Rights Reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met: redistributions of source code must retain the above copyright
+# notice, this list of conditions and the following disclaimer;
+# redistributions in binary form must reproduce the above copyright
+# notice, this list of conditions and the following disclaimer in the
+# documentation and/or other materials provided with the distribution;
+# neither the name of the copyright holders nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+# A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+# THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import gzip
+import os
+import tempfile
+import unittest
+from pathlib import Path
+
+from gem5.utils.checkpoint_store import (
+    PAGE_SIZE,
+    CheckpointStore,
+    is_packed,
+    materialize,
+    unpack,
+)
+
+_CHUNK_SIZE = 2 * PAGE_SIZE
+
+
+class CheckpointStoreTestSuite(unittest.TestCase):
+    """Test cases for gem5.utils.checkpoint_store"""
+
+    def setUp(self) -> None:
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmpdir.name)
+        self.store = CheckpointStore(
+            self.root / "store", chunk_size=_CHUNK_SIZE, workers=2
+        )
+
+    def tearDown(self) -> None:
+        self.tmpdir.cleanup()
+
+    def _checkpoint(self, name: str, image: bytes) -> Path:
+        cpt = self.root / name
+        cpt.mkdir()
+        (cpt / "m5.cpt").write_text(
+            "[system.physmem]\nfilename=system.physmem.store0.pmem\n"
+        )
+        with gzip.open(cpt / "system.physmem.store0.pmem", "wb") as f:
+            f.write(image)
+        return cpt
+
+    def _objects(self) -> int:
+        return len(list((self.store.path / "objects").glob("*/*")))
+
+    def test_dedup(self) -> None:
+        first = os.urandom(4 * _CHUNK_SIZE) + bytes(2 * _CHUNK_SIZE)
+        # Only the second chunk differs, the last one is partial
+        second = bytearray(first)
+        second[_CHUNK_SIZE] ^= 0xFF
+        second += b"tail"
+
+        slice0 = self._checkpoint("slice_0000", first)
+        self.assertFalse(is_packed(slice0))
+        self.assertEqual(self.store.pack(slice0), (6, 4))
+        self.assertTrue(is_packed(slice0))
+        self.assertFalse((slice0 / "system.physmem.store0.pmem").exists())
+
+        slice1 = self._checkpoint("slice_0001", bytes(second))
+        self.assertEqual(self.store.pack(slice1), (7, 2))
+        self.assertEqual(self._objects(), 6)
+
+        restored = materialize(slice1, self.root / "restore")
+        self.assertEqual(
+            (restored / "system.physmem.store0.pmem").read_bytes(), second
+        )
+        self.assertTrue((restored / "m5.cpt").exists())
+        self.assertTrue(is_packed(slice1))
+
+        unpack(slice0)
+        self.assertFalse(is_packed(slice0))
+        self.assertEqual(
+            (slice0 / "system.physmem.store0.pmem").read_bytes(), first
+        )
+
+    def test_gc(self) -> None:
+        slice0 = self._checkpoint("slice_0000", os.urandom(2 * _CHUNK_SIZE))
+        slice1 = self._checkpoint("slice_0001", os.urandom(2 * _CHUNK_SIZE))
+        self.store.pack(slice0)
+        self.store.pack(slice1)
+        self.assertEqual(self._objects(), 4)
+
+        self.assertEqual(self.store.gc([self.root])[0], 0)
+        (slice0 / "system.physmem.store0.pmem.chunks").unlink()
+        removed, freed = self.store.gc([self.root])
+        self.assertEqual(removed, 2)
+        self.assertGreater(freed, 2 * _CHUNK_SIZE)
+        self.assertEqual(self._objects(), 2)
+
+        restored = materialize(slice1, self.root / "restore")
+        self.assertEqual(
+            len((restored / "system.physmem.store0.pmem").read_bytes()),
+            2 * _CHUNK_SIZE,
+        )
+
+    def test_chunk_size(self) -> None:
+        with self.assertRaises(ValueError):
+            CheckpointStore(self.root / "bad", chunk_size=1000)
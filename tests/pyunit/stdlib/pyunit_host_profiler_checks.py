@@ -0,0 +1,91 @@
+# Copyright (c) 2026 The Regents of the University of California
+# All Rights Reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met: redistributions of source code must retain the above copyright
+# notice, this list of conditions and the following disclaimer;
+# redistributions in binary form must reproduce the above copyright
+# notice, this list of conditions and the following disclaimer in the
+# documentation and/or other materials provided with the distribution;
+# neither the name of the copyright holders nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+# A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+# THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import json
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from gem5.simulate import host_profiler
+from gem5.simulate.host_profiler import HostProfiler
+
+
+class HostProfilerTestSuite(unittest.TestCase):
+    """Test cases for gem5.simulate.host_profiler"""
+
+    def setUp(self) -> None:
+        # Host time advances by one second at every reading.
+        clock = iter(range(100))
+        self.patch = patch.object(
+            host_profiler, "perf_counter", lambda: float(next(clock))
+        )
+        self.patch.start()
+        self.profiler = HostProfiler()
+        # simulate: 1s, handler: 1s, simulate (after a stats reset): 1s
+        self.profiler.begin(0, 0)
+        self.profiler.end("simulate", "m5_exit", 1000, 5000)
+        self.profiler.begin(1000, 5000)
+        self.profiler.end("handler", "workbegin", 1000, 0)
+        self.profiler.begin(1000, 0)
+        self.profiler.end("simulate", "m5_exit", 3000, 2000)
+
+    def tearDown(self) -> None:
+        self.patch.stop()
+
+    def test_intervals(self) -> None:
+        first, handler, second = self.profiler.intervals
+        self.assertEqual(1.0, first.host_seconds())
+        self.assertEqual(1000, first.ticks())
+        self.assertEqual(5.0, first.kips())
+        self.assertEqual(0, handler.insts)
+        self.assertEqual(2000.0, second.ticks_per_second())
+
+    def test_totals(self) -> None:
+        totals = self.profiler.totals()
+        self.assertEqual(2, totals["simulate"]["count"])
+        self.assertEqual(3000, totals["simulate"]["ticks"])
+        self.assertEqual(7000, totals["simulate"]["insts"])
+        self.assertEqual(
+            {"workbegin": {"count": 1, "host_seconds": 1.0}},
+            self.profiler.by_handler(),
+        )
+        self.assertIn("workbegin", self.profiler.summary())
+
+    def test_export(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "trace.json"
+            self.profiler.dump_chrome_trace(path)
+            events = json.loads(path.read_text())["traceEvents"]
+            spans = [event for event in events if event["ph"] == "X"]
+            self.assertEqual(3, len(spans))
+            self.assertEqual("handler", spans[1]["cat"])
+            self.assertEqual(1e6, spans[1]["dur"])
+
+            path = Path(tmpdir) / "profile.json"
+            self.profiler.dump_json(path)
+            profile = json.loads(path.read_text())
+            self.assertEqual(3, len(profile["intervals"]))
@@ -0,0 +1,97 @@
+# Copyright (c) 2026 The Regents of the University of California
+# All Rights Reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met: redistributions of source code must retain the above copyright
+# notice, this list of conditions and the following disclaimer;
+# redistributions in binary form must reproduce the above copyright
+# notice, this list of conditions and the following disclaimer in the
+# documentation and/or other materials provided with the distribution;
+# neither the name of the copyright holders nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+# A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+# THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+
+import tempfile
+import unittest
+from pathlib import Path
+
+from gem5.utils.multisim.ledger import (
+    LEDGER_FILENAME,
+    JobLedger,
+    config_hash,
+)
+
+
+class JobLedgerTestSuite(unittest.TestCase):
+    """Test cases for gem5.utils.multisim.ledger"""
+
+    def setUp(self) -> None:
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.outdir = Path(self.tmpdir.name)
+        self.config = self.outdir / "config.py"
+        self.config.write_text("print('sweep')\n")
+
+    def tearDown(self) -> None:
+        self.tmpdir.cleanup()
+
+    def test_config_hash(self) -> None:
+        first = config_hash(self.config, "sim_0")
+        self.assertEqual(first, config_hash(self.config, "sim_0"))
+        self.assertNotEqual(first, config_hash(self.config, "sim_1"))
+        self.config.write_text("print('changed')\n")
+        self.assertNotEqual(first, config_hash(self.config, "sim_0"))
+
+    def test_resume(self) -> None:
+        ids = ["sim_0", "sim_1", "sim_2"]
+        hashes = {id: config_hash(self.config, id) for id in ids}
+
+        ledger = JobLedger(self.outdir)
+        self.assertEqual(ids, ledger.pending(ids, hashes))
+        ledger.record("sim_0", hashes["sim_0"], 0, 1.5)
+        ledger.record("sim_1", hashes["sim_1"], 1, 0.5)
+
+        # A new ledger, as in a rerun of the sweep, reads the entries back.
+        ledger = JobLedger(self.outdir)
+        self.assertEqual(["sim_1", "sim_2"], ledger.pending(ids, hashes))
+        self.assertEqual("failed", ledger.get_entry("sim_1")["status"])
+        self.assertEqual(1.5, ledger.get_entry("sim_0")["wall_time"])
+
+        # The latest entry for a simulation takes precedence.
+        ledger.record("sim_1", hashes["sim_1"], 0, 0.7)
+        ledger = JobLedger(self.outdir)
+        self.assertEqual(["sim_2"], ledger.pending(ids, hashes))
+
+        # A changed config hash invalidates the entry.
+        hashes["sim_0"] = "different"
+        self.assertEqual(["sim_0", "sim_2"], ledger.pending(ids, hashes))
+
+    def test_truncated_entry(self) -> None:
+        ledger = JobLedger(self.outdir)
+        ledger.record("sim_0", "hash", 0, 1.0)
+        with open(self.outdir / LEDGER_FILENAME, "a") as f:
+            f.write('{"id": "sim_1", "con')
+
+        ledger = JobLedger(self.outdir)
+        self.assertTrue(ledger.is_complete("sim_0", "hash"))
+        self.assertIsNone(ledger.get_entry("sim_1"))
+
+        # An entry appended after the truncated one is not lost.
+        ledger.record("sim_2", "hash", 0, 1.0)
+        ledger = JobLedger(self.outdir)
+        self.assertTrue(ledger.is_complete("sim_0", "hash"))
+        self.assertIsNone(ledger.get_entry("sim_1"))
+        self.assertTrue(ledger.is_complete("sim_2", "hash"))
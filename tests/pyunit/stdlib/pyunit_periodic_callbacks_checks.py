@@ -0,0 +1,116 @@
+# Copyright (c) 2026 The Regents of the University of California
+# All Rights Reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met: redistributions of source code must retain the above copyright
+# notice, this list of conditions and the following disclaimer;
+# redistributions in binary form must reproduce the above copyright
+# notice, this list of conditions and the following disclaimer in the
+# documentation and/or other materials provided with the distribution;
+# neither the name of the copyright holders nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+# A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+# THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import unittest
+
+from gem5.simulate.periodic_callbacks import (
+    PeriodicCallback,
+    PeriodicCallbackScheduler,
+)
+
+
+class PeriodicCallbackSchedulerTestSuite(unittest.TestCase):
+    """Test cases for gem5.simulate.periodic_callbacks"""
+
+    def simulate(self, scheduler, until, exits=()):
+        """
+        Run a simulation loop like Simulator.run's up to tick until, with
+        other exit events at the ticks in exits.
+        """
+        now = 0
+        exits = sorted(exits)
+        while now < until:
+            stop = min([scheduler.next_stop(now), until] + exits[:1])
+            now = stop
+            if exits and now == exits[0]:
+                exits.pop(0)
+            elif now < until:
+                scheduler.exits += 1
+            scheduler.run_due(now, None)
+
+    def test_period(self) -> None:
+        ticks = []
+        scheduler = PeriodicCallbackScheduler()
+        scheduler.add(PeriodicCallback(100, lambda sim: ticks.append(1)))
+        self.simulate(scheduler, 1000)
+        self.assertEqual(10, len(ticks))
+        # The last call is made at the exit ending the simulation.
+        self.assertEqual(9, scheduler.exits)
+        self.assertEqual(1, scheduler.stats()["round_trips_saved"])
+
+    def test_coalescing(self) -> None:
+        scheduler = PeriodicCallbackScheduler()
+        fast = PeriodicCallback(100, lambda sim: None, max_delay=50)
+        slow = PeriodicCallback(120, lambda sim: None, max_delay=50)
+        scheduler.add(fast)
+        scheduler.add(slow)
+        self.simulate(scheduler, 1200)
+        self.assertEqual(12, fast.calls)
+        self.assertEqual(10, slow.calls)
+        stats = scheduler.stats()
+        self.assertEqual(22, stats["callback_calls"])
+        self.assertLess(stats["callback_exits"], 22)
+        self.assertEqual(
+            stats["callback_calls"] - stats["callback_exits"],
+            stats["round_trips_saved"],
+        )
+
+    def test_piggyback(self) -> None:
+        scheduler = PeriodicCallbackScheduler()
+        callback = PeriodicCallback(100, lambda sim: None, max_delay=20)
+        scheduler.add(callback)
+        # Every deadline is followed by another exit event within the delay.
+        self.simulate(scheduler, 1000, exits=range(110, 1000, 100))
+        self.assertEqual(10, callback.calls)
+        self.assertEqual(0, scheduler.exits)
+
+    def test_skip_missed_periods(self) -> None:
+        scheduler = PeriodicCallbackScheduler()
+        callback = PeriodicCallback(100, lambda sim: True)
+        scheduler.add(callback)
+        scheduler.next_stop(0)
+        self.assertTrue(scheduler.run_due(350, None))
+        self.assertEqual(1, callback.calls)
+        self.assertEqual(400, callback.deadline)
+
+    def test_overshot_deadline(self) -> None:
+        scheduler = PeriodicCallbackScheduler()
+        callback = PeriodicCallback(100, lambda sim: None, max_delay=10)
+        scheduler.add(callback)
+        self.assertEqual(110, scheduler.next_stop(0))
+        # An exit handler which drained the system simulated up to tick 250,
+        # past the deadline and its delay. The stop is never in the past.
+        self.assertEqual(250, scheduler.next_stop(250))
+        # Once the late callback has run, the next stop is in the future.
+        scheduler.run_due(250, None)
+        self.assertEqual(1, callback.calls)
+        self.assertEqual(310, scheduler.next_stop(250))
+
+    def test_invalid(self) -> None:
+        with self.assertRaises(ValueError):
+            PeriodicCallback(0, lambda sim: None)
+        with self.assertRaises(ValueError):
+            PeriodicCallback(10, lambda sim: None, max_delay=-1)
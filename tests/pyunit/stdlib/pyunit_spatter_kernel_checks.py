@@ -0,0 +1,138 @@
+# Copyright (c) 2026 The Regents of the University of California
+# All Rights Reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met: redistributions of source code must retain the above copyright
+# notice, this list of conditions and the following disclaimer;
+# redistributions in binary form must reproduce the above copyright
+# notice, this list of conditions and the following disclaimer in the
+# documentation and/or other materials provided with the distribution;
+# neither the name of the copyright holders nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+# A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+# THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import unittest
+from itertools import product
+from math import ceil
+from unittest.mock import patch
+
+from gem5.components.processors.spatter_gen import spatter_kernel
+from gem5.components.processors.spatter_gen.spatter_kernel import (
+    partition_trace,
+    unroll_trace,
+)
+
+
+def reference_unroll(original_trace, delta, count, min_elements, fill):
+    """Unroll a trace one block at a time."""
+    og_len = len(original_trace)
+    ret_count = count
+    ret_trace = list(original_trace)
+    while len(ret_trace) < min_elements and ret_count > 1:
+        ret_trace += [element + delta for element in ret_trace[-og_len:]]
+        ret_count -= 1
+    if fill == "zero":
+        ret_trace += [0] * (min_elements - len(ret_trace))
+    elif fill == "pattern":
+        while len(ret_trace) < min_elements:
+            ret_trace += [element + delta for element in ret_trace[-og_len:]]
+    return ret_count, ret_trace
+
+
+def reference_partition(original_trace, num_partitions, interleave_size):
+    """Partition a trace one leaf at a time."""
+    partitions = [[] for _ in range(num_partitions)]
+    for i in range(ceil(len(original_trace) / interleave_size)):
+        partitions[i % num_partitions] += original_trace[
+            i * interleave_size : (i + 1) * interleave_size
+        ]
+    return partitions
+
+
+class SpatterKernelTestSuite(unittest.TestCase):
+    """
+    Test cases comparing the trace preparation of
+    gem5.components.processors.spatter_gen.spatter_kernel with reference
+    loops, with and without NumPy.
+    """
+
+    traces = [[0], [3, 1, 2], [5, 0, 9, 4, 4, 1, 7]]
+
+    def check_unroll(self) -> None:
+        for trace, delta, count, min_elements, fill in product(
+            self.traces,
+            (0, 1, 8),
+            (1, 2, 5, 16),
+            (0, 1, 4, 13, 40, 100),
+            (None, "zero", "pattern"),
+        ):
+            if fill is None and len(trace) * count < min_elements:
+                continue
+            with self.subTest(
+                trace=trace,
+                delta=delta,
+                count=count,
+                min_elements=min_elements,
+                fill=fill,
+            ):
+                ret_count, ret_trace = unroll_trace(
+                    list(trace),
+                    delta,
+                    count,
+                    min_elements,
+                    fill_zero=fill == "zero",
+                    fill_pattern=fill == "pattern",
+                )
+                self.assertEqual(
+                    reference_unroll(trace, delta, count, min_elements, fill),
+                    (ret_count, list(ret_trace)),
+                )
+
+    def check_partition(self) -> None:
+        trace = list(range(100, 137))
+        for num_partitions, interleave_size in product(
+            (1, 2, 3, 4), (1, 2, 5, 9)
+        ):
+            with self.subTest(
+                num_partitions=num_partitions, interleave_size=interleave_size
+            ):
+                partitions = partition_trace(
+                    trace, num_partitions, interleave_size
+                )
+                self.assertEqual(
+                    reference_partition(
+                        trace, num_partitions, interleave_size
+                    ),
+                    [list(partition) for partition in partitions],
+                )
+
+    def test_unrollTrace(self) -> None:
+        if spatter_kernel._numpy() is None:
+            self.skipTest("NumPy is not installed")
+        self.check_unroll()
+
+    def test_partitionTrace(self) -> None:
+        if spatter_kernel._numpy() is None:
+            self.skipTest("NumPy is not installed")
+        self.check_partition()
+
+    def test_unrollTraceWithoutNumpy(self) -> None:
+        with patch.object(spatter_kernel, "_numpy", return_value=None):
+            self.check_unroll()
+
+    def test_partitionTraceWithoutNumpy(self) -> None:
+        with patch.object(spatter_kernel, "_numpy", return_value=None):
+            self.check_partition()
@@ -0,0 +1,98 @@
+# Copyright (c) 2026 The Regents of the University of California
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met: redistributions of source code must retain the above copyright
+# notice, this list of conditions and the following disclaimer;
+# redistributions in binary form must reproduce the above copyright
+# notice, this list of conditions and the following disclaimer in the
+# documentation and/or other materials provided with the distribution;
+# neither the name of the copyright holders nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+# A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+# THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import json
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from gem5.resources.client_api.catalog_cache import load_catalog
+
+
+class CatalogCacheTestSuite(unittest.TestCase):
+    """Test cases for gem5.resources.client_api.catalog_cache"""
+
+    def setUp(self) -> None:
+        self.dir = tempfile.TemporaryDirectory()
+        self.env = patch.dict(
+            os.environ,
+            {"GEM5_RESOURCE_CATALOG_CACHE": str(Path(self.dir.name, "cache"))},
+        )
+        self.env.start()
+        self.catalog = Path(self.dir.name, "resources.json")
+        self.write_catalog([{"id": "a"}])
+        self.fetches = 0
+
+    def tearDown(self) -> None:
+        self.env.stop()
+        self.dir.cleanup()
+
+    def write_catalog(self, resources) -> None:
+        self.catalog.write_text(json.dumps(resources))
+
+    def fetch(self):
+        self.fetches += 1
+        return json.loads(self.catalog.read_text())
+
+    def test_localFileNotCached(self) -> None:
+        source = str(self.catalog)
+        self.assertEqual(
+            [{"id": "a"}], load_catalog(source, self.catalog, self.fetch)
+        )
+        self.write_catalog([{"id": "a"}, {"id": "b"}])
+        self.assertEqual(
+            2, len(load_catalog(source, self.catalog, self.fetch))
+        )
+        self.assertEqual(2, self.fetches)
+        self.assertFalse(Path(self.dir.name, "cache").exists())
+
+    def test_urlCachedUnlessDisabled(self) -> None:
+        url = "https://example.com/resources.json"
+        load_catalog(url, None, self.fetch)
+        load_catalog(url, None, self.fetch)
+        self.assertEqual(1, self.fetches)
+
+        with patch.dict(os.environ, {"GEM5_RESOURCE_CATALOG_TTL": "-1"}):
+            load_catalog(url, None, self.fetch)
+        self.assertEqual(2, self.fetches)
+
+    def test_staleCopyUsedWhenOffline(self) -> None:
+        url = "https://example.com/resources.json"
+        load_catalog(url, None, self.fetch)
+
+        def unreachable():
+            raise ConnectionError("unreachable")
+
+        with patch.dict(os.environ, {"GEM5_RESOURCE_CATALOG_TTL": "1e-9"}):
+            self.assertEqual(
+                [{"id": "a"}], load_catalog(url, None, unreachable)
+            )
+        with patch.dict(os.environ, {"GEM5_RESOURCE_CATALOG_OFFLINE": "1"}):
+            self.assertEqual(
+                [{"id": "a"}], load_catalog(url, None, unreachable)
+            )
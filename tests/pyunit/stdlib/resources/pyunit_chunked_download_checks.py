@@ -0,0 +1,167 @@
+# Copyright (c) 2026 The Regents of the University of California
+# All Rights Reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met: redistributions of source code must retain the above copyright
+# notice, this list of conditions and the following disclaimer;
+# redistributions in binary form must reproduce the above copyright
+# notice, this list of conditions and the following disclaimer in the
+# documentation and/or other materials provided with the distribution;
+# neither the name of the copyright holders nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+# A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+# THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import unittest
+from http.server import (
+    BaseHTTPRequestHandler,
+    ThreadingHTTPServer,
+)
+from pathlib import Path
+
+from gem5.resources.chunked_download import download_file
+
+_DATA = bytes(range(256)) * 4096 + b"tail"
+
+
+class _RangeRequestHandler(BaseHTTPRequestHandler):
+    """Serves `_DATA`, honouring single Range requests if the server's
+    `ranges` attribute is `True`. If `fail_after` is set, responses are cut
+    short after that many bytes."""
+
+    def log_message(self, *args):
+        pass
+
+    def _headers(self, start: int, end: int) -> None:
+        ranges = self.server.ranges
+        header = self.headers.get("Range")
+        if ranges and header:
+            first, last = header[len("bytes=") :].split("-")
+            start = int(first)
+            end = int(last) + 1 if last else len(_DATA)
+            self.send_response(206)
+            self.send_header(
+                "Content-Range", f"bytes {start}-{end - 1}/{len(_DATA)}"
+            )
+        else:
+            self.send_response(200)
+        if ranges:
+            self.send_header("Accept-Ranges", "bytes")
+        self.send_header("Content-Length", str(end - start))
+        self.end_headers()
+        return start, end
+
+    def do_HEAD(self):
+        self._headers(0, len(_DATA))
+
+    def do_GET(self):
+        self.server.requests.append(self.headers.get("Range"))
+        start, end = self._headers(0, len(_DATA))
+        if self.server.fail_after is not None:
+            end = min(end, start + self.server.fail_after)
+        self.wfile.write(_DATA[start:end])
+
+
+class ChunkedDownloadTestSuite(unittest.TestCase):
+    """Test cases for gem5.resources.chunked_download"""
+
+    def setUp(self) -> None:
+        self.server = ThreadingHTTPServer(
+            ("127.0.0.1", 0), _RangeRequestHandler
+        )
+        self.server.ranges = True
+        self.server.fail_after = None
+        self.server.requests = []
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.url = f"http://127.0.0.1:{self.server.server_port}/resource"
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, "resource")
+
+    def tearDown(self) -> None:
+        self.server.shutdown()
+        self.server.server_close()
+        self.tmpdir.cleanup()
+
+    def _check_download(self, md5: str) -> None:
+        self.assertEqual(hashlib.md5(_DATA).hexdigest(), md5)
+        self.assertEqual(_DATA, Path(self.path).read_bytes())
+        self.assertFalse(os.path.exists(f"{self.path}.part"))
+        self.assertFalse(os.path.exists(f"{self.path}.part.json"))
+
+    def test_parallel_download(self) -> None:
+        md5 = download_file(
+            self.url,
+            self.path,
+            connections=4,
+            min_chunk_size=len(_DATA) // 8,
+            quiet=True,
+        )
+        self._check_download(md5)
+        self.assertEqual(4, len(self.server.requests))
+
+    def test_single_stream_without_ranges(self) -> None:
+        self.server.ranges = False
+        md5 = download_file(
+            self.url, self.path, min_chunk_size=len(_DATA) // 8, quiet=True
+        )
+        self._check_download(md5)
+        self.assertEqual([None], self.server.requests)
+
+    def test_resume_single_stream(self) -> None:
+        # A partial download of the first 1000 bytes is resumed.
+        Path(f"{self.path}.part").write_bytes(_DATA[:1000])
+        md5 = download_file(self.url, self.path, quiet=True)
+        self._check_download(md5)
+        self.assertEqual(["bytes=1000-"], self.server.requests)
+
+    def test_resume_parallel_download(self) -> None:
+        self.server.fail_after = 1000
+        with self.assertRaises(Exception):
+            download_file(
+                self.url,
+                self.path,
+                connections=2,
+                min_chunk_size=len(_DATA) // 4,
+                quiet=True,
+            )
+        with open(f"{self.path}.part.json") as f:
+            chunks = json.load(f)["chunks"]
+        self.assertEqual([1000, 1000], [done for _, _, done in chunks])
+
+        self.server.fail_after = None
+        self.server.requests = []
+        md5 = download_file(
+            self.url,
+            self.path,
+            connections=2,
+            min_chunk_size=len(_DATA) // 4,
+            quiet=True,
+        )
+        self._check_download(md5)
+        self.assertEqual(
+            sorted(
+                [
+                    f"bytes=1000-{chunks[0][1] - 1}",
+                    f"bytes={chunks[1][0] + 1000}-{len(_DATA) - 1}",
+                ]
+            ),
+            sorted(self.server.requests),
+        )
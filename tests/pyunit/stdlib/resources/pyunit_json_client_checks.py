@@ -29,6 +29,7 @@ import os
 import tempfile
 import unittest
 from typing import Dict
+from unittest.mock import patch
 
 from gem5.resources.client_api.jsonclient import JSONClient
 
@@ -142,6 +143,22 @@ class JSONClientTestSuite(unittest.TestCase):
     def tearDownClass(cls) -> None:
         os.remove(cls.file_path)
 
+    def setUp(self) -> None:
+        # Keep the catalog cache out of the user's home directory.
+        self.cache_dir = tempfile.TemporaryDirectory()
+        self.env = patch.dict(
+            os.environ,
+            {
+                "GEM5_RESOURCE_CATALOG_CACHE": self.cache_dir.name,
+                "GEM5_RESOURCE_CATALOG_TTL": str(24 * 60 * 60),
+            },
+        )
+        self.env.start()
+
+    def tearDown(self) -> None:
+        self.env.stop()
+        self.cache_dir.cleanup()
+
     def verify_json(self, json: Dict) -> None:
         """
         This verifies the JSON file created in created in
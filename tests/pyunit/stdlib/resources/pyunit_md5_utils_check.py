@@ -29,8 +29,12 @@ import shutil
 import tempfile
 import unittest
 from pathlib import Path
+from unittest.mock import patch
 
+from gem5.resources import md5_utils
 from gem5.resources.md5_utils import (
+    cache_md5,
+    invalidate_md5_cache,
     md5_dir,
     md5_file,
 )
@@ -116,3 +120,83 @@ class MD5DirTestSuite(unittest.TestCase):
         shutil.rmtree(dir2)
 
         self.assertEqual(first_md5, second_md5)
+
+    def test_cachedMd5Dir(self) -> None:
+        # This test ensures the cached md5 of a directory is the same as the
+        # uncached one, is reused while the directory is unchanged, and is
+        # invalidated when a file changes.
+
+        dir = self._create_temp_directory()
+        # Backdate the files so the cache entry is considered safe to write.
+        for path in [dir] + list(dir.rglob("*")):
+            os.utime(path, (0, 0))
+
+        md5 = md5_dir(dir, cached=True)
+        self.assertEqual("ad5ac785de44c9fc2fe2798cab2d7b1a", md5)
+        cache = Path(f"{dir}.md5cache")
+        self.assertTrue(cache.is_file())
+
+        # Corrupt the cached value: an unchanged directory uses the cache.
+        cache.write_text(cache.read_text().replace(md5, "cached"))
+        self.assertEqual("cached", md5_dir(dir, cached=True))
+
+        with open(os.path.join(dir, "dir2", "file1"), "a") as f:
+            f.write("Changed")
+        self.assertNotEqual("cached", md5_dir(dir, cached=True))
+        self.assertEqual(md5_dir(dir), md5_dir(dir, cached=True))
+
+        shutil.rmtree(dir)
+        os.remove(cache)
+
+    def test_cacheMd5(self) -> None:
+        # This test ensures a known md5 is only cached once the directory is
+        # old enough for a change to be noticed, and that invalidating the
+        # cache makes the md5 be computed again.
+
+        dir = self._create_temp_directory()
+        cache = Path(f"{dir}.md5cache")
+        cache_md5(dir, "known")
+        self.assertFalse(cache.exists())
+
+        for path in [dir] + list(dir.rglob("*")):
+            os.utime(path, (0, 0))
+        cache_md5(dir, "known")
+        self.assertEqual("known", md5_dir(dir, cached=True))
+
+        invalidate_md5_cache(dir)
+        self.assertFalse(cache.exists())
+        self.assertEqual(md5_dir(dir), md5_dir(dir, cached=True))
+        # Invalidating a missing entry is not an error.
+        invalidate_md5_cache(dir)
+        invalidate_md5_cache(dir)
+
+        shutil.rmtree(dir)
+
+    def test_md5DirBoundedReadAhead(self) -> None:
+        # This test ensures that files are not read further ahead of the
+        # hashing than two reads per worker.
+
+        dir = Path(tempfile.mkdtemp())
+        for i in range(50):
+            (dir / f"file{i:02}").write_text(f"data{i}")
+
+        names = {f"file{i:02}".encode() for i in range(50)}
+        hashed = []
+        read_ahead = []
+        read_small_file = md5_utils._read_small_file
+
+        class Hash:
+            def update(self, data):
+                if bytes(data) in names:
+                    hashed.append(data)
+
+        def read(path):
+            read_ahead.append(int(path.name[4:]) - len(hashed))
+            return read_small_file(path)
+
+        with patch.object(md5_utils, "_read_small_file", read):
+            md5_utils._md5_update_from_dir(dir, Hash(), workers=2)
+        shutil.rmtree(dir)
+
+        self.assertEqual(50, len(hashed))
+        self.assertLessEqual(max(read_ahead), 4)
@@ -0,0 +1,143 @@
+# Copyright (c) 2026 The Regents of The University of California
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met: redistributions of source code must retain the above copyright
+# notice, this list of conditions and the following disclaimer;
+# redistributions in binary form must reproduce the above copyright
+# notice, this list of conditions and the following disclaimer in the
+# documentation and/or other materials provided with the distribution;
+# neither the name of the copyright holders nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+# A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+# THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import json
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(
+    0,
+    os.path.join(
+        os.path.dirname(os.path.abspath(__file__)), "..", "..", "..", "ext"
+    ),
+)
+
+from testlib.fixture import Fixture
+from testlib.runner import (
+    TimingHistory,
+    group_suites,
+    schedule_suites,
+)
+
+
+class _Item:
+    """A stand-in for a loaded suite or test."""
+
+    def __init__(self, uid, fixtures=(), tests=()):
+        self.uid = uid
+        self.fixtures = list(fixtures)
+        self.tests = list(tests)
+
+    def __iter__(self):
+        return iter(self.tests)
+
+
+def _global_fixture():
+    fixture = Fixture("global")
+    fixture.set_global()
+    return fixture
+
+
+class GroupSuitesTestSuite(unittest.TestCase):
+    """Test cases for testlib.runner.group_suites and schedule_suites"""
+
+    def test_sharedFixturesGrouped(self) -> None:
+        shared = Fixture("shared")
+        build = _global_fixture()
+        suites = [
+            _Item("a", [build]),
+            _Item("b", tests=[_Item("b/t", [shared])]),
+            _Item("c", [build]),
+            _Item("d", [shared]),
+        ]
+        # Global fixtures don't tie suites together, and the suites of a
+        # group keep their loader order.
+        self.assertEqual([[0], [1, 3], [2]], group_suites(suites))
+
+    def test_transitiveGroups(self) -> None:
+        first, second = Fixture("first"), Fixture("second")
+        suites = [
+            _Item("a", [first]),
+            _Item("b", [second]),
+            _Item("c", [first, second]),
+        ]
+        self.assertEqual([[0, 1, 2]], group_suites(suites))
+
+    def test_longestGroupsFirst(self) -> None:
+        shared = Fixture("shared")
+        suites = [
+            _Item("a"),
+            _Item("b", [shared]),
+            _Item("c"),
+            _Item("d", [shared]),
+        ]
+        history = TimingHistory(None)
+        history.durations = {"a": 1.0, "b": 2.0, "c": 4.0, "d": 3.0}
+        self.assertEqual([[1, 3], [2], [0]], schedule_suites(suites, history))
+
+    def test_unknownSuitesStartEarly(self) -> None:
+        suites = [
+            _Item("a"),
+            _Item("b"),
+            _Item("new", tests=[_Item("new/t1"), _Item("new/t2")]),
+        ]
+        history = TimingHistory(None)
+        history.durations = {"a": 1.0, "b": 5.0}
+        self.assertEqual(10.0, history.estimate(suites[2]))
+        self.assertEqual([[2], [1], [0]], schedule_suites(suites, history))
+
+
+class TimingHistoryTestSuite(unittest.TestCase):
+    """Test cases for testlib.runner.TimingHistory"""
+
+    def setUp(self) -> None:
+        self.dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.dir.name, "results", "history.json")
+
+    def tearDown(self) -> None:
+        self.dir.cleanup()
+
+    def round_trip(self) -> None:
+        history = TimingHistory(self.path)
+        history.record("suite", 2.5)
+        history.record("suite/test", None)
+        history.save()
+        self.assertEqual({"suite": 2.5}, TimingHistory(self.path).durations)
+
+    def test_missingFile(self) -> None:
+        self.assertEqual({}, TimingHistory(self.path).durations)
+        self.round_trip()
+
+    def test_corruptFile(self) -> None:
+        os.makedirs(os.path.dirname(self.path))
+        with open(self.path, "w") as f:
+            f.write('{"suite": 1.0')
+        self.assertEqual({}, TimingHistory(self.path).durations)
+        self.round_trip()
+        with open(self.path) as f:
+            self.assertEqual({"suite": 2.5}, json.load(f))
@@ -0,0 +1,110 @@
+# Copyright (c) 2026 The Regents of The University of California
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met: redistributions of source code must retain the above copyright
+# notice, this list of conditions and the following disclaimer;
+# redistributions in binary form must reproduce the above copyright
+# notice, this list of conditions and the following disclaimer in the
+# documentation and/or other materials provided with the distribution;
+# neither the name of the copyright holders nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+# A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+# THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import os
+import tempfile
+import unittest
+
+from m5.util.config_snapshot import (
+    ConfigSnapshot,
+    ConfigSnapshotWriter,
+    diff_snapshots,
+)
+
+_CONFIG = {
+    "root": [("type", "Root"), ("children", "system")],
+    "system": [
+        ("type", "System"),
+        ("children", "cpu membus"),
+        ("mem_mode", "timing"),
+    ],
+    "system.cpu": [("type", "BaseCPU"), ("clk_domain", "system.clk")],
+    "system.membus": [("type", "SystemXBar"), ("width", "16")],
+}
+
+
+class ConfigSnapshotTestSuite(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.dir.cleanup()
+
+    def _write(self, name, config):
+        filename = os.path.join(self.dir.name, name)
+        with ConfigSnapshotWriter(filename) as writer:
+            # Objects are added in hierarchy order, not path order
+            for path in reversed(list(config)):
+                writer.add(path, config[path])
+        return filename
+
+    def test_lookup(self):
+        with ConfigSnapshot(self._write("a.snap", _CONFIG)) as snapshot:
+            self.assertEqual(len(snapshot), 4)
+            self.assertEqual(list(snapshot), sorted(_CONFIG))
+            for path, items in _CONFIG.items():
+                self.assertIn(path, snapshot)
+                self.assertEqual(snapshot.items(path), items)
+            self.assertEqual(snapshot.get("system.membus")["width"], "16")
+            self.assertNotIn("system.l2", snapshot)
+            with self.assertRaises(KeyError):
+                snapshot.get("system.l2")
+
+    def test_notASnapshot(self):
+        filename = os.path.join(self.dir.name, "config.ini")
+        with open(filename, "w") as f:
+            f.write("[root]\ntype=Root\n\n")
+        with self.assertRaises(ValueError):
+            ConfigSnapshot(filename)
+
+    def test_diff(self):
+        other = dict(_CONFIG)
+        other["system"] = [
+            ("type", "System"),
+            ("children", "cpu"),
+            ("mem_mode", "atomic"),
+            ("cache_line_size", "64"),
+        ]
+        del other["system.membus"]
+        other["system.cpu.icache"] = [("type", "Cache")]
+
+        with ConfigSnapshot(self._write("a.snap", _CONFIG)) as a:
+            self.assertEqual(list(diff_snapshots(a, a)), [])
+            with ConfigSnapshot(self._write("b.snap", other)) as b:
+                self.assertEqual(
+                    list(diff_snapshots(a, b)),
+                    [
+                        ("system", "children", "cpu membus", "cpu"),
+                        ("system", "mem_mode", "timing", "atomic"),
+                        ("system", "cache_line_size", None, "64"),
+                        ("system.cpu.icache", None, None, "Cache"),
+                        ("system.membus", None, "SystemXBar", None),
+                    ],
+                )
+
+
+if __name__ == "__main__":
+    unittest.main()
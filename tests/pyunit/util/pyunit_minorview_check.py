@@ -0,0 +1,91 @@
+# Copyright (c) 2026 The Regents of The University of California
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met: redistributions of source code must retain the above copyright
+# notice, this list of conditions and the following disclaimer;
+# redistributions in binary form must reproduce the above copyright
+# notice, this list of conditions and the following disclaimer in the
+# documentation and/or other materials provided with the distribution;
+# neither the name of the copyright holders nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+# A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+# THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(
+    0,
+    os.path.join(
+        os.path.dirname(os.path.abspath(__file__)), "..", "..", "..", "util"
+    ),
+)
+
+from minorview.columns import TraceColumns
+
+try:
+    from minorview.model import BlobModel
+except ImportError:
+    # The model needs pygtk
+    BlobModel = None
+
+# A comment of unit a falls just before a window starting at time 30
+_TRACE = """\
+10: a: MinorTrace: x=1
+20: a: hello comment
+30: b: MinorTrace: y=1
+40: b: MinorTrace: y=2
+50: a: MinorTrace: x=2
+60: b: MinorTrace: y=3
+"""
+
+
+class MinorViewTestSuite(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, "trace.txt")
+        with open(self.path, "w") as f:
+            f.write(_TRACE)
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_last_records_before(self):
+        columns = TraceColumns()
+        columns.load(self.path)
+        index = columns.last_trace_before("a", 40)
+        self.assertEqual(columns.record(index)[0], 10)
+        comments = columns.last_comments_before("a", 40)
+        self.assertEqual(
+            [columns.record(i)[3] for i in comments], ["hello comment"]
+        )
+        self.assertEqual(columns.last_comments_before("a", 20), [])
+        self.assertEqual(columns.last_comments_before("b", 40), [])
+        self.assertIsNone(columns.last_trace_before("a", 10))
+
+    @unittest.skipIf(BlobModel is None, "minorview.model needs pygtk")
+    def test_comment_before_window(self):
+        model = BlobModel()
+        model.unitEvents = {"a": [], "b": []}
+        model.windowSize = 2
+        model.load_events(self.path)
+        for time in (40, 45):
+            event = model.find_unit_event_by_time("a", time)
+            self.assertEqual(event.time, 20)
+            self.assertEqual(event.pairs, {"x": "1"})
+            self.assertEqual(event.comments, ["hello comment"])
@@ -0,0 +1,85 @@
+# Copyright (c) 2026 The Regents of The University of California
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met: redistributions of source code must retain the above copyright
+# notice, this list of conditions and the following disclaimer;
+# redistributions in binary form must reproduce the above copyright
+# notice, this list of conditions and the following disclaimer in the
+# documentation and/or other materials provided with the distribution;
+# neither the name of the copyright holders nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+# A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+# THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import gzip
+import io
+import os
+import sys
+import unittest
+
+sys.path.insert(
+    0,
+    os.path.join(
+        os.path.dirname(os.path.abspath(__file__)), "..", "..", "..", "util"
+    ),
+)
+
+import protolib
+
+
+class _Message:
+    """A stand-in for a protobuf message which keeps the decoded bytes."""
+
+    def ParseFromString(self, data):
+        if data == b"bad":
+            raise protolib.DecodeError("malformed message")
+        self.data = data
+
+
+class TraceReaderTestSuite(unittest.TestCase):
+    """Test cases for protolib.TraceReader"""
+
+    def reader(self, data, buffer_size=2):
+        return protolib.TraceReader(io.BytesIO(data), buffer_size)
+
+    def test_messages(self) -> None:
+        trace = self.reader(b"\x03abc\x01d")
+        self.assertEqual(
+            [b"abc", b"d"], [m.data for m in trace.messages(_Message())]
+        )
+        self.assertIsNone(trace.readRaw())
+
+    def test_truncatedMessage(self) -> None:
+        trace = self.reader(b"\x01a\x05abc")
+        self.assertEqual(b"a", trace.readRaw())
+        self.assertIsNone(trace.readRaw())
+
+    def test_truncatedSize(self) -> None:
+        self.assertIsNone(self.reader(b"\x80").readRaw())
+
+    def test_malformedSize(self) -> None:
+        self.assertIsNone(self.reader(b"\xff" * 12 + b"\x01").readRaw())
+
+    def test_malformedMessage(self) -> None:
+        self.assertFalse(self.reader(b"\x03bad").readMessage(_Message()))
+
+    def test_truncatedGzip(self) -> None:
+        data = gzip.compress(b"\x03abc" * 1000)
+        with gzip.open(io.BytesIO(data[: len(data) // 2])) as f:
+            trace = protolib.TraceReader(f, 1024)
+            count = sum(1 for _ in trace.messages(_Message()))
+            self.assertIsNone(trace.readRaw())
+        self.assertLess(count, 1000)
@@ -26,129 +26,331 @@
 # (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
-import gzip
+"""
+Merge several SE mode checkpoints into a single checkpoint.
+
+The CPU sections of every input are renamed (``cpu`` becomes ``cpuN``) and
+their page table addresses shifted past the memory of the preceding
+inputs. The remaining sections are taken from the last input. The
+``m5.cpt`` files are rewritten line by line, so no configuration is held in
+memory.
+
+The memory images are decompressed in parallel, one thread per input.
+With ``--no-compress`` each input is written straight to its offset of a
+sparse output image. Otherwise every input is compressed into its own
+gzip members, which are concatenated into the output image. gem5 reads
+concatenated gzip members as one stream.
+"""
+
+import json
 import os
 import re
+import shutil
 import sys
-from configparser import ConfigParser
+import tempfile
+import time
+import zlib
+from concurrent.futures import ThreadPoolExecutor
 
+PAGE_SHIFT = 12
+PAGE_SIZE = 1 << PAGE_SHIFT
+BLOCK_SIZE = 1 << 20
+MEMORY_FILE = "system.physmem.store0.pmem"
 
-class myCP(ConfigParser):
-    def __init__(self):
-        ConfigParser.__init__(self)
+_section_re = re.compile(r"^\[(.*)\]\s*$")
+_cpu_re = re.compile("cpu")
+_fdmap_re = re.compile("workload.FdMap256$")
 
-    def optionxform(self, optionstr):
-        return optionstr
+# The section holding the size of the merged memory
+_STORE_SECTION = "system.physmem.store0"
 
 
-def aggregate(output_dir, cpts, no_compress, memory_size):
-    merged_config = None
-    page_ptr = 0
+def _split_item(line):
+    key, sep, value = line.partition("=")
+    if not sep:
+        return None, None
+    return key.strip(), value.strip()
 
-    output_path = output_dir
-    if not os.path.isdir(output_path):
-        os.system("mkdir -p " + output_path)
 
-    agg_mem_file = open(output_path + "/system.physmem.store0.pmem", "wb+")
-    agg_config_file = open(output_path + "/m5.cpt", "wb+")
+def scan_checkpoint(cpt):
+    """
+    Return the number of allocated pages and the current tick of a
+    checkpoint, reading only the ``system`` and ``Globals`` sections.
+    """
+    pages = None
+    cur_tick = 0
+    section = None
+    with open(os.path.join(cpt, "m5.cpt")) as f:
+        for line in f:
+            match = _section_re.match(line)
+            if match:
+                section = match.group(1)
+                continue
+            if section == "system":
+                key, value = _split_item(line)
+                if key == "pagePtr":
+                    pages = int(value)
+            elif section == "Globals":
+                key, value = _split_item(line)
+                if key == "curTick":
+                    cur_tick = int(value)
+    if pages is None:
+        raise ValueError(f"{cpt}/m5.cpt has no system.pagePtr")
+    return pages, cur_tick
 
-    if not no_compress:
-        merged_mem = gzip.GzipFile(fileobj=agg_mem_file, mode="wb")
 
-    max_curtick = 0
-    num_digits = len(str(len(cpts) - 1))
+def _rewrite_config(out, cpt, index, num_digits, page_ptr, last, range_size):
+    """
+    Copy the sections of cpt's ``m5.cpt`` to out. CPU sections are renamed
+    and relocated; the other sections, except ``system`` and ``Globals``,
+    are only copied from the last checkpoint, where the ``range_size`` of
+    the memory store is set to range_size, adding it if it is missing.
+    """
+    suffix = str(index).zfill(num_digits)
+    range_written = False
 
-    for i, arg in enumerate(cpts):
-        print(arg)
-        merged_config = myCP()
-        config = myCP()
-        config.readfp(open(cpts[i] + "/m5.cpt"))
-
-        for sec in config.sections():
-            if re.compile("cpu").search(sec):
-                newsec = re.sub("cpu", "cpu" + str(i).zfill(num_digits), sec)
-                merged_config.add_section(newsec)
-
-                items = config.items(sec)
-                for item in items:
-                    if item[0] == "paddr":
-                        merged_config.set(
-                            newsec, item[0], int(item[1]) + (page_ptr << 12)
-                        )
-                        continue
-                    merged_config.set(newsec, item[0], item[1])
-
-                if re.compile("workload.FdMap256$").search(sec):
-                    merged_config.set(newsec, "M5_pid", i)
-
-            elif sec == "system":
-                pass
-            elif sec == "Globals":
-                tick = config.getint(sec, "curTick")
-                if tick > max_curtick:
-                    max_curtick = tick
-            else:
-                if i == len(cpts) - 1:
-                    merged_config.add_section(sec)
-                    for item in config.items(sec):
-                        merged_config.set(sec, item[0], item[1])
-
-        if i != len(cpts) - 1:
-            merged_config.write(agg_config_file)
-
-        ### memory stuff
-        pages = int(config.get("system", "pagePtr"))
-        page_ptr = page_ptr + pages
-        print("pages to be read: ", pages)
-
-        f = open(cpts[i] + "/system.physmem.store0.pmem", "rb")
-        gf = gzip.GzipFile(fileobj=f, mode="rb")
-
-        x = 0
-        while x < pages:
-            bytesRead = gf.read(1 << 12)
-            if not no_compress:
-                merged_mem.write(bytesRead)
-            else:
-                agg_mem_file.write(bytesRead)
-            x += 1
-
-        gf.close()
-        f.close()
-
-    merged_config.add_section("system")
-    merged_config.set("system", "pagePtr", page_ptr)
-    merged_config.set("system", "nextPID", len(cpts))
-
-    file_size = page_ptr * 4 * 1024
-    dummy_data = "".zfill(4096)
-    while file_size < memory_size:
-        if not no_compress:
-            merged_mem.write(dummy_data)
-        else:
-            agg_mem_file.write(dummy_data)
-        file_size += 4 * 1024
-        page_ptr += 1
+    def end_section(section, fdmap):
+        nonlocal range_written
+        if fdmap:
+            out.write(f"M5_pid={index}\n")
+        if section == _STORE_SECTION and not range_written:
+            out.write(f"range_size={range_size}\n")
+            range_written = True
+        if section is not None:
+            out.write("\n")
 
-    print("WARNING: ")
-    print(
-        "Make sure the simulation using this checkpoint has at least ", end=" "
-    )
-    print(page_ptr, "x 4K of memory")
-    merged_config.set(
-        "system.physmem.store0", "range_size", page_ptr * 4 * 1024
-    )
+    section = None
+    mode = None
+    fdmap = False
+    with open(os.path.join(cpt, "m5.cpt")) as f:
+        for line in f:
+            match = _section_re.match(line)
+            if match:
+                if mode is not None:
+                    end_section(section, fdmap)
+                name = match.group(1)
+                fdmap = False
+                if _cpu_re.search(name):
+                    mode = "cpu"
+                    section = _cpu_re.sub("cpu" + suffix, name)
+                    fdmap = bool(_fdmap_re.search(name))
+                elif name in ("system", "Globals") or not last:
+                    mode = None
+                    section = None
+                else:
+                    mode = "copy"
+                    section = name
+                if mode is not None:
+                    out.write(f"[{section}]\n")
+                continue
 
-    merged_config.add_section("Globals")
-    merged_config.set("Globals", "curTick", max_curtick)
+            if mode is None or not line.strip():
+                continue
+            key, value = _split_item(line)
+            if mode == "cpu":
+                if key == "paddr":
+                    line = f"paddr={int(value) + (page_ptr << PAGE_SHIFT)}\n"
+                elif fdmap and key == "M5_pid":
+                    continue
+            elif key == "range_size" and section == _STORE_SECTION:
+                if range_written:
+                    continue
+                line = f"range_size={range_size}\n"
+                range_written = True
+            out.write(line if line.endswith("\n") else line + "\n")
+    if mode is not None:
+        end_section(section, fdmap)
+    if last and not range_written:
+        out.write(f"[{_STORE_SECTION}]\n")
+        end_section(_STORE_SECTION, False)
 
-    merged_config.write(agg_config_file)
 
-    if not no_compress:
-        merged_mem.close()
-        agg_mem_file.close()
+def _read_image(path, size):
+    """
+    Generate the first size bytes of the memory image at path in blocks of
+    up to BLOCK_SIZE bytes. The image may be gzip compressed or raw.
+    """
+    with open(path, "rb") as f:
+        compressed = f.read(2) == b"\x1f\x8b"
+        f.seek(0)
+        remaining = size
+        if not compressed:
+            while remaining:
+                data = f.read(min(BLOCK_SIZE, remaining))
+                if not data:
+                    break
+                remaining -= len(data)
+                yield data
+            return
+
+        decomp = zlib.decompressobj(wbits=31)
+        pending = b""
+        while remaining:
+            if decomp.eof:
+                # Continue with the next gzip member, if any.
+                pending = decomp.unused_data
+                decomp = zlib.decompressobj(wbits=31)
+            data = decomp.unconsumed_tail or pending or f.read(BLOCK_SIZE)
+            pending = b""
+            if not data:
+                break
+            out = decomp.decompress(data, min(BLOCK_SIZE, remaining))
+            if out:
+                remaining -= len(out)
+                yield out
+    if remaining:
+        raise ValueError(f"{path} holds less than {size} bytes")
+
+
+def _copy_raw(path, size, fd, offset):
+    """Write the image at path to fd at offset, leaving zero blocks out."""
+    for block in _read_image(path, size):
+        if block.count(0) != len(block):
+            os.pwrite(fd, block, offset)
+        offset += len(block)
+
+
+def _compress(blocks, out, level):
+    """Compress blocks into a single gzip member appended to out."""
+    comp = zlib.compressobj(level, zlib.DEFLATED, 31)
+    for block in blocks:
+        out.write(comp.compress(block))
+    out.write(comp.flush())
+
+
+def _zeros(size):
+    block = bytes(min(BLOCK_SIZE, size))
+    while size:
+        yield block[: min(BLOCK_SIZE, size)]
+        size -= min(BLOCK_SIZE, size)
+
+
+def _copy_input(path, size, raw_fd, offset, part, level):
+    start = time.perf_counter()
+    if part is None:
+        _copy_raw(path, size, raw_fd, offset)
     else:
-        agg_mem_file.close()
+        with open(part, "wb") as out:
+            _compress(_read_image(path, size), out, level)
+    elapsed = time.perf_counter() - start
+    return {
+        "checkpoint": os.path.dirname(path),
+        "bytes": size,
+        "seconds": elapsed,
+        "mb_per_s": size / elapsed / 1e6 if elapsed else 0.0,
+    }
+
+
+def aggregate(
+    output_dir,
+    cpts,
+    no_compress,
+    memory_size,
+    jobs=None,
+    compression_level=6,
+):
+    """
+    Merge cpts into a checkpoint in output_dir and return a report with the
+    time and throughput of every input and of the whole merge.
+
+    :param output_dir: The directory of the merged checkpoint.
+    :param cpts: The directories of the checkpoints to merge.
+    :param no_compress: Write the memory image as a raw, sparse file.
+    :param memory_size: The minimum size in bytes of the merged memory.
+    :param jobs: The number of inputs processed at once. Defaults to the
+        number of CPUs.
+    :param compression_level: The zlib level of the merged memory image.
+    """
+    start = time.perf_counter()
+    os.makedirs(output_dir, exist_ok=True)
+
+    scans = [scan_checkpoint(cpt) for cpt in cpts]
+    offsets = []
+    page_ptr = 0
+    for pages, _ in scans:
+        offsets.append(page_ptr)
+        page_ptr += pages
+    max_curtick = max(tick for _, tick in scans)
+    total_pages = max(page_ptr, -(-(memory_size or 0) // PAGE_SIZE))
+    num_digits = len(str(len(cpts) - 1))
+
+    with open(os.path.join(output_dir, "m5.cpt"), "w") as out:
+        for i, cpt in enumerate(cpts):
+            _rewrite_config(
+                out,
+                cpt,
+                i,
+                num_digits,
+                offsets[i],
+                i == len(cpts) - 1,
+                total_pages * PAGE_SIZE,
+            )
+        out.write(f"[system]\npagePtr={page_ptr}\nnextPID={len(cpts)}\n\n")
+        out.write(f"[Globals]\ncurTick={max_curtick}\n\n")
+
+    mem_path = os.path.join(output_dir, MEMORY_FILE)
+    mem_file = open(mem_path, "wb")
+    tmp_dir = None
+    parts = [None] * len(cpts)
+    if not no_compress:
+        tmp_dir = tempfile.mkdtemp(dir=output_dir)
+        parts = [os.path.join(tmp_dir, str(i)) for i in range(len(cpts))]
+
+    try:
+        with ThreadPoolExecutor(max_workers=jobs or os.cpu_count()) as pool:
+            futures = [
+                pool.submit(
+                    _copy_input,
+                    os.path.join(cpt, MEMORY_FILE),
+                    pages * PAGE_SIZE,
+                    mem_file.fileno(),
+                    offsets[i] * PAGE_SIZE,
+                    parts[i],
+                    compression_level,
+                )
+                for i, (cpt, (pages, _)) in enumerate(zip(cpts, scans))
+            ]
+            inputs = [future.result() for future in futures]
+
+        padding = (total_pages - page_ptr) * PAGE_SIZE
+        if no_compress:
+            mem_file.truncate(total_pages * PAGE_SIZE)
+        else:
+            for part in parts:
+                with open(part, "rb") as f:
+                    shutil.copyfileobj(f, mem_file, BLOCK_SIZE)
+            if padding:
+                _compress(_zeros(padding), mem_file, compression_level)
+    finally:
+        mem_file.close()
+        if tmp_dir is not None:
+            shutil.rmtree(tmp_dir)
+
+    elapsed = time.perf_counter() - start
+    total_bytes = sum(entry["bytes"] for entry in inputs)
+    return {
+        "inputs": inputs,
+        "pages": total_pages,
+        "compressed": not no_compress,
+        "seconds": elapsed,
+        "mb_per_s": total_bytes / elapsed / 1e6 if elapsed else 0.0,
+    }
+
+
+def print_report(report, out=sys.stdout):
+    print(f"{'MB':>10} {'seconds':>10} {'MB/s':>10}  checkpoint", file=out)
+    for entry in report["inputs"]:
+        print(
+            f"{entry['bytes'] / 1e6:10.1f} {entry['seconds']:10.3f} "
+            f"{entry['mb_per_s']:10.1f}  {entry['checkpoint']}",
+            file=out,
+        )
+    total = sum(entry["bytes"] for entry in report["inputs"])
+    print(
+        f"{total / 1e6:10.1f} {report['seconds']:10.3f} "
+        f"{report['mb_per_s']:10.1f}  total",
+        file=out,
+    )
 
 
 if __name__ == "__main__":
@@ -161,23 +363,60 @@ if __name__ == "__main__":
     parser.add_argument(
         "-o", "--output-dir", action="store", help="Output directory"
     )
-    parser.add_argument("-c", "--no-compress", action="store_true")
+    parser.add_argument(
+        "-c",
+        "--no-compress",
+        action="store_true",
+        help="Write the memory image as an uncompressed, sparse file",
+    )
     parser.add_argument("--cpts", nargs="+")
     parser.add_argument("--memory-size", action="store", type=int)
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=None,
+        help="Number of checkpoints processed in parallel "
+        "(default: number of CPUs)",
+    )
+    parser.add_argument(
+        "--compression-level",
+        type=int,
+        default=6,
+        choices=range(0, 10),
+        metavar="[0-9]",
+        help="zlib compression level of the memory image (default: 6)",
+    )
+    parser.add_argument(
+        "--report",
+        metavar="FILE",
+        help="Write the throughput of every input as JSON to FILE",
+    )
 
     # Assume x86 ISA.  Any other ISAs would need extra stuff in this script
     # to appropriately parse their page tables and understand page sizes.
     options = parser.parse_args()
-    print(options.cpts, len(options.cpts))
-    if len(options.cpts) <= 1:
+    if not options.cpts or len(options.cpts) <= 1:
         parser.error(
             "You must specify atleast two checkpoint files that "
             "need to be combined."
         )
 
-    aggregate(
+    report = aggregate(
         options.output_dir,
         options.cpts,
         options.no_compress,
         options.memory_size,
+        jobs=options.jobs,
+        compression_level=options.compression_level,
+    )
+
+    print("WARNING: ")
+    print(
+        "Make sure the simulation using this checkpoint has at least ", end=" "
     )
+    print(report["pages"], "x 4K of memory")
+    print_report(report)
+    if options.report:
+        with open(options.report, "w") as f:
+            json.dump(report, f, indent=4)
@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+
+# Copyright (c) 2026 The Regents of the University of California
+# All Rights Reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met: redistributions of source code must retain the above copyright
+# notice, this list of conditions and the following disclaimer;
+# redistributions in binary form must reproduce the above copyright
+# notice, this list of conditions and the following disclaimer in the
+# documentation and/or other materials provided with the distribution;
+# neither the name of the copyright holders nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+# A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+# THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+# Manage a content-addressed store of checkpoint memory images (see
+# src/python/gem5/utils/checkpoint_store.py).
+#
+# Usage:
+#   checkpoint_store.py pack --store STORE CPT_DIR [CPT_DIR ...]
+#   checkpoint_store.py unpack CPT_DIR [CPT_DIR ...]
+#   checkpoint_store.py materialize CPT_DIR DEST_DIR
+#   checkpoint_store.py gc --store STORE DIR [DIR ...]
+
+import argparse
+import os
+import sys
+
+
+def _mib(size):
+    return f"{size / 2**20:.1f} MiB"
+
+
+def do_pack(args):
+    store = CheckpointStore(
+        args.store,
+        chunk_size=args.chunk_size,
+        compression_level=args.level,
+        workers=args.workers,
+    )
+    for cpt in args.checkpoints:
+        total, stored = store.pack(cpt)
+        print(f"{cpt}: {total} chunks, {stored} new")
+
+
+def do_unpack(args):
+    for cpt in args.checkpoints:
+        unpack(cpt, workers=args.workers)
+        print(f"{cpt}: unpacked")
+
+
+def do_materialize(args):
+    materialize(args.checkpoint, args.destination, workers=args.workers)
+
+
+def do_gc(args):
+    store = CheckpointStore(args.store)
+    removed, freed = store.gc(args.dirs)
+    print(f"Removed {removed} unreferenced chunks, freed {_mib(freed)}")
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Pack, unpack and garbage-collect checkpoints in a "
+        "content-addressed checkpoint store."
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Number of threads (default: number of CPUs)",
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    command = commands.add_parser(
+        "pack", help="Move the memory images of checkpoints into a store"
+    )
+    command.add_argument("--store", required=True, help="Store directory")
+    command.add_argument(
+        "--chunk-size",
+        type=int,
+        default=DEFAULT_CHUNK_SIZE,
+        help="Chunk size in bytes, a multiple of 4096 "
+        "(default: %(default)s)",
+    )
+    command.add_argument(
+        "--level",
+        type=int,
+        default=1,
+        help="zlib compression level of the chunks (default: %(default)s)",
+    )
+    command.add_argument("checkpoints", nargs="+", metavar="cpt_dir")
+    command.set_defaults(func=do_pack)
+
+    command = commands.add_parser(
+        "unpack", help="Turn packed checkpoints back into regular ones"
+    )
+    command.add_argument("checkpoints", nargs="+", metavar="cpt_dir")
+    command.set_defaults(func=do_unpack)
+
+    command = commands.add_parser(
+        "materialize",
+        help="Write a restorable copy of a packed checkpoint",
+    )
+    command.add_argument("checkpoint", metavar="cpt_dir")
+    command.add_argument("destination", metavar="dest_dir")
+    command.set_defaults(func=do_materialize)
+
+    command = commands.add_parser(
+        "gc",
+        help="Remove the chunks which aren't used by the packed checkpoints "
+        "in, or below, the given directories",
+    )
+    command.add_argument("--store", required=True, help="Store directory")
+    command.add_argument("dirs", nargs="+", metavar="dir")
+    command.set_defaults(func=do_gc)
+
+    args = parser.parse_args()
+    args.func(args)
+
+
+if __name__ == "__main__":
+    sys.path.append(
+        os.path.join(
+            os.path.dirname(os.path.abspath(__file__)), "..", "src", "python"
+        )
+    )
+    from gem5.utils.checkpoint_store import (
+        DEFAULT_CHUNK_SIZE,
+        CheckpointStore,
+        materialize,
+        unpack,
+    )
+
+    main()
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+
+# Copyright (c) 2026 The Regents of The University of California
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met: redistributions of source code must retain the above copyright
+# notice, this list of conditions and the following disclaimer;
+# redistributions in binary form must reproduce the above copyright
+# notice, this list of conditions and the following disclaimer in the
+# documentation and/or other materials provided with the distribution;
+# neither the name of the copyright holders nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+# A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+# THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+# Query and compare the binary configuration snapshots written by
+# gem5 --config-snapshot=FILE.
+#
+# Usage:
+#   config_snapshot.py list SNAPSHOT
+#   config_snapshot.py show SNAPSHOT PATH [PATH ...]
+#   config_snapshot.py ini SNAPSHOT
+#   config_snapshot.py diff SNAPSHOT1 SNAPSHOT2
+
+import argparse
+import os
+import sys
+
+
+def _print_section(snapshot, path):
+    print(f"[{path}]")
+    for key, value in snapshot.items(path):
+        print(f"{key}={value}")
+    print()
+
+
+def do_list(args):
+    with ConfigSnapshot(args.snapshot) as snapshot:
+        for path in snapshot:
+            print(path)
+
+
+def do_show(args):
+    with ConfigSnapshot(args.snapshot) as snapshot:
+        for path in args.paths:
+            if path not in snapshot:
+                sys.exit(f"{path} not found in {args.snapshot}")
+            _print_section(snapshot, path)
+
+
+def do_ini(args):
+    with ConfigSnapshot(args.snapshot) as snapshot:
+        for path in snapshot:
+            _print_section(snapshot, path)
+
+
+def do_diff(args):
+    differences = 0
+    with ConfigSnapshot(args.first) as a, ConfigSnapshot(args.second) as b:
+        for path, key, old, new in diff_snapshots(a, b):
+            differences += 1
+            if key is None:
+                if new is None:
+                    print(f"- [{path}] ({old})")
+                else:
+                    print(f"+ [{path}] ({new})")
+            elif old is None:
+                print(f"+ {path}.{key}={new}")
+            elif new is None:
+                print(f"- {path}.{key}={old}")
+            else:
+                print(f"! {path}.{key}: {old} -> {new}")
+    return 1 if differences else 0
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Query and compare gem5 configuration snapshots."
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    command = commands.add_parser("list", help="List the object paths")
+    command.add_argument("snapshot")
+    command.set_defaults(func=do_list)
+
+    command = commands.add_parser("show", help="Show the given objects")
+    command.add_argument("snapshot")
+    command.add_argument("paths", nargs="+", metavar="path")
+    command.set_defaults(func=do_show)
+
+    command = commands.add_parser(
+        "ini", help="Print the snapshot in config.ini format"
+    )
+    command.add_argument("snapshot")
+    command.set_defaults(func=do_ini)
+
+    command = commands.add_parser(
+        "diff",
+        help="Print the differences between two snapshots, exit with "
+        "status 1 if there are any",
+    )
+    command.add_argument("first")
+    command.add_argument("second")
+    command.set_defaults(func=do_diff)
+
+    args = parser.parse_args()
+    sys.exit(args.func(args))
+
+
+if __name__ == "__main__":
+    sys.path.append(
+        os.path.join(
+            os.path.dirname(os.path.abspath(__file__)), "..", "src", "python"
+        )
+    )
+    from m5.util.config_snapshot import (
+        ConfigSnapshot,
+        diff_snapshots,
+    )
+
+    main()
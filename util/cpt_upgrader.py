@@ -68,13 +68,26 @@
 # upgrader. This can be especially valuable when maintaining private
 # upgraders in private branches.
 
+# Many checkpoints can be upgraded at once by passing several checkpoints,
+# or a directory with -r. Only the version tags of each checkpoint are read
+# to decide whether it needs upgrading, the upgrades to apply are computed
+# once per set of tags, and the checkpoints are upgraded in a pool of
+# processes (-j). Upgraded files are replaced atomically, and a summary with
+# the time spent on each checkpoint is printed (and written with --report).
+
 
 import configparser
 import glob
+import json
 import os
 import os.path as osp
+import re
+import shutil
 import sys
+import tempfile
+import time
 import types
+from concurrent.futures import ProcessPoolExecutor
 
 verbose_print = False
 
@@ -192,7 +205,99 @@ class Upgrader:
                     sys.exit(1)
 
 
+_section_re = re.compile(r"^\[(.*)\]\s*$")
+
+
+def read_version(path):
+    """
+    Read the version information of the checkpoint at path without parsing
+    the whole file. Returns the legacy ``cpt_ver`` of the root section, or
+    None, and the set of version tags, or None if there are none.
+    """
+    cpt_ver = None
+    tags = {}
+    section = None
+    seen_root = False
+    with open(path) as f:
+        for line in f:
+            match = _section_re.match(line)
+            if match:
+                if seen_root and tags:
+                    break
+                section = match.group(1)
+                seen_root = seen_root or section == "root"
+                continue
+            key, sep, value = line.partition("=")
+            if not sep:
+                continue
+            key = key.strip()
+            if section == "root" and key == "cpt_ver":
+                cpt_ver = int(value)
+            elif (
+                section in ("Globals", "root.globals")
+                and key == "version_tags"
+            ):
+                tags[section] = set(value.split())
+    return cpt_ver, tags.get("Globals", tags.get("root.globals"))
+
+
+def warn_unknown_tags(tags):
+    # If the current checkpoint has a tag we don't know about, we have
+    # a divergence that (in general) must be addressed by (e.g.) merging
+    # simulator support for its changes.
+    unknown_tags = tags - (Upgrader.tag_set | Upgrader.untag_set)
+    if unknown_tags:
+        print(
+            "warning: upgrade script does not recognize the following "
+            "tags in this checkpoint:",
+            " ".join(unknown_tags),
+        )
+
+
+_plans = {}
+
+
+def upgrade_plan(tags):
+    """
+    Return the tags whose upgraders or downgraders have to be applied to a
+    checkpoint with the given tags, in an order that respects their
+    dependences. Plans are computed once per set of tags.
+    """
+    key = frozenset(tags)
+    plan = _plans.get(key)
+    if plan is not None:
+        return plan
+
+    # Apply migrations for tags not in checkpoint and tags present for which
+    # downgraders are present, respecting dependences
+    tags = set(tags)
+    plan = []
+    to_apply = (Upgrader.tag_set - tags) | (Upgrader.untag_set & tags)
+    while to_apply:
+        ready = {t for t in to_apply if Upgrader.get(t).ready(tags)}
+        if not ready:
+            print("could not apply these upgrades:", " ".join(to_apply))
+            print("update dependences impossible to resolve; aborting")
+            exit(1)
+
+        for tag in sorted(ready):
+            plan.append(tag)
+            if tag in Upgrader.tag_set:
+                tags.add(tag)
+            else:
+                tags.remove(tag)
+
+        to_apply -= ready
+
+    _plans[key] = plan
+    return plan
+
+
 def process_file(path, **kwargs):
+    """
+    Upgrade the checkpoint file at path. Returns True if the file was
+    changed and False if it was already up to date.
+    """
     if not osp.isfile(path):
         import errno
 
@@ -200,9 +305,17 @@ def process_file(path, **kwargs):
 
     verboseprint(f"Processing file {path}....")
 
-    if kwargs.get("backup", True):
-        import shutil
+    # Checkpoints that only need their version tags checked are never
+    # parsed or written.
+    cpt_ver, tags = read_version(path)
+    if cpt_ver is None and tags is not None:
+        verboseprint("has tags", " ".join(tags))
+        warn_unknown_tags(tags)
+        if not upgrade_plan(tags):
+            verboseprint("...nothing to do")
+            return False
 
+    if kwargs.get("backup", True):
         shutil.copyfile(path, path + ".bak")
 
     cpt = configparser.ConfigParser()
@@ -215,8 +328,6 @@ def process_file(path, **kwargs):
     cpt.read_file(cpt_file)
     cpt_file.close()
 
-    change = False
-
     # Make sure we know what we're starting from
     if cpt.has_option("root", "cpt_ver"):
         cpt_ver = cpt.getint("root", "cpt_ver")
@@ -227,7 +338,6 @@ def process_file(path, **kwargs):
         for i in range(2, cpt_ver + 1):
             tags.add(Upgrader.legacy[i].tag)
         verboseprint("performed legacy version -> tags conversion")
-        change = True
 
         cpt.remove_option("root", "cpt_ver")
     # @todo The 'Globals' option is deprecated, and should be removed in the
@@ -240,43 +350,99 @@ def process_file(path, **kwargs):
         print("fatal: no version information in checkpoint")
         exit(1)
 
-    verboseprint("has tags", " ".join(tags))
-    # If the current checkpoint has a tag we don't know about, we have
-    # a divergence that (in general) must be addressed by (e.g.) merging
-    # simulator support for its changes.
-    unknown_tags = tags - (Upgrader.tag_set | Upgrader.untag_set)
-    if unknown_tags:
-        print(
-            "warning: upgrade script does not recognize the following "
-            "tags in this checkpoint:",
-            " ".join(unknown_tags),
-        )
-
-    # Apply migrations for tags not in checkpoint and tags present for which
-    # downgraders are present, respecting dependences
-    to_apply = (Upgrader.tag_set - tags) | (Upgrader.untag_set & tags)
-    while to_apply:
-        ready = {t for t in to_apply if Upgrader.get(t).ready(tags)}
-        if not ready:
-            print("could not apply these upgrades:", " ".join(to_apply))
-            print("update dependences impossible to resolve; aborting")
-            exit(1)
-
-        for tag in ready:
-            Upgrader.get(tag).update(cpt, tags)
-            change = True
+    if cpt_ver is not None:
+        verboseprint("has tags", " ".join(tags))
+        warn_unknown_tags(tags)
 
-        to_apply -= ready
-
-    if not change:
-        verboseprint("...nothing to do")
-        return
+    for tag in upgrade_plan(tags):
+        Upgrader.get(tag).update(cpt, tags)
 
     cpt.set("root.globals", "version_tags", " ".join(tags))
 
-    # Write the old data back
+    # Write the new data to a temporary file and move it over the old one,
+    # so that an interrupted upgrade never leaves a truncated checkpoint.
     verboseprint("...completed")
-    cpt.write(open(path, "w"))
+    fd, tmp_path = tempfile.mkstemp(
+        dir=osp.dirname(osp.abspath(path)), prefix=".m5.cpt."
+    )
+    try:
+        with os.fdopen(fd, "w") as tmp_file:
+            cpt.write(tmp_file)
+        shutil.copymode(path, tmp_path)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+    return True
+
+
+def _init_worker(verbose):
+    global verbose_print
+    verbose_print = verbose
+    if not Upgrader.by_tag:
+        Upgrader.load_all()
+
+
+def _timed_process(path, kwargs):
+    start = time.perf_counter()
+    try:
+        status = "upgraded" if process_file(path, **kwargs) else "current"
+        error = None
+    except (Exception, SystemExit) as e:
+        status = "failed"
+        error = str(e) or type(e).__name__
+    return {
+        "path": path,
+        "status": status,
+        "seconds": time.perf_counter() - start,
+        "error": error,
+    }
+
+
+def process_files(paths, jobs=None, **kwargs):
+    """
+    Upgrade many checkpoint files in a pool of jobs processes. Returns one
+    result per file, in the order of paths, with its status ("upgraded",
+    "current" or "failed"), the time it took and the error, if any.
+    """
+    if jobs == 1 or len(paths) <= 1:
+        return [_timed_process(path, kwargs) for path in paths]
+
+    with ProcessPoolExecutor(
+        max_workers=jobs,
+        initializer=_init_worker,
+        initargs=(verbose_print,),
+    ) as pool:
+        return list(
+            pool.map(
+                _timed_process,
+                paths,
+                [kwargs] * len(paths),
+                chunksize=max(1, len(paths) // (8 * (jobs or os.cpu_count()))),
+            )
+        )
+
+
+def print_summary(results, elapsed, out=sys.stdout):
+    counts = {"upgraded": 0, "current": 0, "failed": 0}
+    for result in results:
+        counts[result["status"]] += 1
+    print(
+        f"{len(results)} checkpoints in {elapsed:.2f}s: "
+        f"{counts['upgraded']} upgraded, {counts['current']} up to date, "
+        f"{counts['failed']} failed",
+        file=out,
+    )
+    for result in results:
+        if result["status"] == "failed":
+            print(f"  failed: {result['path']}: {result['error']}", file=out)
+    slowest = sorted(results, key=lambda r: r["seconds"], reverse=True)
+    for result in slowest[:5]:
+        print(
+            f"  {result['seconds']:8.3f}s {result['status']:<8} "
+            f"{result['path']}",
+            file=out,
+        )
 
 
 if __name__ == "__main__":
@@ -313,7 +479,20 @@ if __name__ == "__main__":
         # used during build; generate src/sim/tags.cc and exit
         help=SUPPRESS,
     )
-    parser.add_argument("checkpoint", nargs="?")
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=None,
+        help="Number of checkpoints upgraded in parallel "
+        "(default: number of CPUs)",
+    )
+    parser.add_argument(
+        "--report",
+        metavar="FILE",
+        help="Write the status and time of every checkpoint as JSON to FILE",
+    )
+    parser.add_argument("checkpoint", nargs="*")
 
     args = parser.parse_args()
     verbose_print = args.verbose
@@ -341,28 +520,39 @@ if __name__ == "__main__":
             "directory of checkpoints to recursively update"
         )
 
-    # Deal with shell variables and ~
-    path = osp.expandvars(osp.expanduser(args.checkpoint))
-
-    # Process a single file if we have it
-    if osp.isfile(path):
-        process_file(path, **vars(args))
-    # Process an entire directory
-    elif osp.isdir(path):
-        cpt_file = osp.join(path, "m5.cpt")
-        if args.recurse:
-            # Visit very file and see if it matches
-            for root, dirs, files in os.walk(path):
-                for name in files:
-                    if name == "m5.cpt":
-                        process_file(osp.join(root, name), **vars(args))
-                for dir in dirs:
-                    pass
-        # Maybe someone passed a cpt.XXXXXXX directory and not m5.cpt
-        elif osp.isfile(cpt_file):
-            process_file(cpt_file, **vars(args))
-        else:
-            print(f"Error: checkpoint file not found in {path} ")
-            print("and recurse not specified")
-            sys.exit(1)
-    sys.exit(0)
+    paths = []
+    for checkpoint in args.checkpoint:
+        # Deal with shell variables and ~
+        path = osp.expandvars(osp.expanduser(checkpoint))
+
+        # Process a single file if we have it
+        if osp.isfile(path):
+            paths.append(path)
+        # Process an entire directory
+        elif osp.isdir(path):
+            cpt_file = osp.join(path, "m5.cpt")
+            if args.recurse:
+                # Visit very file and see if it matches
+                for root, dirs, files in os.walk(path):
+                    if "m5.cpt" in files:
+                        paths.append(osp.join(root, "m5.cpt"))
+            # Maybe someone passed a cpt.XXXXXXX directory and not m5.cpt
+            elif osp.isfile(cpt_file):
+                paths.append(cpt_file)
+            else:
+                print(f"Error: checkpoint file not found in {path} ")
+                print("and recurse not specified")
+                sys.exit(1)
+
+    kwargs = {"backup": args.backup}
+    if len(paths) == 1:
+        process_file(paths[0], **kwargs)
+        sys.exit(0)
+
+    start = time.perf_counter()
+    results = process_files(paths, jobs=args.jobs, **kwargs)
+    print_summary(results, time.perf_counter() - start)
+    if args.report:
+        with open(args.report, "w") as f:
+            json.dump(results, f, indent=4)
+    sys.exit(1 if any(r["status"] == "failed" for r in results) else 0)
@@ -123,6 +123,7 @@ def main():
 
     # Open the file on read mode
     proto_in = protolib.openFileRd(sys.argv[1])
+    trace = protolib.TraceReader(proto_in)
 
     try:
         ascii_out = open(sys.argv[2], "w")
@@ -131,7 +132,7 @@ def main():
         exit(-1)
 
     # Read the magic number in 4-byte Little Endian
-    magic_number = proto_in.read(4).decode()
+    magic_number = trace.read(4).decode()
 
     if magic_number != "gem5":
         print("Unrecognized file")
@@ -141,7 +142,7 @@ def main():
 
     # Add the packet header
     header = inst_dep_record_pb2.InstDepRecordHeader()
-    protolib.decodeMessage(proto_in, header)
+    trace.readMessage(header)
 
     print("Object id:", header.obj_id)
     print("Tick frequency:", header.tick_freq)
@@ -161,7 +162,7 @@ def main():
     packet = inst_dep_record_pb2.InstDepRecord()
 
     # Decode the packet messages until we hit the end of the file
-    while protolib.decodeMessage(proto_in, packet):
+    while trace.readMessage(packet):
         num_packets += 1
 
         # Write to file the seq num
@@ -83,6 +83,7 @@ def main():
 
     # Open the file in read mode
     proto_in = protolib.openFileRd(sys.argv[1])
+    trace = protolib.TraceReader(proto_in)
 
     try:
         ascii_out = open(sys.argv[2], "w")
@@ -91,7 +92,7 @@ def main():
         exit(-1)
 
     # Read the magic number in 4-byte Little Endian
-    magic_number = proto_in.read(4)
+    magic_number = trace.read(4).decode()
 
     if magic_number != "gem5":
         print("Unrecognized file", sys.argv[1])
@@ -101,7 +102,7 @@ def main():
 
     # Add the packet header
     header = inst_pb2.InstHeader()
-    protolib.decodeMessage(proto_in, header)
+    trace.readMessage(header)
 
     print("Object id:", header.obj_id)
     print("Tick frequency:", header.tick_freq)
@@ -125,7 +126,7 @@ def main():
         "size",
         "mem_flags",
     )
-    while protolib.decodeMessage(proto_in, inst):
+    while trace.readMessage(inst):
         # If we have a tick use it, otherwise count instructions
         if inst.HasField("tick"):
             tick = inst.tick
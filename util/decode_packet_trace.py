@@ -36,8 +36,14 @@
 # OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
 # This script is used to dump protobuf packet traces to ASCII
-# format.
-
+# format. Traces can also be written as NumPy .npy files or Parquet
+# files (one record per packet, see protolib.PACKET_DTYPE), which are
+# considerably faster to produce and to load for analysis than ASCII.
+# The output format is chosen from the output file extension, unless
+# --format is given. The .npy and Parquet outputs need NumPy, and
+# Parquet additionally needs pyarrow.
+
+import argparse
 import os
 import subprocess
 import sys
@@ -50,32 +56,135 @@ subprocess.check_call(["make", "--quiet", "-C", util_dir, "packet_pb2.py"])
 import packet_pb2
 
 
-def main():
-    if len(sys.argv) != 3:
-        print("Usage: ", sys.argv[0], " <protobuf input> <ASCII output>")
+def write_ascii(trace, packet, out_file):
+    num_packets = 0
+    with open(out_file, "w") as ascii_out:
+        for packet in trace.messages(packet):
+            num_packets += 1
+            # ReadReq is 1 and WriteReq is 4 in src/mem/packet.hh Command
+            # enum
+            cmd = "r" if packet.cmd == 1 else ("w" if packet.cmd == 4 else "u")
+            line = []
+            if packet.HasField("pkt_id"):
+                line.append(f"{packet.pkt_id},")
+            if packet.HasField("flags"):
+                line.append(
+                    f"{cmd},{packet.addr},{packet.size},{packet.flags},"
+                    f"{packet.tick}"
+                )
+            else:
+                line.append(f"{cmd},{packet.addr},{packet.size},{packet.tick}")
+            if packet.HasField("pc"):
+                line.append(f",{packet.pc}")
+            line.append("\n")
+            ascii_out.write("".join(line))
+    return num_packets
+
+
+def _npy_header(dtype, count, length=0):
+    """
+    Build a .npy (version 1.0) header for a 1-D array of count elements,
+    padded with spaces to at least length bytes.
+    """
+    import numpy as np
+
+    header = repr(
+        {
+            "descr": np.lib.format.dtype_to_descr(np.dtype(dtype)),
+            "fortran_order": False,
+            "shape": (count,),
+        }
+    ).encode("latin1")
+    # Magic (6), version (2) and header length (2), then the header
+    # terminated by a newline. The total is a multiple of 64 bytes.
+    total = max(10 + len(header) + 1, length)
+    total += -total % 64
+    header += b" " * (total - 10 - len(header) - 1) + b"\n"
+    return b"\x93NUMPY\x01\x00" + len(header).to_bytes(2, "little") + header
+
+
+def write_npy(trace, packet, out_file, batch_size):
+    # The number of packets is not known until the whole trace is
+    # decoded, so reserve space for the largest header and rewrite it
+    # once done.
+    reserved = len(_npy_header(protolib.PACKET_DTYPE, 2**64 - 1))
+    num_packets = 0
+    with open(out_file, "wb") as npy_out:
+        npy_out.write(b"\0" * reserved)
+        for batch in trace.packetBatches(packet, batch_size):
+            batch.tofile(npy_out)
+            num_packets += len(batch)
+        npy_out.seek(0)
+        npy_out.write(
+            _npy_header(protolib.PACKET_DTYPE, num_packets, reserved)
+        )
+    return num_packets
+
+
+def write_parquet(trace, packet, out_file, batch_size):
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError:
+        print("Parquet output requires the pyarrow module")
         exit(-1)
 
-    # Open the file in read mode
-    proto_in = protolib.openFileRd(sys.argv[1])
+    num_packets = 0
+    writer = None
+    for batch in trace.packetBatches(packet, batch_size):
+        table = pa.table({name: batch[name] for name in batch.dtype.names})
+        if writer is None:
+            writer = pq.ParquetWriter(out_file, table.schema)
+        writer.write_table(table)
+        num_packets += len(batch)
+    if writer is not None:
+        writer.close()
+    return num_packets
 
-    try:
-        ascii_out = open(sys.argv[2], "w")
-    except OSError:
-        print("Failed to open ", sys.argv[2], " for writing")
-        exit(-1)
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Decode a gem5 protobuf packet trace."
+    )
+    parser.add_argument("input", help="protobuf input (optionally gzipped)")
+    parser.add_argument("output", help="decoded output")
+    parser.add_argument(
+        "--format",
+        choices=["ascii", "npy", "parquet"],
+        help="output format (default: based on the output file extension, "
+        "otherwise ascii)",
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=1 << 16,
+        help="number of packets decoded per batch for npy and parquet output",
+    )
+    args = parser.parse_args()
+
+    out_format = args.format
+    if out_format is None:
+        extension = os.path.splitext(args.output)[1]
+        out_format = {".npy": "npy", ".parquet": "parquet"}.get(
+            extension, "ascii"
+        )
+
+    # Open the file in read mode
+    proto_in = protolib.openFileRd(args.input)
+    trace = protolib.TraceReader(proto_in)
 
     # Read the magic number in 4-byte Little Endian
-    magic_number = proto_in.read(4).decode()
+    magic_number = trace.read(4).decode()
 
     if magic_number != "gem5":
-        print("Unrecognized file", sys.argv[1])
+        print("Unrecognized file", args.input)
         exit(-1)
 
     print("Parsing packet header")
 
     # Add the packet header
     header = packet_pb2.PacketHeader()
-    protolib.decodeMessage(proto_in, header)
+    trace.readMessage(header)
 
     print("Object id:", header.obj_id)
     print("Tick frequency:", header.tick_freq)
@@ -85,31 +194,25 @@ def main():
 
     print("Parsing packets")
 
-    num_packets = 0
     packet = packet_pb2.Packet()
-
-    # Decode the packet messages until we hit the end of the file
-    while protolib.decodeMessage(proto_in, packet):
-        num_packets += 1
-        # ReadReq is 1 and WriteReq is 4 in src/mem/packet.hh Command enum
-        cmd = "r" if packet.cmd == 1 else ("w" if packet.cmd == 4 else "u")
-        if packet.HasField("pkt_id"):
-            ascii_out.write(f"{packet.pkt_id},")
-        if packet.HasField("flags"):
-            ascii_out.write(
-                f"{cmd},{packet.addr},{packet.size},{packet.flags},{packet.tick}"
+    try:
+        if out_format == "npy":
+            num_packets = write_npy(
+                trace, packet, args.output, args.batch_size
+            )
+        elif out_format == "parquet":
+            num_packets = write_parquet(
+                trace, packet, args.output, args.batch_size
             )
         else:
-            ascii_out.write(f"{cmd},{packet.addr},{packet.size},{packet.tick}")
-        if packet.HasField("pc"):
-            ascii_out.write(f",{packet.pc}\n")
-        else:
-            ascii_out.write("\n")
+            num_packets = write_ascii(trace, packet, args.output)
+    except OSError:
+        print("Failed to open ", args.output, " for writing")
+        exit(-1)
 
     print("Parsed packets:", num_packets)
 
     # We're done
-    ascii_out.close()
     proto_in.close()
 
 
@@ -0,0 +1,231 @@
+# Copyright (c) 2026 The Regents of The University of California
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met: redistributions of source code must retain the above copyright
+# notice, this list of conditions and the following disclaimer;
+# redistributions in binary form must reproduce the above copyright
+# notice, this list of conditions and the following disclaimer in the
+# documentation and/or other materials provided with the distribution;
+# neither the name of the copyright holders nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+# A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+# THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+
+"""
+Columnar storage of a MinorTrace event file.
+
+Every line of the file becomes one record in a set of parallel arrays:
+its time, its unit, its kind (comment, MinorTrace, MinorInst or MinorLine)
+and the rest of the line. Unit names and line contents are interned, so
+lines repeated over many cycles are only stored once. As times in the
+file never decrease, the time array doubles as an index for finding the
+records of a time window by binary search.
+"""
+
+import re
+from array import array
+from bisect import (
+    bisect_left,
+    bisect_right,
+)
+
+COMMENT = 0
+MINOR_TRACE = 1
+MINOR_INST = 2
+MINOR_LINE = 3
+
+_kinds = {
+    None: COMMENT,
+    "MinorTrace:": MINOR_TRACE,
+    "MinorInst:": MINOR_INST,
+    "MinorLine:": MINOR_LINE,
+}
+
+_line_re = re.compile(r"^\s*(\d+):\s*([\w\.]+):\s*(Minor\w+:)?\s*(.*)$")
+_time_re = re.compile(r"^\s*(\d+):")
+
+
+class TraceColumns:
+    """The records of an event file, stored as columns"""
+
+    def __init__(self):
+        self.times = array("q")
+        self.units = array("I")
+        self.kinds = array("B")
+        self.rests = array("I")
+        # Interned unit names and line contents
+        self.unitNames = []
+        self.strings = []
+        self.unitIds = {}
+        self.stringIds = {}
+        # Record indices of the MinorTrace and comment records of each unit
+        self.unitTraces = []
+        self.unitComments = []
+        self.lineCount = 0
+
+    def intern_unit(self, unit):
+        unitId = self.unitIds.get(unit)
+        if unitId is None:
+            unitId = self.unitIds[unit] = len(self.unitNames)
+            self.unitNames.append(unit)
+            self.unitTraces.append(array("I"))
+            self.unitComments.append(array("I"))
+        return unitId
+
+    def intern_string(self, string):
+        stringId = self.stringIds.get(string)
+        if stringId is None:
+            stringId = self.stringIds[string] = len(self.strings)
+            self.strings.append(string)
+        return stringId
+
+    def load(self, file, unitNamePrefix="", startTime=0, endTime=None):
+        """Load the records of file from the first one at startTime or later
+        up to the first one after endTime.  MinorTrace records identical to
+        the previous record of the same unit are dropped"""
+        prefix_re = re.compile("^" + unitNamePrefix + r"\.?(.*)$")
+        line_match = _line_re.match
+        time_match = _time_re.match
+        intern_unit = self.intern_unit
+        intern_string = self.intern_string
+        times = self.times
+        units = self.units
+        kinds = self.kinds
+        rests = self.rests
+        lastRests = {}
+        time = -1
+
+        with open(file) as f:
+            # Skip leading events
+            for l in f:
+                match = time_match(l)
+                if match is not None and int(match.group(1)) >= startTime:
+                    break
+            else:
+                l = None
+
+            while l:
+                match = line_match(l)
+                if match is not None:
+                    event_time, unit, line_type, rest = match.groups()
+                    time = int(event_time)
+                    unit_match = prefix_re.match(unit)
+                    if unit_match is not None:
+                        unit = unit_match.group(1)
+
+                    kind = _kinds.get(line_type)
+                    if kind is not None:
+                        unitId = intern_unit(unit)
+                        restId = intern_string(rest)
+                        if kind == MINOR_TRACE:
+                            self.lineCount += 1
+                            if lastRests.get(unitId) == restId:
+                                kind = None
+                            else:
+                                lastRests[unitId] = restId
+                                self.unitTraces[unitId].append(len(times))
+                        elif kind == COMMENT:
+                            self.unitComments[unitId].append(len(times))
+                        if kind is not None:
+                            times.append(time)
+                            units.append(unitId)
+                            kinds.append(kind)
+                            rests.append(restId)
+
+                if endTime is not None and time > endTime:
+                    break
+                l = f.readline()
+
+    def __len__(self):
+        return len(self.times)
+
+    def record(self, index):
+        """Return (time, unit, kind, rest) of the record at index"""
+        return (
+            self.times[index],
+            self.unitNames[self.units[index]],
+            self.kinds[index],
+            self.strings[self.rests[index]],
+        )
+
+    def records_of_kind(self, kind):
+        """Generate the records of the given kind in file order"""
+        kinds = self.kinds
+        for index in range(len(kinds)):
+            if kinds[index] == kind:
+                yield self.record(index)
+
+    def event_times(self, units):
+        """Return the sorted distinct times of the MinorTrace and comment
+        records of the given units"""
+        unitIds = {
+            self.unitIds[unit] for unit in units if unit in self.unitIds
+        }
+        times = self.times
+        unitCol = self.units
+        kinds = self.kinds
+        ret = array("q")
+        for index in range(len(times)):
+            if (
+                kinds[index] <= MINOR_TRACE
+                and unitCol[index] in unitIds
+                and (not ret or ret[-1] != times[index])
+            ):
+                ret.append(times[index])
+        return ret
+
+    def window(self, startTime, endTime):
+        """Return the range of indices of the records with times in
+        [startTime, endTime]"""
+        return range(
+            bisect_left(self.times, startTime),
+            bisect_right(self.times, endTime),
+        )
+
+    def _count_before(self, records, time):
+        """Return the number of the given records with times before time"""
+        lo, hi = 0, len(records)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self.times[records[mid]] < time:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def last_trace_before(self, unit, time):
+        """Return the index of the last MinorTrace record of unit before
+        time, or None if there is none"""
+        unitId = self.unitIds.get(unit)
+        if unitId is None:
+            return None
+        trace = self.unitTraces[unitId]
+        count = self._count_before(trace, time)
+        return trace[count - 1] if count > 0 else None
+
+    def last_comments_before(self, unit, time):
+        """Return the indices of the comment records of unit at the last
+        time before time at which it has any"""
+        unitId = self.unitIds.get(unit)
+        if unitId is None:
+            return []
+        comments = self.unitComments[unitId]
+        end = self._count_before(comments, time)
+        if end == 0:
+            return []
+        start = self._count_before(comments, self.times[comments[end - 1]])
+        return list(comments[start:end])
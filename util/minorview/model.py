@@ -35,6 +35,7 @@
 
 import os
 import re
+from bisect import bisect_right
 from time import time as wall_time
 
 from . import (
@@ -43,6 +44,13 @@ from . import (
     parse,
 )
 from .colours import unknownColour
+from .columns import (
+    COMMENT,
+    MINOR_INST,
+    MINOR_LINE,
+    MINOR_TRACE,
+    TraceColumns,
+)
 from .point import Point
 
 id_parts = "TSPLFE"
@@ -638,6 +646,10 @@ class BlobModel:
         self.picSize = Point(20, 10)
         self.lastTime = 0
         self.unitNamePrefix = unitNamePrefix
+        # Number of times around the current time for which events are
+        #   decoded.  Events outside the window are decoded from the trace
+        #   columns when the view moves there
+        self.windowSize = 2000
 
     def clear_events(self):
         """Drop all events and times"""
@@ -646,7 +658,13 @@ class BlobModel:
         self.insts = {}
         self.lines = {}
         self.numEvents = 0
+        self.columns = None
+        self.windowStart = None
+        self.windowEnd = None
+        self.clear_window()
 
+    def clear_window(self):
+        """Drop the decoded events"""
         for unit, events in self.unitEvents.items():
             self.unitEvents[unit] = []
 
@@ -699,7 +717,9 @@ class BlobModel:
 
     def extract_times(self):
         """Extract a list of all the times from the seen events.  Call after
-        reading events to give a safe index list to use for time indices"""
+        reading events to give a safe index list to use for time indices.
+        Only needed for events added with add_unit_event, as load_events
+        takes its times from the trace columns"""
         times = {}
         for unitEvents in self.unitEvents.values():
             for event in unitEvents:
@@ -717,7 +737,7 @@ class BlobModel:
     ):
         """Find an event by binary search on time indices"""
         while lower_index <= upper_index:
-            pivot = (upper_index + lower_index) / 2
+            pivot = (upper_index + lower_index) // 2
             pivotEvent = events[pivot]
             event_equal = pivotEvent.time == time or (
                 pivotEvent.time < time
@@ -742,6 +762,16 @@ class BlobModel:
 
     def find_unit_event_by_time(self, unit, time):
         """Find the last event for the given unit at time <= time"""
+        if self.columns is not None and self.times:
+            if (
+                time < self.windowStart and self.windowStart > self.times[0]
+            ) or (time > self.windowEnd and self.windowEnd < self.times[-1]):
+                self.load_window(self.find_time_index(time))
+        return self.find_loaded_unit_event_by_time(unit, time)
+
+    def find_loaded_unit_event_by_time(self, unit, time):
+        """Find the last event for the given unit at time <= time amongst
+        the events in the current window"""
         if unit in self.unitEvents:
             events = self.unitEvents[unit]
             ret = self.find_event_bisection(
@@ -755,11 +785,7 @@ class BlobModel:
     def find_time_index(self, time):
         """Find a time index close to the given time (where
         times[return] <= time and times[return+1] > time"""
-        ret = 0
-        lastIndex = len(self.times) - 1
-        while ret < lastIndex and self.times[ret + 1] <= time:
-            ret += 1
-        return ret
+        return max(bisect_right(self.times, time) - 1, 0)
 
     def add_minor_inst(self, rest):
         """Parse and add a MinorInst line to the model"""
@@ -810,15 +836,77 @@ class BlobModel:
 
             self.add_line(LineFault(id, pairs["fault"], vaddr, other_pairs))
 
+    def make_trace_event(self, unit, time, rest):
+        """Make an event from the rest of a MinorTrace line"""
+        event = BlobEvent(unit, time, {})
+        pairs = parse.parse_pairs(rest)
+        event.pairs = pairs
+
+        # Try to decode the colour data for this event
+        blobs = self.unitNameToBlobs.get(unit, [])
+        for blob in blobs:
+            if blob.visualDecoder is not None:
+                event.visuals[blob.picChar] = blob.visualDecoder(pairs)
+        return event
+
     def load_events(self, file, startTime=0, endTime=None):
-        """Load an event file and add everything to this model"""
+        """Load an event file into trace columns.  Instruction and line
+        definitions are added to the model straight away, while events are
+        only decoded for a window of times around the time being viewed"""
+        self.clear_events()
+
+        if not os.access(file, os.R_OK):
+            print("Can't open file", file)
+            exit(1)
+        else:
+            print("Opening file", file)
+
+        start_wall_time = wall_time()
+
+        columns = TraceColumns()
+        columns.load(file, self.unitNamePrefix, startTime, endTime)
+
+        for _, _, _, rest in columns.records_of_kind(MINOR_INST):
+            self.add_minor_inst(rest)
+        for _, _, _, rest in columns.records_of_kind(MINOR_LINE):
+            self.add_minor_line(rest)
+
+        self.columns = columns
+        self.times = columns.event_times(self.unitEvents.keys())
+        if len(columns) != 0:
+            self.lastTime = columns.times[-1]
+        self.load_window(0)
+        self.numEvents = sum(len(trace) for trace in columns.unitTraces)
+
+        end_wall_time = wall_time()
+
+        print(
+            "Total events:",
+            columns.lineCount,
+            "unique events:",
+            self.numEvents,
+        )
+        print("Time to parse:", end_wall_time - start_wall_time)
+
+    def load_window(self, timeIndex):
+        """Decode the events of the window of times around
+        self.times[timeIndex]"""
+        self.clear_window()
+        if not self.times:
+            return
+
+        first = max(timeIndex - self.windowSize // 2, 0)
+        last = min(first + self.windowSize, len(self.times)) - 1
+        self.windowStart = self.times[first]
+        self.windowEnd = self.times[last]
+        columns = self.columns
 
         def update_comments(comments, time):
             # Add a list of comments to an existing event, if there is one at
             #   the given time, or create a new, correctly-timed, event from
             #   the last event and attach the comments to that
             for commentUnit, commentRest in comments:
-                event = self.find_unit_event_by_time(commentUnit, time)
+                event = self.find_loaded_unit_event_by_time(commentUnit, time)
                 # Find an event to which this comment can be attached
                 if event is None:
                     # No older event, make a new empty one
@@ -833,114 +921,47 @@ class BlobModel:
                     self.add_unit_event(event)
                 event.comments.append(commentRest)
 
-        self.clear_events()
+        # Start every unit with its last event before the window: its last
+        #   MinorTrace event, or the event made for its last comments if
+        #   they are more recent
+        for unit in self.unitEvents:
+            index = columns.last_trace_before(unit, self.windowStart)
+            traceTime = None
+            if index is not None:
+                traceTime, _, _, rest = columns.record(index)
+                self.add_unit_event(
+                    self.make_trace_event(unit, traceTime, rest)
+                )
+            comments = columns.last_comments_before(unit, self.windowStart)
+            if comments:
+                time = columns.times[comments[0]]
+                if traceTime is None or time >= traceTime:
+                    update_comments(
+                        [(unit, columns.record(i)[3]) for i in comments],
+                        time,
+                    )
 
+        # Accumulate comments to be attached to MinorTrace events when the
+        #   time changes
         # A negative time will *always* be different from an event time
         time = -1
-        time_events = {}
-        last_time_lines = {}
-        minor_trace_line_count = 0
         comments = []
-
-        default_colour = [[colours.unknownColour]]
-        next_progress_print_event_count = 1000
-
-        if not os.access(file, os.R_OK):
-            print("Can't open file", file)
-            exit(1)
-        else:
-            print("Opening file", file)
-
-        f = open(file)
-
-        start_wall_time = wall_time()
-
-        # Skip leading events
-        still_skipping = True
-        l = f.readline()
-        while l and still_skipping:
-            match = re.match(r"^\s*(\d+):", l)
-            if match is not None:
-                event_time = match.groups()
-                if int(event_time[0]) >= startTime:
-                    still_skipping = False
-                else:
-                    l = f.readline()
-            else:
-                l = f.readline()
-
-        match_line_re = re.compile(
-            r"^\s*(\d+):\s*([\w\.]+):\s*(Minor\w+:)?\s*(.*)$"
-        )
-
-        # Parse each line of the events file, accumulating comments to be
-        #   attached to MinorTrace events when the time changes
-        reached_end_time = False
-        while not reached_end_time and l:
-            match = match_line_re.match(l)
-            if match is not None:
-                event_time, unit, line_type, rest = match.groups()
-                event_time = int(event_time)
-
-                unit = re.sub(
-                    "^" + self.unitNamePrefix + r"\.?(.*)$", "\\1", unit
-                )
-
-                # When the time changes, resolve comments
-                if event_time != time:
-                    if self.numEvents > next_progress_print_event_count:
-                        print("Parsed to time: %d" % event_time)
-                        next_progress_print_event_count = self.numEvents + 1000
-                    update_comments(comments, time)
-                    comments = []
-                    time = event_time
-
-                if line_type is None:
-                    # Treat this line as just a 'comment'
-                    comments.append((unit, rest))
-                elif line_type == "MinorTrace:":
-                    minor_trace_line_count += 1
-
-                    # Only insert this event if it's not the same as
-                    #   the last event we saw for this unit
-                    if last_time_lines.get(unit, None) != rest:
-                        event = BlobEvent(unit, event_time, {})
-                        pairs = parse.parse_pairs(rest)
-                        event.pairs = pairs
-
-                        # Try to decode the colour data for this event
-                        blobs = self.unitNameToBlobs.get(unit, [])
-                        for blob in blobs:
-                            if blob.visualDecoder is not None:
-                                event.visuals[blob.picChar] = (
-                                    blob.visualDecoder(pairs)
-                                )
-
-                        self.add_unit_event(event)
-                        last_time_lines[unit] = rest
-                elif line_type == "MinorInst:":
-                    self.add_minor_inst(rest)
-                elif line_type == "MinorLine:":
-                    self.add_minor_line(rest)
-
-            if endTime is not None and time > endTime:
-                reached_end_time = True
-
-            l = f.readline()
+        for index in columns.window(self.windowStart, self.windowEnd):
+            event_time, unit, kind, rest = columns.record(index)
+            if unit not in self.unitEvents:
+                continue
+            if event_time != time:
+                update_comments(comments, time)
+                comments = []
+                time = event_time
+
+            if kind == COMMENT:
+                # Treat this line as just a 'comment'
+                comments.append((unit, rest))
+            elif kind == MINOR_TRACE:
+                self.add_unit_event(self.make_trace_event(unit, time, rest))
 
         update_comments(comments, time)
-        self.extract_times()
-        f.close()
-
-        end_wall_time = wall_time()
-
-        print(
-            "Total events:",
-            minor_trace_line_count,
-            "unique events:",
-            self.numEvents,
-        )
-        print("Time to parse:", end_wall_time - start_wall_time)
 
     def add_blob_picture(self, offset, pic, nameDict):
         """Add a parsed ASCII-art pipeline markup to the model"""
@@ -38,9 +38,13 @@
 # Pipeline activity viewer for the O3 CPU model.
 
 import argparse
-import copy
+import io
 import os
+import struct
 import sys
+from bisect import bisect_left
+from concurrent.futures import ProcessPoolExecutor
+
 
 # Temporary storage for instructions. The queue is filled in out-of-order
 # until it reaches 'max_threshold' number of instructions. It is then
@@ -48,22 +52,117 @@ import sys
 # 'min_threshold'.
 # It is assumed that the instructions are not out of order for more then
 # 'min_threshold' places - otherwise they will appear out of order.
-insts = {
-    "queue": [],  # Instructions to print.
-    "max_threshold": 2000,  # Instructions are sorted out and printed when
-    # their number reaches this threshold.
-    "min_threshold": 1000,  # Printing stops when this number is reached.
-    "sn_start": 0,  # The first instruction seq. number to be printed.
-    "sn_stop": 0,  # The last instruction seq. number to be printed.
-    "tick_start": 0,  # The first tick to be printed
-    "tick_stop": 0,  # The last tick to be printed
-    "tick_drift": 2000,  # Used to calculate the start and the end of main
-    # loop. We assume here that the instructions are not
-    # out of order for more then 2000 CPU ticks,
-    # otherwise the print may not start/stop
-    # at the time specified by tick_start/stop.
-    "only_committed": 0,  # Set if only committed instructions are printed.
-}
+def new_insts():
+    return {
+        "queue": [],  # Instructions to print.
+        "max_threshold": 2000,  # Instructions are sorted out and printed
+        # when their number reaches this threshold.
+        "min_threshold": 1000,  # Printing stops when this number is reached.
+        "sn_start": 0,  # The first instruction seq. number to be printed.
+        "sn_stop": 0,  # The last instruction seq. number to be printed.
+        "tick_start": 0,  # The first tick to be printed
+        "tick_stop": 0,  # The last tick to be printed
+        "tick_drift": 2000,  # Used to calculate the start and the end of
+        # main loop. We assume here that the instructions are not
+        # out of order for more then 2000 CPU ticks,
+        # otherwise the print may not start/stop
+        # at the time specified by tick_start/stop.
+        "only_committed": 0,  # Set if only committed instructions are
+        # printed.
+    }
+
+
+# The sidecar index of a trace ('<trace>.idx') splits the trace into blocks
+# of INDEX_BLOCK fetched instructions. For every block it records the byte
+# offset of its first line, and the largest tick and fetch sequence number
+# seen up to the end of the block. The start of a tick or instruction range
+# is then found with a binary search, and only the block it falls into is
+# scanned.
+INDEX_MAGIC = b"O3PVIDX1"
+INDEX_BLOCK = 4096
+# magic, trace size, trace modification time, block size, number of blocks
+_index_header = struct.Struct("<8sQQQQ")
+# block offset, largest tick, largest sequence number
+_index_entry = struct.Struct("<QQQ")
+
+
+def index_path(tracefile):
+    return tracefile + ".idx"
+
+
+def build_index(tracefile, block=INDEX_BLOCK):
+    """Index tracefile and write the index next to it."""
+    entries = [[0, 0, 0]]
+    max_tick = max_sn = 0
+    fetched = 0
+    offset = 0
+    with open(tracefile, "rb") as trace:
+        for line in trace:
+            if line.startswith(b"O3PipeView:"):
+                fields = line.split(b":", 6)
+                if fields[1] == b"fetch":
+                    if fetched and fetched % block == 0:
+                        entries[-1][1:] = max_tick, max_sn
+                        entries.append([offset, 0, 0])
+                    fetched += 1
+                    max_sn = max(max_sn, int(fields[5]))
+                max_tick = max(max_tick, int(fields[2]))
+            offset += len(line)
+    entries[-1][1:] = max_tick, max_sn
+
+    stat = os.stat(tracefile)
+    with open(index_path(tracefile), "wb") as out:
+        out.write(
+            _index_header.pack(
+                INDEX_MAGIC,
+                stat.st_size,
+                stat.st_mtime_ns,
+                block,
+                len(entries),
+            )
+        )
+        for entry in entries:
+            out.write(_index_entry.pack(*entry))
+
+
+def load_index(tracefile):
+    """
+    Return the blocks of the index of tracefile, or None if there is no
+    index or if the trace has changed since it was indexed.
+    """
+    try:
+        with open(index_path(tracefile), "rb") as f:
+            data = f.read()
+    except OSError:
+        return None
+    if len(data) < _index_header.size:
+        return None
+    magic, size, mtime, _, count = _index_header.unpack_from(data)
+    stat = os.stat(tracefile)
+    if (
+        magic != INDEX_MAGIC
+        or size != stat.st_size
+        or mtime != stat.st_mtime_ns
+        or len(data) != _index_header.size + count * _index_entry.size
+    ):
+        return None
+    return list(_index_entry.iter_unpack(data[_index_header.size :]))
+
+
+def find_offset(index, start_tick, start_sn):
+    """
+    Return the offset of the block holding the first line of the range that
+    starts at start_tick or start_sn, or None if the range is past the end
+    of the trace.
+    """
+    if start_tick != 0:
+        key, start = 1, start_tick
+    elif start_sn != 0:
+        key, start = 2, start_sn
+    else:
+        return 0
+    pos = bisect_left([entry[key] for entry in index], start)
+    return index[pos][0] if pos < len(index) else None
 
 
 def process_trace(
@@ -80,8 +179,7 @@ def process_trace(
     start_sn,
     stop_sn,
 ):
-    global insts
-
+    insts = new_insts()
     insts["sn_start"] = start_sn
     insts["sn_stop"] = stop_sn
     insts["tick_start"] = start_tick
@@ -165,6 +263,7 @@ def process_trace(
                     and int(fields[5]) > (stop_sn + insts["max_threshold"])
                 ):
                     print_insts(
+                        insts,
                         outfile,
                         cycle_time,
                         width,
@@ -183,6 +282,7 @@ def process_trace(
                 if store_completions:
                     curr_inst[fields[3]] = int(fields[4])
                 queue_inst(
+                    insts,
                     outfile,
                     curr_inst,
                     cycle_time,
@@ -195,6 +295,7 @@ def process_trace(
         line = trace.readline()
         if not line:
             print_insts(
+                insts,
                 outfile,
                 cycle_time,
                 width,
@@ -210,13 +311,19 @@ def process_trace(
 # Puts new instruction into the print queue.
 # Sorts out and prints instructions when their number reaches threshold value
 def queue_inst(
-    outfile, inst, cycle_time, width, color, timestamps, store_completions
+    insts,
+    outfile,
+    inst,
+    cycle_time,
+    width,
+    color,
+    timestamps,
+    store_completions,
 ):
-    global insts
-    l_copy = copy.deepcopy(inst)
-    insts["queue"].append(l_copy)
+    insts["queue"].append(dict(inst))
     if len(insts["queue"]) > insts["max_threshold"]:
         print_insts(
+            insts,
             outfile,
             cycle_time,
             width,
@@ -229,6 +336,7 @@ def queue_inst(
 
 # Sorts out and prints instructions in print queue
 def print_insts(
+    insts,
     outfile,
     cycle_time,
     width,
@@ -237,11 +345,13 @@ def print_insts(
     store_completions,
     lower_threshold,
 ):
-    global insts
     # sort the list of insts by sequence numbers
-    insts["queue"].sort(key=lambda inst: inst["sn"])
-    while len(insts["queue"]) > lower_threshold:
-        print_item = insts["queue"].pop(0)
+    queue = insts["queue"]
+    queue.sort(key=lambda inst: inst["sn"])
+    count = max(len(queue) - lower_threshold, 0)
+    to_print = queue[:count]
+    del queue[:count]
+    for print_item in to_print:
         # As the instructions are processed out of order the main loop starts
         # earlier then specified by start_sn/tick and finishes later then what
         # is defined in stop_sn/tick.
@@ -443,6 +553,33 @@ def validate_range(my_range):
     return my_range
 
 
+def validate_ranges(ranges):
+    ranges = [validate_range(r) for r in ranges.split(",")]
+    return None if None in ranges else ranges
+
+
+def run_range(tracefile, outfile, index, tick_range, inst_range, options):
+    """
+    Write the pipeline view of one tick and instruction range of tracefile
+    to outfile, seeking to the start of the range if the trace is indexed.
+    """
+    with open(tracefile, "rb") as raw:
+        if index is not None:
+            offset = find_offset(index, tick_range[0], inst_range[0])
+            if offset is None:
+                raw.seek(0, os.SEEK_END)
+            else:
+                raw.seek(offset)
+        with io.TextIOWrapper(raw) as trace, open(outfile, "w") as out:
+            process_trace(
+                trace,
+                out,
+                *options,
+                *(tick_range + inst_range),
+            )
+    return outfile
+
+
 def main():
     # Parse args
     usage = "%(prog)s [OPTION]... TRACE_FILE"
@@ -453,16 +590,21 @@ def main():
         "-o",
         dest="outfile",
         default=os.path.join(os.getcwd(), "o3-pipeview.out"),
-        help="output file",
+        help="output file (with several ranges, the output of range N goes "
+        "to OUTFILE.N)",
     )
     parser.add_argument(
-        "-t", dest="tick_range", default="0:-1", help="tick range (-1 == inf.)"
+        "-t",
+        dest="tick_range",
+        default="0:-1",
+        help="tick range (-1 == inf.), or a comma-separated list of ranges",
     )
     parser.add_argument(
         "-i",
         dest="inst_range",
         default="0:-1",
-        help="instruction range (-1 == inf.)",
+        help="instruction range (-1 == inf.), or a comma-separated list of "
+        "ranges",
     )
     parser.add_argument(
         "-w", dest="width", type=int, default=80, help="timeline width"
@@ -498,32 +640,72 @@ def main():
         default=False,
         help="additionally display store completion ticks",
     )
+    parser.add_argument(
+        "--index",
+        action="store_true",
+        default=False,
+        help="index the trace (TRACE_FILE.idx) if it has no up to date "
+        "index. An up to date index is always used when present.",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="number of ranges processed in parallel",
+    )
     parser.add_argument("tracefile")
 
     args = parser.parse_args()
-    tick_range = validate_range(args.tick_range)
-    if not tick_range:
+    tick_ranges = validate_ranges(args.tick_range)
+    if not tick_ranges:
         parser.error("invalid range")
         sys.exit(1)
-    inst_range = validate_range(args.inst_range)
-    if not inst_range:
+    inst_ranges = validate_ranges(args.inst_range)
+    if not inst_ranges:
         parser.error("invalid range")
         sys.exit(1)
+    if len(tick_ranges) == 1:
+        tick_ranges *= len(inst_ranges)
+    elif len(inst_ranges) == 1:
+        inst_ranges *= len(tick_ranges)
+    if len(tick_ranges) != len(inst_ranges):
+        parser.error("tick and instruction range lists differ in length")
+
+    index = load_index(args.tracefile)
+    if index is None and args.index:
+        print("Indexing trace... ", end=" ")
+        build_index(args.tracefile)
+        index = load_index(args.tracefile)
+        print("done!")
+
+    if len(tick_ranges) == 1:
+        outfiles = [args.outfile]
+    else:
+        outfiles = [f"{args.outfile}.{n}" for n in range(len(tick_ranges))]
+    options = (
+        args.cycle_time,
+        args.width,
+        args.color,
+        args.timestamps,
+        args.only_committed,
+        args.store_completions,
+    )
+
     # Process trace
     print("Processing trace... ", end=" ")
-    with open(args.tracefile) as trace:
-        with open(args.outfile, "w") as out:
-            process_trace(
-                trace,
-                out,
-                args.cycle_time,
-                args.width,
-                args.color,
-                args.timestamps,
-                args.only_committed,
-                args.store_completions,
-                *(tick_range + inst_range),
-            )
+    jobs = [
+        (args.tracefile, outfile, index, tick_range, inst_range, options)
+        for outfile, tick_range, inst_range in zip(
+            outfiles, tick_ranges, inst_ranges
+        )
+    ]
+    if args.jobs > 1 and len(jobs) > 1:
+        with ProcessPoolExecutor(max_workers=args.jobs) as pool:
+            list(pool.map(run_range, *zip(*jobs)))
+    else:
+        for job in jobs:
+            run_range(*job)
     print("done!")
 
 
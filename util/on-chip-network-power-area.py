@@ -26,11 +26,16 @@
 
 
 import os
-import string
-import subprocess
 import sys
 from configparser import ConfigParser
 
+sys.path.append(
+    os.path.join(
+        os.path.dirname(os.path.abspath(__file__)), "..", "src", "python"
+    )
+)
+from m5.ext.pystats.textstats import TextStatsReader
+
 # Compile DSENT to generate the Python module and then import it.
 # This script assumes it is executed from the gem5 root.
 print("Attempting compilation")
@@ -189,23 +194,16 @@ def parseStats(
     # Open the stats.txt file and parse it to for the required numbers
     # and the number of routers.
     try:
-        stats_handle = open(stats_file)
-        stats_handle.close()
+        stats = TextStatsReader(stats_file)
     except OSError:
         print("Failed to open ", stats_file, " for reading")
         exit(-1)
 
-    # Now parse the stats
-    pattern = "sim_seconds"
-    lines = string.split(
-        subprocess.check_output(["grep", pattern, stats_file]), "\n", -1
-    )
-    assert len(lines) >= 1
-
-    ## Assume that the first line is the one required
-    [l1, l2, l3] = lines[0].partition(" ")
-    l4 = l3.strip().partition(" ")
-    simulation_length_in_seconds = float(l4[0])
+    # Now parse the stats. Assume that the first dump is the one required.
+    with stats:
+        name = "simSeconds" if "simSeconds" in stats else "sim_seconds"
+        simulation_length_in_seconds = stats.values(name)[0]
+    assert simulation_length_in_seconds is not None
 
     # Initialize DSENT with a configuration file
     dsent.initialize(router_config_file)
@@ -37,11 +37,23 @@ import matplotlib
 
 matplotlib.use("Agg")
 import os
+import sys
 
 import matplotlib.pyplot as plt
 import numpy as np
 from matplotlib.font_manager import FontProperties
 
+sys.path.append(
+    os.path.join(
+        os.path.dirname(os.path.abspath(__file__)),
+        "..",
+        "..",
+        "src",
+        "python",
+    )
+)
+from m5.ext.pystats.textstats import TextStatsReader
+
 # global results dict
 results = {}
 idleResults = {}
@@ -128,8 +140,6 @@ def plotLowPStates(
     @param delay_list: list of itt max multipliers (e.g. [1, 20, 200])
 
     """
-    stats_file = open(stats_fname)
-
     global bankUtilValues
     bankUtilValues = bank_util_list
 
@@ -140,59 +150,46 @@ def plotLowPStates(
     delayValues = delay_list
     initResults()
 
-    # throw away the first two lines of the stats file
-    stats_file.readline()
-    stats_file.readline()  # the 'Begin' line
-
     #######################################
     # Parse stats file and gather results
     ########################################
 
-    for delay in delayValues:
-        for bank_util in bankUtilValues:
-            for seq_bytes in seqBytesValues:
-                for line in stats_file:
-                    if "Begin" in line:
-                        break
-
-                    if len(line.strip()) == 0:
-                        continue
-
-                    #### state time values ####
-                    if "system.mem_ctrls_0.memoryStateTime" in line:
-                        # remove leading and trailing white spaces
-                        line = line.strip()
-                        # Example format:
-                        # 'system.mem_ctrls_0.memoryStateTime::ACT    1000000'
-                        statistic, stime = line.split()[0:2]
-                        # Now grab the state, i.e. 'ACT'
-                        state = statistic.split("::")[1]
-                        # store the value of the stat in the results dict
-                        results[delay][bank_util][seq_bytes][state] = int(
-                            stime
-                        )
-                    #### state energy values ####
-                    elif line.strip().split()[0] in list(StatToKey.keys()):
-                        # Example format:
-                        # system.mem_ctrls_0.actEnergy                 35392980
-                        statistic, e_val = line.strip().split()[0:2]
-                        senergy = int(float(e_val))
-                        state = StatToKey[statistic]
-                        # store the value of the stat in the results dict
-                        results[delay][bank_util][seq_bytes][state] = senergy
-
-    # To add last traffic gen idle period stats to the results dict
-    for line in stats_file:
-        if "system.mem_ctrls_0.memoryStateTime" in line:
-            line = line.strip()  # remove leading and trailing white spaces
-            # Example format:
-            # 'system.mem_ctrls_0.memoryStateTime::ACT    1000000'
-            statistic, stime = line.split()[0:2]
-            # Now grab the state energy, .e.g 'ACT'
-            state = statistic.split("::")[1]
-            idleResults[state] = int(stime)
-            if state == "ACT_PDN":
-                break
+    # There is one stats dump per combination of the swept values, in
+    # sweep order, followed by a dump for the last traffic gen idle period
+    sweep = [
+        (delay, bank_util, seq_bytes)
+        for delay in delayValues
+        for bank_util in bankUtilValues
+        for seq_bytes in seqBytesValues
+    ]
+
+    with TextStatsReader(stats_fname) as stats_file:
+        #### state time values ####
+        # Example format:
+        # 'system.mem_ctrls_0.memoryStateTime::ACT    1000000'
+        for dump, stat in stats_file.find(
+            r"^system\.mem_ctrls_0\.memoryStateTime::"
+        ):
+            # Now grab the state, i.e. 'ACT'
+            state = stat.name.split("::")[1]
+            if dump < len(sweep):
+                delay, bank_util, seq_bytes = sweep[dump]
+                # store the value of the stat in the results dict
+                results[delay][bank_util][seq_bytes][state] = int(stat.value)
+            elif dump == len(sweep):
+                # the last traffic gen idle period
+                idleResults[state] = int(stat.value)
+
+        #### state energy values ####
+        # Example format:
+        # system.mem_ctrls_0.actEnergy                 35392980
+        for statistic, state in StatToKey.items():
+            if statistic not in stats_file:
+                continue
+            values = stats_file.values(statistic)
+            for (delay, bank_util, seq_bytes), senergy in zip(sweep, values):
+                if senergy is not None:
+                    results[delay][bank_util][seq_bytes][state] = int(senergy)
 
     ########################################
     # Call plot functions
@@ -43,9 +43,21 @@ except ImportError:
     print("Failed to import matplotlib and numpy")
     exit(-1)
 
+import os
 import re
 import sys
 
+sys.path.append(
+    os.path.join(
+        os.path.dirname(os.path.abspath(__file__)),
+        "..",
+        "..",
+        "src",
+        "python",
+    )
+)
+from m5.ext.pystats.textstats import TextStatsReader
+
 
 # This script is intended to post process and plot the output from
 # running configs/dram/lat_mem_rd.py, as such it parses the simout.txt and
@@ -56,7 +68,7 @@ def main():
         exit(-1)
 
     try:
-        stats = open(sys.argv[1] + "/stats.txt")
+        stats = TextStatsReader(sys.argv[1] + "/stats.txt")
     except OSError:
         print("Failed to open ", sys.argv[1] + "/stats.txt", " for reading")
         exit(-1)
@@ -91,11 +103,9 @@ def main():
     # Now parse the stats
     raw_rd_lat = []
 
-    for line in stats:
-        match = re.match(r".*readLatencyHist::mean\s+(.+)\s+#.*", line)
-        if match:
-            raw_rd_lat.append(float(match.groups(0)[0]) / 1000)
-    stats.close()
+    with stats:
+        for _, stat in stats.find(r"readLatencyHist::mean$"):
+            raw_rd_lat.append(stat.value / 1000)
 
     # The stats also contain the warming, so filter the latency stats
     i = 0
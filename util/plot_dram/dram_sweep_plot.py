@@ -44,9 +44,21 @@ except ImportError:
     print("Failed to import matplotlib and numpy")
     exit(-1)
 
+import os
 import re
 import sys
 
+sys.path.append(
+    os.path.join(
+        os.path.dirname(os.path.abspath(__file__)),
+        "..",
+        "..",
+        "src",
+        "python",
+    )
+)
+from m5.ext.pystats.textstats import TextStatsReader
+
 
 # Determine the parameters of the sweep from the simout output, and
 # then parse the stats and plot the 3D surface corresponding to the
@@ -73,7 +85,7 @@ def main():
     mode = sys.argv[1][1]
 
     try:
-        stats = open(sys.argv[2] + "/stats.txt")
+        stats = TextStatsReader(sys.argv[2] + "/stats.txt")
     except OSError:
         print("Failed to open ", sys.argv[2] + "/stats.txt", " for reading")
         exit(-1)
@@ -112,19 +124,15 @@ def main():
     bus_util = []
     avg_pwr = []
 
-    for line in stats:
-        match = re.match(r".*busUtil\s+(\d+\.\d+)\s+#.*", line)
-        if match:
-            bus_util.append(float(match.groups(0)[0]))
+    with stats:
+        for _, stat in stats.find(r"busUtil$"):
+            bus_util.append(stat.value)
 
-        match = re.match(r".*peakBW\s+(\d+\.\d+)\s+#.*", line)
-        if match:
-            peak_bw.append(float(match.groups(0)[0]))
+        for _, stat in stats.find(r"peakBW$"):
+            peak_bw.append(stat.value)
 
-        match = re.match(r".*averagePower\s+(\d+\.?\d*)\s+#.*", line)
-        if match:
-            avg_pwr.append(float(match.groups(0)[0]))
-    stats.close()
+        for _, stat in stats.find(r"averagePower$"):
+            avg_pwr.append(stat.value)
 
     # Sanity check
     if not (len(peak_bw) == len(bus_util) and len(bus_util) == len(avg_pwr)):
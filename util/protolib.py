@@ -71,6 +71,12 @@
 import gzip
 import struct
 
+try:
+    from google.protobuf.message import DecodeError
+except ImportError:
+    # Messages can only be decoded with protobuf installed
+    DecodeError = OSError
+
 
 def openFileRd(in_file):
     """
@@ -144,6 +150,147 @@ def decodeMessage(in_file, message):
         return False
 
 
+class TraceReader:
+    """
+    A streaming reader for gem5 protobuf traces. These consist of a magic
+    number, followed by a sequence of messages, each prepended with its size
+    as a varint. Unlike decodeMessage, which reads the size one byte at a
+    time from the (possibly gzipped) file, the reader fetches large chunks
+    of the file into a buffer and decodes from memory. Memory use is bounded
+    by the buffer size, regardless of the size of the trace.
+    """
+
+    def __init__(self, in_file, buffer_size=1 << 22):
+        """
+        in_file: A file object, as returned by openFileRd.
+        buffer_size: The number of bytes read from the file at a time.
+        """
+        self._file = in_file
+        self._buffer_size = buffer_size
+        self._buf = bytearray()
+        self._pos = 0
+
+    def _fill(self, need):
+        """
+        Make sure at least need bytes are buffered past the current
+        position. Return False if the end of the file is reached first.
+        """
+        while len(self._buf) - self._pos < need:
+            try:
+                data = self._file.read(max(self._buffer_size, need))
+            except (OSError, EOFError):
+                # A corrupt or truncated gzip file
+                return False
+            if not data:
+                return False
+            if self._pos:
+                del self._buf[: self._pos]
+                self._pos = 0
+            self._buf += data
+        return True
+
+    def read(self, size):
+        """
+        Read size raw bytes from the trace, e.g., the magic number.
+        """
+        self._fill(size)
+        data = bytes(self._buf[self._pos : self._pos + size])
+        self._pos += len(data)
+        return data
+
+    def readRaw(self):
+        """
+        Return the serialized bytes of the next message, or None if no
+        message could be read, i.e., the end of the trace is reached, or
+        the trace is truncated or malformed.
+        """
+        size = 0
+        shift = 0
+        while True:
+            if self._pos >= len(self._buf) and not self._fill(1):
+                return None
+            b = self._buf[self._pos]
+            self._pos += 1
+            size |= (b & 0x7F) << shift
+            if not (b & 0x80):
+                break
+            shift += 7
+            if shift >= 64:
+                # Too many bytes when decoding the varint
+                return None
+
+        if size == 0 or not self._fill(size):
+            return None
+        data = bytes(self._buf[self._pos : self._pos + size])
+        self._pos += size
+        return data
+
+    def readMessage(self, message):
+        """
+        Decode the next message into message. Return False if no message
+        could be read.
+        """
+        data = self.readRaw()
+        if data is None:
+            return False
+        try:
+            message.ParseFromString(data)
+        except DecodeError:
+            return False
+        return True
+
+    def messages(self, message):
+        """
+        Generator decoding every remaining message into message, which is
+        reused and yielded for each message in the trace.
+        """
+        while self.readMessage(message):
+            yield message
+
+    def packetBatches(self, packet, batch_size=1 << 16):
+        """
+        Generator decoding the remaining messages of a packet trace into
+        NumPy structured arrays of at most batch_size packets, using the
+        PACKET_DTYPE layout. Optional fields which are not set are zero.
+        Requires NumPy.
+
+        packet: A packet_pb2.Packet used to decode each message.
+        """
+        import numpy as np
+
+        fields = [name for name, _ in PACKET_DTYPE]
+        while True:
+            columns = {name: [] for name in fields}
+            appends = [(name, columns[name].append) for name in fields]
+            count = 0
+            while count < batch_size and self.readMessage(packet):
+                for name, append in appends:
+                    append(getattr(packet, name))
+                count += 1
+            if not count:
+                return
+            batch = np.empty(count, dtype=PACKET_DTYPE)
+            for name in fields:
+                batch[name] = columns[name]
+            yield batch
+            if count < batch_size:
+                return
+
+
+# The layout of the NumPy structured arrays produced by
+# TraceReader.packetBatches. The fields mirror the Packet message in
+# src/proto/packet.proto.
+PACKET_DTYPE = [
+    ("cmd", "<u4"),
+    ("addr", "<u8"),
+    ("size", "<u4"),
+    ("flags", "<u4"),
+    ("tick", "<u8"),
+    ("pc", "<u8"),
+    ("pkt_id", "<u8"),
+]
+
+
 def _EncodeVarint32(out_file, value):
     """
     The encoding of the Varint32 is copied from
@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+
+# Copyright (c) 2026 The Regents of The University of California
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are
+# met: redistributions of source code must retain the above copyright
+# notice, this list of conditions and the following disclaimer;
+# redistributions in binary form must reproduce the above copyright
+# notice, this list of conditions and the following disclaimer in the
+# documentation and/or other materials provided with the distribution;
+# neither the name of the copyright holders nor the names of its
+# contributors may be used to endorse or promote products derived from
+# this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR
+# A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT
+# OWNER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL,
+# SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT
+# LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE,
+# DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY
+# THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+# OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+# Compare the two ways SLICC can dispatch the transitions of a controller:
+# a switch statement with a case for every transition (the default), and
+# tables shared by all transitions (SLICC_TRANSITION_TABLE).
+#
+# The code command generates a protocol both ways and compares the size of
+# the generated transition code. Given a compiler command, it also compares
+# the time to compile it and the size of the objects, e.g.:
+#
+#   slicc-transition-bench.py code src/mem/ruby/protocol/chi/CHI.slicc \
+#       --cxx "g++ -std=c++17 -O3 -DTRACING_ON=1 -Isrc -Ibuild/ALL"
+#
+# The run command compares the host time of a Ruby random test on two gem5
+# binaries built with the same protocol, one in each mode, and checks that
+# they simulate the same number of ticks:
+#
+#   slicc-transition-bench.py run build/switch/gem5.opt build/table/gem5.opt
+
+import argparse
+import os
+import shlex
+import subprocess
+import sys
+import tempfile
+import time
+
+root = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+
+MODES = ("switch", "table")
+
+
+def generate(protocol, out_dir, transition_table):
+    """
+    Generate the code of protocol into out_dir and return the number of
+    transitions and the path of the transition code of every controller.
+    """
+    from slicc.parser import SLICC
+    from slicc.symbols.StateMachine import StateMachine
+
+    protocol_base = os.path.join(root, "src", "mem", "ruby", "protocol")
+    slicc = SLICC(
+        protocol,
+        [os.path.join(protocol_base, "RubySlicc_interfaces.slicc")],
+        protocol_base,
+        transition_table=transition_table,
+    )
+    slicc.process()
+    code_dir = os.path.join(out_dir, "mem", "ruby", "protocol")
+    slicc.writeCodeFiles(code_dir, [])
+    return {
+        machine.ident: (
+            len(machine.transitions),
+            os.path.join(
+                code_dir, slicc.protocol, f"{machine.ident}_Transitions.cc"
+            ),
+        )
+        for machine in slicc.symtab.getAllType(StateMachine)
+    }
+
+
+def compile_time(cxx, source, include_dir):
+    obj = os.path.splitext(source)[0] + ".o"
+    start = time.perf_counter()
+    subprocess.run(
+        shlex.split(cxx) + [f"-I{include_dir}", "-c", source, "-o", obj],
+        check=True,
+    )
+    return time.perf_counter() - start, os.path.getsize(obj)
+
+
+def do_code(args):
+    from grammar import Grammar
+
+    with tempfile.TemporaryDirectory() as tmp:
+        Grammar.tables_dir = tmp
+        results = {}
+        for mode in MODES:
+            out_dir = os.path.join(tmp, mode)
+            for machine, (transitions, source) in generate(
+                args.protocol, out_dir, mode == "table"
+            ).items():
+                with open(source) as f:
+                    lines = sum(1 for line in f)
+                result = [transitions, lines, os.path.getsize(source)]
+                if args.cxx:
+                    result += compile_time(args.cxx, source, out_dir)
+                results.setdefault(machine, {})[mode] = result
+
+    header = f"{'controller':<16} {'mode':<8} {'trans':>6} {'lines':>7}"
+    header += f" {'bytes':>9}"
+    if args.cxx:
+        header += f" {'compile':>9} {'object':>9}"
+    print(header)
+    for machine, modes in sorted(results.items()):
+        for mode in MODES:
+            transitions, lines, size, *compiled = modes[mode]
+            row = f"{machine:<16} {mode:<8} {transitions:>6} {lines:>7}"
+            row += f" {size:>9}"
+            if compiled:
+                seconds, obj = compiled
+                row += f" {seconds:>8.2f}s {obj:>9}"
+            print(row)
+
+
+def simulate(gem5, out_dir, args):
+    subprocess.run(
+        [
+            gem5,
+            f"--outdir={out_dir}",
+            os.path.join(root, "configs", "example", "ruby_random_test.py"),
+            f"--maxloads={args.maxloads}",
+        ],
+        check=True,
+        stdout=subprocess.DEVNULL,
+    )
+    with TextStatsReader(
+        os.path.join(out_dir, "stats.txt"), persist_index=False
+    ) as stats:
+        return stats.values("hostSeconds")[-1], stats.values("simTicks")[-1]
+
+
+def do_run(args):
+    best = {}
+    ticks = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        for i in range(args.repeat):
+            for mode, gem5 in zip(MODES, (args.switch_gem5, args.table_gem5)):
+                seconds, ticks[mode] = simulate(
+                    gem5, os.path.join(tmp, f"{mode}{i}"), args
+                )
+                best[mode] = min(seconds, best.get(mode, seconds))
+
+    for mode in MODES:
+        print(f"{mode:<8} {best[mode]:>8.3f}s {ticks[mode]:>16.0f} ticks")
+    print(f"speedup  {best['switch'] / best['table']:>8.3f}")
+    if ticks["switch"] != ticks["table"]:
+        print("The two binaries simulated a different number of ticks")
+        return 1
+    return 0
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Compare switch and table transition dispatch of "
+        "SLICC generated controllers."
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    command = commands.add_parser(
+        "code", help="Compare the generated transition code"
+    )
+    command.add_argument("protocol", help="The protocol's .slicc file")
+    command.add_argument(
+        "--cxx",
+        help="Compiler command, with the flags and include paths needed to "
+        "compile the transition code of the protocol",
+    )
+    command.set_defaults(func=do_code)
+
+    command = commands.add_parser(
+        "run", help="Compare the host time of a Ruby random test"
+    )
+    command.add_argument("switch_gem5", help="gem5 built in switch mode")
+    command.add_argument("table_gem5", help="gem5 built in table mode")
+    command.add_argument("--maxloads", type=int, default=100000)
+    command.add_argument(
+        "--repeat",
+        type=int,
+        default=3,
+        help="Number of runs of each binary, the fastest is reported",
+    )
+    command.set_defaults(func=do_run)
+
+    args = parser.parse_args()
+    sys.exit(args.func(args))
+
+
+if __name__ == "__main__":
+    sys.path[1:1] = [
+        os.path.join(root, "src", "mem"),
+        os.path.join(root, "build_tools"),
+        os.path.join(root, "ext", "ply"),
+        os.path.join(root, "src", "python"),
+    ]
+    from m5.ext.pystats.textstats import TextStatsReader
+
+    main()